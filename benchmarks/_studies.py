@@ -0,0 +1,156 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides the parametric studies used by the benchmarks."""
+from __future__ import annotations
+
+import pathlib
+import shutil
+
+from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
+import numpy as np
+import pandas as pd
+
+# Study files shipped with the repository.
+REPO_ROOT = pathlib.Path(__file__).parent.parent
+FIXTURES = ["porosity-study.ps", "single-bead-study.ps", "microstructure-study.ps"]
+
+# Number of laser power and scan speed values in each slice of a synthetic study.
+GRID_SIZE = 20
+
+# Values of the slice parameters, as (first value, step).
+_PARAMETERS = {
+    ColumnNames.HEATER_TEMPERATURE: (80, 20),
+    ColumnNames.LAYER_THICKNESS: (3e-5, 1e-5),
+    ColumnNames.BEAM_DIAMETER: (8e-5, 1e-5),
+    ColumnNames.START_ANGLE: (0, 15),
+    ColumnNames.ROTATION_ANGLE: (45, 22.5),
+    ColumnNames.HATCH_SPACING: (1e-4, 1e-5),
+    ColumnNames.STRIPE_WIDTH: (0.01, 0.01),
+}
+
+
+def fixture_study(name: str, directory: pathlib.Path) -> ParametricStudy:
+    """Load a copy of a study file shipped with the repository.
+
+    Loading a study upgrades its file, so the file is copied first.
+    """
+    path = pathlib.Path(directory) / name
+    shutil.copy(REPO_ROOT / name, path)
+    return ParametricStudy.load(path)
+
+
+def synthetic_study(rows: int, directory: pathlib.Path, seed: int = 0) -> ParametricStudy:
+    """Create a study of completed, pending, and failed simulations.
+
+    The rows are split evenly between single bead, porosity, and
+    microstructure simulations. Each slice of the study holds a
+    ``GRID_SIZE`` by ``GRID_SIZE`` grid of laser powers and scan speeds.
+
+    Parameters
+    ----------
+    rows : int
+        Number of simulations in the study.
+    directory : pathlib.Path
+        Directory to create the study file in.
+    seed : int, default: 0
+        Seed of the random results.
+
+    Returns
+    -------
+    ParametricStudy
+        Synthetic study. It is not saved to its file.
+    """
+    rng = np.random.default_rng(seed)
+    types = [SimulationType.SINGLE_BEAD, SimulationType.POROSITY, SimulationType.MICROSTRUCTURE]
+    counts = [rows // 3 + (1 if i < rows % 3 else 0) for i in range(3)]
+    frames = [__simulations(t, n, rng) for t, n in zip(types, counts)]
+
+    study = ParametricStudy._new(pathlib.Path(directory) / f"synthetic-{rows}.ps", "IN718")
+    columns = study.data_frame().columns
+    # The study API adds simulations one row at a time, which does not scale
+    # to the sizes benchmarked, so the data frame is set directly.
+    study._data_frame = pd.concat(frames, ignore_index=True).reindex(columns=columns)
+    return study
+
+
+def __simulations(simulation_type: SimulationType, rows: int, rng: np.random.Generator):
+    i = np.arange(rows)
+    point, slice = i % GRID_SIZE**2, i // GRID_SIZE**2
+    power = 50 + 25 * (point // GRID_SIZE)
+    speed = 0.35 + 0.1 * (point % GRID_SIZE)
+    statuses = [SimulationStatus.COMPLETED, SimulationStatus.PENDING, SimulationStatus.ERROR]
+    status = pd.Series(
+        rng.choice(np.array(statuses, dtype=object), size=rows, p=[0.9, 0.05, 0.05]), dtype=object
+    )
+    prefix = {
+        SimulationType.SINGLE_BEAD: "sb",
+        SimulationType.POROSITY: "por",
+        SimulationType.MICROSTRUCTURE: "micro",
+    }[simulation_type]
+    df = pd.DataFrame(
+        {
+            ColumnNames.ITERATION: 1,
+            ColumnNames.PRIORITY: 1,
+            # Studies keep the enumerations and strings in object columns.
+            ColumnNames.TYPE: pd.Series([simulation_type] * rows, dtype=object),
+            ColumnNames.ID: pd.Series([f"{prefix}_{n}" for n in i], dtype=object),
+            ColumnNames.STATUS: status,
+            ColumnNames.MATERIAL: pd.Series(["IN718"] * rows, dtype=object),
+            ColumnNames.LASER_POWER: power,
+            ColumnNames.SCAN_SPEED: speed,
+        }
+    )
+
+    # Single bead slices only vary the first three parameters.
+    parameters = list(_PARAMETERS)
+    if simulation_type == SimulationType.SINGLE_BEAD:
+        parameters = parameters[:3]
+    base = 10 if simulation_type == SimulationType.SINGLE_BEAD else 3
+    for n, column in enumerate(parameters):
+        first, step = _PARAMETERS[column]
+        df[column] = first + step * ((slice // base**n) % base)
+
+    if simulation_type == SimulationType.SINGLE_BEAD:
+        results = {
+            ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH: rng.uniform(0.5, 3.0, rows),
+            ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH: rng.uniform(0.1, 1.0, rows),
+        }
+    elif simulation_type == SimulationType.POROSITY:
+        df[ColumnNames.BUILD_RATE] = (
+            df[ColumnNames.LAYER_THICKNESS] * speed * df[ColumnNames.HATCH_SPACING]
+        )
+        results = {ColumnNames.RELATIVE_DENSITY: rng.uniform(0.9, 1.0, rows)}
+    else:
+        results = {
+            column: rng.uniform(5, 50, rows)
+            for column in [
+                ColumnNames.XY_AVERAGE_GRAIN_SIZE,
+                ColumnNames.XZ_AVERAGE_GRAIN_SIZE,
+                ColumnNames.YZ_AVERAGE_GRAIN_SIZE,
+            ]
+        }
+    # Only completed simulations have results.
+    completed = (status == SimulationStatus.COMPLETED).to_numpy()
+    for column, values in results.items():
+        df[column] = np.where(completed, values, np.nan)
+    return df
@@ -0,0 +1,268 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the display widgets on synthetic and real parametric studies.
+
+For each study and display function, the benchmark times the preparation of
+the plotted data frame, the slice index, the selection of a slice, the grid
+building, the figure construction, the faceted figure construction, and the
+construction of the whole widget.
+It also records the size of the serialized figure, or of the table page sent
+to the browser.
+
+Results are written as JSON, one record per study, function, and phase, so
+that runs of different releases can be compared.
+
+Usage::
+
+    python benchmarks/bench_display.py [--rows 1000 10000 ...] [--output FILE]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
+import numpy as np
+import panel as pn
+
+from ansys.additive.widgets import __version__
+from ansys.additive.widgets.display import StudySnapshot, figure_cache
+from ansys.additive.widgets.display._grid import _grid
+from ansys.additive.widgets.display._slice_index import _PARAMETER_COLUMNS, _SliceIndex
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+from _studies import FIXTURES, fixture_study, synthetic_study  # noqa: E402
+
+DEFAULT_ROWS = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def __single_bead_figure(figure: Callable, index, key: tuple):
+    poi = ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH
+    return figure(index, *key[:3], poi, (0.3, 0.6))
+
+
+def __porosity_eval_figure(figure: Callable, index, key: tuple):
+    return figure(index, *key, (0.85, 1.0))
+
+
+def __porosity_contour_figure(figure: Callable, index, key: tuple):
+    return figure(index, *key, True, True)
+
+
+def __ave_grain_size_figure(figure: Callable, index, key: tuple):
+    columns = [
+        ColumnNames.XY_AVERAGE_GRAIN_SIZE,
+        ColumnNames.XZ_AVERAGE_GRAIN_SIZE,
+        ColumnNames.YZ_AVERAGE_GRAIN_SIZE,
+    ]
+    values = index.frame[columns].to_numpy(float)
+    return figure(index, (np.nanmin(values), np.nanmax(values)), *key)
+
+
+# Plots, with the columns of their slices, the grid values, and how to call
+# their figure function for a slice.
+PLOTS = {
+    "single_bead_eval_plot": (
+        _PARAMETER_COLUMNS[:3],
+        [ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH],
+        __single_bead_figure,
+    ),
+    "porosity_eval_plot": (
+        _PARAMETER_COLUMNS,
+        [ColumnNames.RELATIVE_DENSITY],
+        __porosity_eval_figure,
+    ),
+    "porosity_contour_plot": (
+        _PARAMETER_COLUMNS,
+        [ColumnNames.BUILD_RATE, ColumnNames.RELATIVE_DENSITY],
+        __porosity_contour_figure,
+    ),
+    "ave_grain_size_plot": (_PARAMETER_COLUMNS, None, __ave_grain_size_figure),
+}
+
+
+def __single_bead_facets(figure: Callable, index, key: tuple):
+    poi = ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH
+    return figure(index, key[:3], *FACETS, poi, (0.3, 0.6))
+
+
+def __porosity_contour_facets(figure: Callable, index, key: tuple):
+    return figure(index, key, *FACETS, True, True)
+
+
+# Parameters faceted into rows and columns of subplots, and how to call the
+# faceted figure function of the plots that have one.
+FACETS = (ColumnNames.LAYER_THICKNESS, ColumnNames.HEATER_TEMPERATURE)
+FACET_PLOTS = {
+    "single_bead_eval_plot": __single_bead_facets,
+    "porosity_contour_plot": __porosity_contour_facets,
+}
+
+
+def measure(func: Callable, repeat: int, teardown: Callable | None = None) -> tuple[float, object]:
+    """Get the median time of several calls and the result of the last call.
+
+    ``teardown`` is called with the result of each call, outside of the
+    timed section, and the result is then collected so that calls do not
+    accumulate memory. ``None`` is returned as the result in that case.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+        if teardown is not None:
+            teardown(result)
+            result = None
+            gc.collect()
+    return statistics.median(times), result
+
+
+def __render(widget: pn.viewable.Viewable) -> tuple:
+    return widget, widget.get_root()
+
+
+def __release(rendered: tuple):
+    # Panel registers every root it renders, which keeps the widget and so its
+    # snapshot alive; drop it the way Panel does when a server session ends.
+    widget, root = rendered
+    widget._cleanup(root)
+    pn.state._views.pop(root.ref["id"], None)
+
+
+def bench_plot(name: str, study: ParametricStudy, repeat: int) -> dict:
+    """Time the phases of a plot for the largest slice of a study."""
+    module = importlib.import_module(f"ansys.additive.widgets.display.{name}")
+    data_frame = getattr(module, "__data_frame")
+    figure = getattr(module, "__figure")
+    columns, grid_columns, plot_figure = PLOTS[name]
+
+    results = {}
+    try:
+        results["data_frame"], df = measure(lambda: data_frame(StudySnapshot(study)), repeat)
+    except ValueError as e:
+        # The study has too few simulations for the plot.
+        return {"skipped": str(e)}
+    if df.empty:
+        return {"skipped": "The study has no simulations for the plot."}
+    results["slice_index"], index = measure(lambda: _SliceIndex(df, columns), repeat)
+    key = tuple(df.groupby(columns, dropna=False, sort=False).size().idxmax())
+    results["slice"], rows = measure(lambda: index.take(*key), repeat)
+    results["slice_rows"] = len(rows)
+    if grid_columns is not None:
+        results["grid"], _ = measure(lambda: _grid(rows, grid_columns), repeat)
+    results["figure"], fig = measure(lambda: plot_figure(figure, index, key), repeat)
+    results["figure_json_bytes"] = len(fig.to_json())
+    if name in FACET_PLOTS:
+        facet_figure = getattr(module, "__facet_figure")
+        # The grids of the subplots are cached by the index after the first call.
+        results["facet_figure"], fig = measure(
+            lambda: FACET_PLOTS[name](facet_figure, index, key), repeat
+        )
+        results["facets"] = len({trace.xaxis for trace in fig.data})
+
+    def widget():
+        figure_cache.clear()
+        return __render(getattr(module, name)(StudySnapshot(study)))
+
+    results["widget"], _ = measure(widget, repeat, __release)
+    return results
+
+
+def bench_table(study: ParametricStudy, repeat: int) -> dict:
+    """Time the construction of the study table."""
+    from ansys.additive.widgets.display import show_table
+
+    results = {}
+    results["data_frame"], _ = measure(lambda: StudySnapshot(study).data_frame().copy(), repeat)
+
+    results["widget"], _ = measure(
+        lambda: __render(show_table(StudySnapshot(study))), repeat, __release
+    )
+    col, root = __render(show_table(StudySnapshot(study)))
+    table = next(iter(col.select(pn.widgets.Tabulator)))
+    data = table._models[root.ref["id"]][0].source.data
+    results["page_json_bytes"] = len(json.dumps({k: list(map(str, v)) for k, v in data.items()}))
+    __release((col, root))
+    return results
+
+
+def bench_study(label: str, rows: int, study: ParametricStudy, repeat: int) -> list[dict]:
+    """Run the benchmarks of all display functions on a study."""
+    records = []
+    for name in [*PLOTS, "show_table"]:
+        if name == "show_table":
+            results = bench_table(study, repeat)
+        else:
+            results = bench_plot(name, study, repeat)
+        records.append({"study": label, "rows": rows, "function": name, **results})
+        print(f"{label} {rows} {name} done", file=sys.stderr)
+    return records
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Sizes of synthetic studies."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Calls timed per phase.")
+    parser.add_argument("--no-fixtures", action="store_true", help="Skip the bundled studies.")
+    parser.add_argument("--output", help="JSON file to write. Defaults to standard output.")
+    args = parser.parse_args(argv)
+
+    records = []
+    with tempfile.TemporaryDirectory() as directory:
+        if not args.no_fixtures:
+            for name in FIXTURES:
+                study = fixture_study(name, directory)
+                records += bench_study(name, len(study.data_frame()), study, args.repeat)
+        for rows in args.rows:
+            study = synthetic_study(rows, directory)
+            records += bench_study("synthetic", rows, study, args.repeat)
+
+    results = {
+        "benchmark": "display",
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": records,
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
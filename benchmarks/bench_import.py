@@ -0,0 +1,115 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the time to import the display widgets.
+
+Each scenario is timed in fresh interpreters, so that nothing is imported
+beforehand. The ``eager`` scenario imports every widget module, which is what
+importing ``ansys.additive.widgets.display`` used to do.
+
+Usage::
+
+    python benchmarks/bench_import.py [--repeat N] [--output FILE]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "package": "import ansys.additive.widgets.display",
+    "show_table": "from ansys.additive.widgets.display import show_table",
+    "single_bead_eval_plot": "from ansys.additive.widgets.display import single_bead_eval_plot",
+    "eager": "; ".join(
+        f"import ansys.additive.widgets.display.{name}"
+        for name in [
+            "ave_grain_size_plot",
+            "porosity_contour_plot",
+            "porosity_eval_plot",
+            "show_table",
+            "single_bead_eval_plot",
+        ]
+    ),
+}
+
+# Statement run in the child interpreter. It prints the import time and the
+# heavy dependencies that were imported.
+_TEMPLATE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(sys.modules),
+    "panel": "panel" in sys.modules,
+    "plotly": "plotly" in sys.modules,
+}}))
+"""
+
+
+def run(statement: str, repeat: int) -> dict:
+    """Time an import statement in fresh interpreters."""
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", _TEMPLATE.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        runs.append(json.loads(out.stdout.splitlines()[-1]))
+    seconds = [r["seconds"] for r in runs]
+    return {
+        "statement": statement,
+        "repeat": repeat,
+        "median_seconds": statistics.median(seconds),
+        "min_seconds": min(seconds),
+        "modules": runs[-1]["modules"],
+        "imports_panel": runs[-1]["panel"],
+        "imports_plotly": runs[-1]["plotly"],
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreters per scenario.")
+    parser.add_argument("--output", help="JSON file to write. Defaults to standard output.")
+    args = parser.parse_args(argv)
+
+    results = {
+        "benchmark": "import",
+        "python": sys.version.split()[0],
+        "results": {name: run(stmt, args.repeat) for name, stmt in SCENARIOS.items()},
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
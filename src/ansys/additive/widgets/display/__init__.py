@@ -19,10 +19,72 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-"""Provides plots and interactive interfaces for parametric study results."""
+"""Provides plots and interactive interfaces for parametric study results.
 
-from ansys.additive.widgets.display.ave_grain_size_plot import ave_grain_size_plot
-from ansys.additive.widgets.display.porosity_contour_plot import porosity_contour_plot
-from ansys.additive.widgets.display.porosity_eval_plot import porosity_eval_plot
-from ansys.additive.widgets.display.show_table import show_table
-from ansys.additive.widgets.display.single_bead_eval_plot import single_bead_eval_plot
+The widgets are imported on first use, so importing this package does not
+import Panel, Plotly, or the widget modules.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.additive.widgets.display.ave_grain_size_plot import ave_grain_size_plot
+    from ansys.additive.widgets.display.cache import FigureCache, figure_cache
+    from ansys.additive.widgets.display.export import export_slices
+    from ansys.additive.widgets.display.metrics import Metrics, metrics
+    from ansys.additive.widgets.display.porosity_contour_plot import porosity_contour_plot
+    from ansys.additive.widgets.display.porosity_eval_plot import porosity_eval_plot
+    from ansys.additive.widgets.display.profiling import Profiler, profiler
+    from ansys.additive.widgets.display.show_table import show_table
+    from ansys.additive.widgets.display.single_bead_eval_plot import single_bead_eval_plot
+    from ansys.additive.widgets.display.snapshot import StudyChanges, StudySnapshot
+
+# Public names and the modules defining them.
+_MODULES = {
+    "ave_grain_size_plot": "ave_grain_size_plot",
+    "FigureCache": "cache",
+    "export_slices": "export",
+    "figure_cache": "cache",
+    "Metrics": "metrics",
+    "metrics": "metrics",
+    "porosity_contour_plot": "porosity_contour_plot",
+    "porosity_eval_plot": "porosity_eval_plot",
+    "Profiler": "profiling",
+    "profiler": "profiling",
+    "show_table": "show_table",
+    "single_bead_eval_plot": "single_bead_eval_plot",
+    "StudyChanges": "snapshot",
+    "StudySnapshot": "snapshot",
+}
+
+__all__ = list(_MODULES)
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name: str, value):
+        # Importing a widget module binds it to the package under the name
+        # of its widget function. Bind the function instead.
+        if isinstance(value, types.ModuleType) and _MODULES.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __getattr__(name: str):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_MODULES[name]}")
+    value = getattr(module, name)
+    # Bind the value so that later lookups bypass this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
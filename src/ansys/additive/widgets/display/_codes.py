@@ -0,0 +1,119 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides compact categorical codes for process parameter columns."""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Values closer than this relative tolerance are the same parameter value.
+_RTOL = 1e-6
+# Absolute tolerance, for values close to zero.
+_ATOL = 1e-12
+
+# Code of missing values.
+_MISSING = -1
+# Code of values that are not in the levels.
+_UNKNOWN = -2
+
+
+class _Codes:
+    """Categorical codes of a float column with tolerance-based quantization.
+
+    The sorted distinct values of the column are merged into levels: a value
+    within tolerance of the previous distinct value belongs to its level,
+    otherwise it starts a new one. The value of a level is its smallest
+    value. Each value is then replaced by the integer code of its level,
+    stored in the smallest signed integer type that holds all codes. Missing
+    values are coded ``-1``.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Float values to encode. Missing values are NaN.
+    """
+
+    def __init__(self, values: np.ndarray):
+        values = np.asarray(values, dtype=float)
+        present = ~np.isnan(values)
+        unique, inverse = np.unique(values[present], return_inverse=True)
+        new_level = np.ones(len(unique), dtype=bool)
+        new_level[1:] = ~_close(unique[1:], unique[:-1])
+        level = np.cumsum(new_level) - 1
+        self._levels = unique[new_level]
+        dtype = np.min_scalar_type(-len(self._levels) - 1)
+        self._codes = np.full(len(values), _MISSING, dtype=dtype)
+        self._codes[present] = level[inverse]
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Code of each value."""
+        return self._codes
+
+    @property
+    def levels(self) -> np.ndarray:
+        """Sorted value of each code."""
+        return self._levels
+
+    def encode(self, value: Any) -> int:
+        """Get the code of a value.
+
+        Returns ``-1`` for a missing value and ``-2`` for a value that is not
+        within tolerance of any level.
+        """
+        if value is None or pd.isna(value):
+            return _MISSING
+        i = int(np.searchsorted(self._levels, value))
+        for code in (i - 1, i):
+            if 0 <= code < len(self._levels) and _close(value, self._levels[code]):
+                return code
+        return _UNKNOWN
+
+    def encode_values(self, values: np.ndarray) -> np.ndarray:
+        """Get the codes of an array of values, as :meth:`encode` does for each value."""
+        values = np.asarray(values, dtype=float)
+        codes = np.full(len(values), _UNKNOWN, dtype=np.int64)
+        if len(self._levels):
+            i = np.searchsorted(self._levels, values)
+            for code in (i - 1, i):
+                code = np.clip(code, 0, len(self._levels) - 1)
+                match = (codes == _UNKNOWN) & _close(values, self._levels[code])
+                codes[match] = code[match]
+        codes[np.isnan(values)] = _MISSING
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Get the values of codes. Missing values are NaN."""
+        codes = np.asarray(codes)
+        levels = np.append(self._levels, np.nan)
+        return levels[np.where(codes < 0, len(self._levels), codes)]
+
+
+def _close(a, b):
+    return np.abs(a - b) <= _ATOL + _RTOL * np.abs(b)
+
+
+def _values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Get a column as a float array with missing values as NaN."""
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
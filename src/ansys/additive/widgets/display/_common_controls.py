@@ -20,82 +20,178 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Provides definitions for common controls on parametric study plots."""
+from __future__ import annotations
+
+from typing import Any, Callable
 
 from ansys.additive.core.parametric_study import ColumnNames
-import pandas as pd
+import numpy as np
 import panel as pn
+import param
 
+from ._live import _watch
+from ._slice_index import _PARAMETER_COLUMNS, _SliceIndex
+from .snapshot import StudySnapshot
 
-def _common_controls(df: pd.DataFrame):
-    ht_options = {
-        k: v
-        for (k, v) in [
-            (f"{t:.2f} °C", t) for t in df[ColumnNames.HEATER_TEMPERATURE].unique()  # noqa: E231
-        ]
-    }
-    ht_select = pn.widgets.Select(
-        name="Heater Temperature", options=ht_options, sizing_mode="stretch_width"
-    ).servable()
-    lt_options = {
-        k: v
-        for (k, v) in [
-            (f"{t*1e6:.0f} µm", t) for t in df[ColumnNames.LAYER_THICKNESS].unique()  # noqa: E231
-        ]
-    }
-    lt_select = pn.widgets.Select(
-        name="Layer Thickness", options=lt_options, sizing_mode="stretch_width"
-    ).servable()
-    bd_options = {
-        k: v
-        for (k, v) in [
-            (f"{t*1e6:.0f} µm", t) for t in df[ColumnNames.BEAM_DIAMETER].unique()  # noqa: E231
-        ]
-    }
-    bd_select = pn.widgets.Select(
-        name="Beam Diameter", options=bd_options, sizing_mode="stretch_width"
-    ).servable()
-    sa_options = {
-        k: v
-        for (k, v) in [
-            (f"{t:.1f} °", t) for t in df[ColumnNames.START_ANGLE].unique()  # noqa: E231
-        ]
-    }
-    sa_select = pn.widgets.Select(
-        name="Start Angle", options=sa_options, sizing_mode="stretch_width"
-    ).servable()
-    ra_options = {
-        k: v
-        for (k, v) in [
-            (f"{t:.1f} °", t) for t in df[ColumnNames.ROTATION_ANGLE].unique()  # noqa: E231
-        ]
-    }
-    ra_select = pn.widgets.Select(
-        name="Rotation Angle", options=ra_options, sizing_mode="stretch_width"
-    ).servable()
-    hs_options = {
-        k: v
-        for (k, v) in [
-            (f"{t*1e6:.0f} µm", t) for t in df[ColumnNames.HATCH_SPACING].unique()  # noqa: E231
-        ]
-    }
-    hs_select = pn.widgets.Select(
-        name="Hatch Spacing", options=hs_options, sizing_mode="stretch_width"
-    ).servable()
-    sw_options = {
-        k: v
-        for (k, v) in [
-            (f"{t*1e3:.0f} mm", t) for t in df[ColumnNames.STRIPE_WIDTH].unique()  # noqa: E231
-        ]
-    }
-    sw_select = pn.widgets.Select(
-        name="Stripe Width", options=sw_options, sizing_mode="stretch_width"
-    ).servable()
-    return (
-        ht_select,
-        lt_select,
-        bd_select,
-        sa_select,
-        ra_select,
-        hs_select,
-        sw_select,
+# Name and value label of the control of each process parameter.
+_CONTROLS = {
+    ColumnNames.HEATER_TEMPERATURE: ("Heater Temperature", lambda t: f"{t:.2f} °C"),  # noqa: E231
+    ColumnNames.LAYER_THICKNESS: ("Layer Thickness", lambda t: f"{t*1e6:.0f} µm"),  # noqa: E231
+    ColumnNames.BEAM_DIAMETER: ("Beam Diameter", lambda t: f"{t*1e6:.0f} µm"),  # noqa: E231
+    ColumnNames.START_ANGLE: ("Start Angle", lambda t: f"{t:.1f} °"),  # noqa: E231
+    ColumnNames.ROTATION_ANGLE: ("Rotation Angle", lambda t: f"{t:.1f} °"),  # noqa: E231
+    ColumnNames.HATCH_SPACING: ("Hatch Spacing", lambda t: f"{t*1e6:.0f} µm"),  # noqa: E231
+    ColumnNames.STRIPE_WIDTH: ("Stripe Width", lambda t: f"{t*1e3:.0f} mm"),  # noqa: E231
+}
+
+# Order in which the selections cascade. It is the order of the
+# controls in the plot side bars.
+_CASCADE_ORDER = [
+    ColumnNames.LAYER_THICKNESS,
+    ColumnNames.HEATER_TEMPERATURE,
+    ColumnNames.BEAM_DIAMETER,
+    ColumnNames.START_ANGLE,
+    ColumnNames.ROTATION_ANGLE,
+    ColumnNames.HATCH_SPACING,
+    ColumnNames.STRIPE_WIDTH,
+]
+
+
+class _Selection(param.Parameterized):
+    """Slice of a parametric study selected with the common controls."""
+
+    value = param.Parameter(
+        default=(),
+        doc="Selected values of the columns of the slice index, in the order of the columns.",
+    )
+    requested = param.Parameter(
+        default=None,
+        doc="Values of a slice to select, in the order of the columns of the slice index.",
     )
+
+
+def _common_controls(
+    snapshot: StudySnapshot, slice_index: Callable[[StudySnapshot], _SliceIndex]
+) -> tuple:
+    """Create the process parameter controls of a plot.
+
+    The controls of the columns of the slice index cascade: each control only
+    offers the values found in slices matching the selections of the controls
+    above it, so that every selection displays a slice. Plots are updated
+    through the returned selection, which changes once per user action after
+    all controls have been updated. The options are recomputed when the study
+    changes. Setting the ``requested`` parameter of the selection selects a
+    slice, for example from an overview of the slices.
+
+    Parameters
+    ----------
+    snapshot : StudySnapshot
+        Snapshot of the plotted study.
+    slice_index : Callable[[StudySnapshot], _SliceIndex]
+        Function returning the slice index of the plot for a snapshot.
+
+    Returns
+    -------
+    tuple
+        Heater temperature, layer thickness, beam diameter, start angle,
+        rotation angle, hatch spacing, and stripe width controls, followed by
+        the selection.
+    """
+    index = slice_index(snapshot)
+    selects = {
+        column: pn.widgets.Select(name=name, sizing_mode="stretch_width").servable()
+        for column, (name, _) in _CONTROLS.items()
+    }
+    # Controls of columns that are not indexed do not select slices.
+    for column in _PARAMETER_COLUMNS:
+        if column not in index.columns:
+            selects[column].options = __options(column, index.unique(column))
+    selection = _Selection()
+    updating = False
+
+    def update(index: _SliceIndex, values: dict[str, Any] | None = None):
+        nonlocal updating
+        order = [column for column in _CASCADE_ORDER if column in index.columns]
+        if values is None:
+            values = {column: selects[column].value for column in order}
+        options, values = index.options(values, order)
+        updating = True
+        try:
+            for column in order:
+                selects[column].param.update(
+                    options=__options(column, options[column]), value=values[column]
+                )
+        finally:
+            updating = False
+        selection.value = tuple(values[column] for column in index.columns)
+
+    def on_select(event: param.parameterized.Event):
+        if not updating:
+            update(slice_index(snapshot))
+
+    for column in index.columns:
+        selects[column].param.watch(on_select, "value")
+
+    def on_request(event: param.parameterized.Event):
+        index = slice_index(snapshot)
+        update(index, dict(zip(index.columns, event.new)))
+
+    _watch(snapshot, lambda event: update(slice_index(snapshot)), selection)
+    # Requesting the same slice again selects it again, even if the controls changed since.
+    selection.param.watch(on_request, "requested", onlychanged=False)
+    update(index)
+
+    return (*(selects[column] for column in _PARAMETER_COLUMNS), selection)
+
+
+def _default_selection(index: _SliceIndex) -> tuple:
+    """Get the values of the slice selected by new controls, see :func:`_common_controls`.
+
+    Parameters
+    ----------
+    index : _SliceIndex
+        Slice index of the plot.
+
+    Returns
+    -------
+    tuple
+        Selected values of the columns of the slice index, in the order of the columns.
+    """
+    order = [column for column in _CASCADE_ORDER if column in index.columns]
+    _, values = index.options({}, order)
+    return tuple(values[column] for column in index.columns)
+
+
+def _range_slider(**params) -> pn.widgets.RangeSlider:
+    """Create a range slider whose throttled value follows its value.
+
+    Plots depend on the throttled value of the slider, which the browser only
+    sets when the slider is released, and which is not set when ``value`` is
+    set in Python. The value is copied to the throttled value, so that setting
+    ``value`` updates the plots as well.
+
+    Parameters
+    ----------
+    **params
+        Parameters of the slider.
+
+    Returns
+    -------
+    panel.widgets.RangeSlider
+        Range slider.
+    """
+    slider = pn.widgets.RangeSlider(**params)
+
+    def on_value(event: param.parameterized.Event):
+        # Comparing the values stops the copy when the throttled value is already set.
+        if slider.value_throttled != event.new:
+            with param.edit_constant(slider):
+                slider.value_throttled = event.new
+
+    slider.param.watch(on_value, "value")
+    return slider
+
+
+def __options(column: str, values: np.ndarray) -> dict[str, Any]:
+    label = _CONTROLS[column][1]
+    return {label(v): v for v in np.asarray(values).tolist()}
@@ -0,0 +1,49 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides deferred loading of the Panel extensions used by the widgets."""
+
+import threading
+
+import panel as pn
+
+# Extensions already loaded in this process.
+_loaded = set()
+_lock = threading.Lock()
+
+
+def _extension(*names: str):
+    """Load Panel extensions the first time a widget needs them.
+
+    Loading an extension pulls in its Python and JavaScript dependencies, so
+    it is deferred until a widget using it is constructed rather than done
+    when the module is imported. Each extension is loaded once per process.
+
+    Parameters
+    ----------
+    *names : str
+        Names of the extensions, for example ``"plotly"`` or ``"tabulator"``.
+    """
+    with _lock:
+        names = [name for name in names if name not in _loaded]
+        if names:
+            pn.extension(*names)
+            _loaded.update(names)
@@ -0,0 +1,236 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides faceted views of the slices of a parametric study.
+
+A faceted view displays a grid of subplots, one per value of one or two
+process parameters, all other parameters keeping their selected values.
+The grids of all subplots are built together, and the subplots share their
+axes and color scales, so that the slices can be compared at a glance.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import pandas as pd
+import panel as pn
+import plotly.graph_objects as go
+
+from ._common_controls import _CONTROLS
+from ._grid import _grids
+from ._slice_index import _SliceIndex
+
+# Space between subplots, as a fraction of the figure.
+_SPACING = 0.02
+# Properties of the titles of the rows and columns of subplots.
+_TITLE = dict(xref="paper", yref="paper", showarrow=False, font=dict(size=12))
+
+
+class _FacetGrids(NamedTuple):
+    """Grids of the subplots of a faceted view."""
+
+    row_titles: list[str]
+    """Titles of the rows of subplots."""
+    column_titles: list[str]
+    """Titles of the columns of subplots."""
+    cells: np.ndarray
+    """Row and column of each subplot with a slice."""
+    speeds: np.ndarray
+    """Scan speeds shared by the grids."""
+    powers: np.ndarray
+    """Laser powers shared by the grids."""
+    grids: list[np.ndarray]
+    """Grids of each column, with one grid per subplot along the first dimension."""
+    points: list[pd.DataFrame]
+    """Simulations of each subplot."""
+
+
+def _facet_controls(columns: list[str]) -> tuple[pn.widgets.Select, pn.widgets.Select]:
+    """Create the controls selecting the process parameters faceted into rows and columns.
+
+    Parameters
+    ----------
+    columns : list[str]
+        Process parameters that can be faceted, the columns of a slice index.
+
+    Returns
+    -------
+    tuple[pn.widgets.Select, pn.widgets.Select]
+        Controls of the parameters faceted into rows and columns of subplots.
+        Their value is ``None`` when no parameter is faceted.
+    """
+    options = {"None": None, **{_CONTROLS[column][0]: column for column in columns}}
+    return tuple(
+        pn.widgets.Select(name=name, options=options, sizing_mode="stretch_width").servable()
+        for name in ("Facet Rows", "Facet Columns")
+    )
+
+
+def _facet_grids(
+    index: _SliceIndex,
+    values: tuple,
+    rows: str | None,
+    columns: str | None,
+    grid_columns: list[str],
+    point_columns: list[str],
+) -> _FacetGrids:
+    """Build the grids of the subplots of a faceted view.
+
+    The simulations of all subplots are read with one call to
+    :meth:`_SliceIndex.take_slices`, and their grids are built with one
+    call to :func:`_grids`.
+
+    Parameters
+    ----------
+    index : _SliceIndex
+        Slice index of the plot.
+    values : tuple
+        Values of the selected slice, in the order of the columns of the index.
+    rows : str, None
+        Process parameter faceted into rows of subplots.
+    columns : str, None
+        Process parameter faceted into columns of subplots.
+    grid_columns : list[str]
+        Columns to build grids for.
+    point_columns : list[str]
+        Columns of the simulations of each subplot, besides the scan speed
+        and laser power.
+
+    Returns
+    -------
+    _FacetGrids
+        Grids of the subplots.
+    """
+    if columns == rows:
+        columns = None
+    faceted = [column for column in (rows, columns) if column is not None]
+    axes, grid = index.facets(values, faceted)
+    titles = [[__title(column, value) for value in axis] for column, axis in zip(faceted, axes)]
+    if rows is None:
+        titles.insert(0, [""])
+    if columns is None:
+        titles.append([""])
+    grid = grid.reshape(len(titles[0]), len(titles[1]))
+    cells = np.argwhere(grid >= 0)
+    slices = grid[grid >= 0]
+    df, labels = index.take_slices(
+        slices,
+        columns=list(
+            dict.fromkeys(
+                [ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED, *grid_columns, *point_columns]
+            )
+        ),
+    )
+    speeds, powers, grids = _grids(df, labels, len(slices), grid_columns)
+    order = np.argsort(labels, kind="stable")
+    bounds = np.searchsorted(labels[order], np.arange(1, len(slices)))
+    points = [df.iloc[part] for part in np.split(order, bounds)]
+    return _FacetGrids(*titles, cells, speeds, powers, grids, points)
+
+
+def _facet_figure(
+    facets: _FacetGrids, traces: list[list], xaxis: dict, yaxis: dict, **layout
+) -> go.Figure:
+    """Create the figure of a faceted view.
+
+    The layout of the subplots is built directly rather than with
+    :func:`plotly.subplots.make_subplots`, which updates the figure once per
+    subplot, so that the figure is validated once.
+
+    Parameters
+    ----------
+    facets : _FacetGrids
+        Grids of the subplots.
+    traces : list[list]
+        Traces of each subplot with a slice, in the order of ``facets.cells``.
+    xaxis : dict
+        Properties of the x axes. All x axes share their range. Only the
+        axes of the bottom row show their title and tick labels.
+    yaxis : dict
+        Properties of the y axes. All y axes share their range. Only the
+        axes of the left column show their title and tick labels.
+    **layout
+        Other properties of the layout.
+
+    Returns
+    -------
+    go.Figure
+        Figure with a subplot per cell.
+    """
+    rows, columns = len(facets.row_titles), len(facets.column_titles)
+    width = (1 - _SPACING * (columns - 1)) / columns
+    height = (1 - _SPACING * (rows - 1)) / rows
+    axes, annotations = {}, []
+    for row in range(rows):
+        for column in range(columns):
+            n = row * columns + column + 1
+            suffix = "" if n == 1 else str(n)
+            left, top = column * (width + _SPACING), 1 - row * (height + _SPACING)
+            axes[f"xaxis{suffix}"] = {
+                **xaxis,
+                "domain": [left, min(left + width, 1)],
+                "anchor": f"y{suffix}",
+                "matches": None if n == 1 else "x",
+                "showticklabels": row == rows - 1,
+                "title": xaxis.get("title") if row == rows - 1 else None,
+            }
+            axes[f"yaxis{suffix}"] = {
+                **yaxis,
+                "domain": [max(top - height, 0), top],
+                "anchor": f"x{suffix}",
+                "matches": None if n == 1 else "y",
+                "showticklabels": column == 0,
+                "title": yaxis.get("title") if column == 0 else None,
+            }
+    for column, title in enumerate(facets.column_titles):
+        if title:
+            x = column * (width + _SPACING) + width / 2
+            annotations.append(dict(text=title, x=x, y=1, yanchor="bottom", **_TITLE))
+    for row, title in enumerate(facets.row_titles):
+        if title:
+            y = 1 - row * (height + _SPACING) - height / 2
+            annotations.append(dict(text=title, x=1, y=y, xanchor="left", textangle=90, **_TITLE))
+    data = []
+    for (row, column), cell_traces in zip(facets.cells, traces):
+        n = row * columns + column + 1
+        suffix = "" if n == 1 else str(n)
+        for trace in cell_traces:
+            trace.update(xaxis=f"x{suffix}", yaxis=f"y{suffix}")
+            data.append(trace)
+    return go.Figure(data=data, layout={**axes, "annotations": annotations, **layout})
+
+
+def _shared_range(z: np.ndarray) -> tuple[float | None, float | None]:
+    """Get the smallest and largest value of the grids of all subplots, to share a color scale.
+
+    Both values are ``None`` if there are no values.
+    """
+    low, high = np.fmin.reduce(z, axis=None, initial=np.nan), np.fmax.reduce(
+        z, axis=None, initial=np.nan
+    )
+    return (None, None) if np.isnan(low) else (low.item(), high.item())
+
+
+def __title(column: str, value: float) -> str:
+    name, label = _CONTROLS[column]
+    return f"{name}: {'None' if np.isnan(value) else label(value)}"
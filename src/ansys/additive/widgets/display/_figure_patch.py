@@ -0,0 +1,236 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides Plotly panes that patch a persistent figure in place."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import os
+import threading
+from typing import Any, Callable
+
+import numpy as np
+import panel as pn
+import plotly.graph_objects as go
+
+from .cache import _nbytes
+from .metrics import metrics
+
+# Threads computing the figures of background updates, shared by all panes.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _plotly_pane(
+    update: Callable[..., go.Figure], *args, background: bool = False, **params
+) -> pn.pane.Plotly:
+    """Create a Plotly pane that patches its figure when the arguments change.
+
+    The pane keeps a persistent copy of the first figure returned by ``update``.
+    When a widget in ``args`` changes, ``update`` is called with the current
+    argument values, as with :func:`panel.bind`, unless they are the values
+    of the last call. Only the trace and layout properties that differ from
+    the displayed figure are sent to the browser.
+    If the traces of the new figure do not match the displayed traces, the
+    whole figure is replaced. The time spent getting and patching the figure
+    and the size of the data sent are recorded in :data:`.metrics.metrics`,
+    labeled with the name of the pane.
+
+    Parameters
+    ----------
+    update : Callable[..., go.Figure]
+        Function returning the figure to display. The returned figure is
+        not modified.
+    *args
+        Arguments for ``update``. Widgets are replaced by their values.
+    background : bool, default: False
+        Whether to call ``update`` in a background thread when the arguments
+        change, see :func:`_in_background`.
+    **params
+        Parameters for the :class:`panel.pane.Plotly` pane.
+
+    Returns
+    -------
+    panel.pane.Plotly
+        Plotly pane.
+    """
+    last = pn.bind(lambda *values: values, *args)()
+    pane = pn.pane.Plotly(go.Figure(update(*last)), **params)
+
+    def compute(*values) -> go.Figure | None:
+        nonlocal last
+        # Several arguments can change in one interaction, for example when
+        # a control resets another one. Only the first change is computed.
+        if values == last:
+            return None
+        last = values
+        with metrics.timer("update", plot=pane.name):
+            return update(*values)
+
+    def patch(fig: go.Figure | None):
+        if fig is None:
+            return
+        with metrics.timer("patch", plot=pane.name):
+            if not _patch_figure(pane.object, fig, plot=pane.name):
+                pane.object = go.Figure(fig)
+                metrics.observe("payload_bytes", _nbytes(fig), plot=pane.name)
+
+    if background:
+        pn.bind(_in_background(pane, compute, patch), *args, watch=True)
+    else:
+        pn.bind(lambda *values: patch(compute(*values)), *args, watch=True)
+    return pane
+
+
+def _in_background(
+    pane: pn.viewable.Viewable, compute: Callable[..., Any], apply: Callable[[Any], None]
+) -> Callable:
+    """Create a callback computing a value in a background thread and applying it to a pane.
+
+    The callback is a coroutine function, which Panel runs on the event loop
+    of the session without holding the document lock, so the session keeps
+    handling other events while the value is computed. The pane shows a
+    loading indicator until the value of the last call is applied. When the
+    callback is called again before the value of a previous call is
+    computed, the previous call is cancelled: it is dropped if it has not
+    started yet, and its value is not applied otherwise.
+
+    Parameters
+    ----------
+    pane : panel.viewable.Viewable
+        Pane showing the loading indicator.
+    compute : Callable[..., Any]
+        Function computing the value from the arguments of the callback. It
+        is called in a thread shared by all panes.
+    apply : Callable[[Any], None]
+        Function applying the value to the pane. It is called on the event loop.
+
+    Returns
+    -------
+    Callable
+        Coroutine function.
+    """
+    pending = None
+
+    async def callback(*values):
+        nonlocal pending
+        if pending is not None:
+            pending.cancel()
+        pane.loading = True
+        loop = asyncio.get_running_loop()
+        pending = future = loop.run_in_executor(__executor(), partial(compute, *values))
+        try:
+            value = await future
+        except asyncio.CancelledError:
+            # A later call superseded this one and handles the loading indicator.
+            return
+        finally:
+            if pending is future:
+                pending = None
+                pane.loading = False
+        apply(value)
+
+    return callback
+
+
+def _patch_figure(target: go.Figure, source: go.Figure, plot: str | None = None) -> bool:
+    """Update a figure in place to match another figure.
+
+    Only properties that differ are set. Traces with the same set of changed
+    properties are updated together, so that each update message sent to the
+    views linked to the target figure sets the same properties on all the
+    traces it targets.
+
+    Parameters
+    ----------
+    target : go.Figure
+        Figure to update.
+    source : go.Figure
+        Figure to match.
+    plot : str, default: None
+        Plot label of the size of the changes recorded in :data:`.metrics.metrics`.
+
+    Returns
+    -------
+    bool
+        ``True`` if the figure was patched, ``False`` if the traces of the two
+        figures differ in number or type and the figure could not be patched.
+    """
+    if [t.type for t in target.data] != [t.type for t in source.data]:
+        return False
+    groups = {}
+    for old, new in zip(target.data, source.data):
+        changes = _changes(old.to_plotly_json(), new.to_plotly_json())
+        if changes:
+            groups.setdefault(frozenset(changes), []).append((old, changes))
+    old_layout = target.layout.to_plotly_json()
+    new_layout = source.layout.to_plotly_json()
+    old_layout.pop("template", None)
+    new_layout.pop("template", None)
+    layout_changes = _changes(old_layout, new_layout)
+    if metrics.enabled:
+        sizes = [_nbytes(changes) for traces in groups.values() for _, changes in traces]
+        metrics.observe("payload_bytes", sum(sizes) + _nbytes(layout_changes), plot=plot)
+    for traces in groups.values() or [[]]:
+        with target.batch_update():
+            for trace, changes in traces:
+                trace.update(changes)
+            target.layout.update(layout_changes)
+        layout_changes = {}
+    return True
+
+
+def __executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = min(4, os.cpu_count() or 1)
+            _executor = ThreadPoolExecutor(workers, thread_name_prefix="additive-widgets")
+        return _executor
+
+
+def _changes(old: dict, new: dict) -> dict:
+    """Get the top level properties of ``new`` that differ from ``old``.
+
+    Properties missing from ``new`` are reset to ``None``.
+    """
+    changes = {k: v for (k, v) in new.items() if k not in old or not _equal(old[k], v)}
+    changes.update({k: None for k in old if k not in new})
+    return changes
+
+
+def _equal(a: Any, b: Any) -> bool:
+    """Compare property values, treating NaN values in arrays as equal."""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        a, b = np.asarray(a), np.asarray(b)
+        if a.shape != b.shape:
+            return False
+        try:
+            return np.array_equal(a, b, equal_nan=True)
+        except TypeError:
+            return np.array_equal(a, b)
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_equal(x, y) for (x, y) in zip(a, b))
+    return a == b
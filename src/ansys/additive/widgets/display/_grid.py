@@ -0,0 +1,110 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a vectorized scan speed versus laser power grid builder."""
+from __future__ import annotations
+
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import pandas as pd
+
+from ._codes import _Codes, _values
+
+
+def _grid(df: pd.DataFrame, columns: list[str]) -> tuple[np.ndarray, np.ndarray, list[np.ndarray]]:
+    """Build the scan speed axis, laser power axis, and value grids for a slice.
+
+    The axes are the sorted distinct scan speeds and laser powers of the slice,
+    quantized with the tolerance of :class:`_Codes`.
+    Each grid has one row per laser power and one column per scan speed.
+    Cells without a simulation are filled with NaN. If several simulations
+    share a cell, the first one in the data frame is used.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data frame containing the simulations of a single slice.
+    columns : list[str]
+        Names of the columns to build grids for.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, list[np.ndarray]]
+        Scan speeds, laser powers, and one grid per column.
+    """
+    speeds, powers, grids = _grids(df, np.zeros(len(df), dtype=np.intp), 1, columns)
+    return (speeds, powers, [grid[0] for grid in grids])
+
+
+def _grids(
+    df: pd.DataFrame, slices: np.ndarray, count: int, columns: list[str]
+) -> tuple[np.ndarray, np.ndarray, list[np.ndarray]]:
+    """Build shared axes and value grids for several slices at once.
+
+    The grids are built as by :func:`_grid`, in a single pass over the
+    simulations of all slices. The axes are the sorted distinct scan speeds
+    and laser powers of all slices, so that the grids of all slices share them.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data frame containing the simulations of the slices.
+    slices : np.ndarray
+        Slice of each simulation, from ``0`` to ``count - 1``.
+    count : int
+        Number of slices.
+    columns : list[str]
+        Names of the columns to build grids for.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, list[np.ndarray]]
+        Scan speeds, laser powers, and one array of grids per column, with
+        one grid per slice along its first dimension.
+    """
+    speed = _Codes(_values(df, ColumnNames.SCAN_SPEED))
+    power = _Codes(_values(df, ColumnNames.LASER_POWER))
+    speeds, powers = speed.levels, power.levels
+    valid = (speed.codes >= 0) & (power.codes >= 0)
+    cells, first = np.unique(
+        (np.asarray(slices, dtype=np.intp)[valid] * len(powers) + power.codes[valid]) * len(speeds)
+        + speed.codes[valid],
+        return_index=True,
+    )
+    grids = []
+    for column in columns:
+        z = np.full(count * len(powers) * len(speeds), np.nan)
+        z[cells] = _values(df, column)[valid][first]
+        grids.append(z.reshape(count, len(powers), len(speeds)))
+    return (speeds, powers, grids)
+
+
+def _range_scores(z: np.ndarray, range: tuple[float, float], z_max: float) -> np.ndarray:
+    """Map values to heatmap scores relative to a range of desirable values.
+
+    Values inside the range, after rounding to two decimals, score 0.01.
+    Values outside the range score 0.1 plus their normalized distance to the
+    nearest range limit. NaN values remain NaN.
+    """
+    min_range, max_range = range
+    z = np.round(z, 2)
+    distance = np.minimum(np.abs(max_range - z), np.abs(min_range - z)) / z_max
+    return np.where((z >= min_range) & (z <= max_range), 0.01, 0.1 + distance)
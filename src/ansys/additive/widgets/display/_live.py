@@ -0,0 +1,143 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides live updates of the display widgets while a study changes."""
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Callable
+import weakref
+
+import panel as pn
+from panel.io.state import set_curdoc
+import param
+
+from .snapshot import StudySnapshot
+
+
+def _poll(snapshot: StudySnapshot, period: float | None):
+    """Poll the study of a snapshot for changes while a widget is displayed.
+
+    Changes picked up by :meth:`StudySnapshot.poll` increment the snapshot
+    version, which updates all widgets of the snapshot. Polling only reads
+    the status of the study file until the study changes, so several widgets
+    can poll the same snapshot.
+
+    Parameters
+    ----------
+    snapshot : StudySnapshot
+        Snapshot to poll.
+    period : float, None
+        Period of the polling, in seconds. If ``None``, the study is not polled.
+    """
+    if period is not None:
+        pn.state.add_periodic_callback(snapshot.poll, period=round(period * 1000))
+
+
+def _watch(
+    snapshot: StudySnapshot, callback: Callable[[param.parameterized.Event], None], owner: Any
+):
+    """Call a function when the version of a snapshot changes, while a widget exists.
+
+    Snapshots are shared by all widgets and sessions displaying a study, so
+    the snapshot only holds the function weakly and the widget holds it.
+    The watcher is removed when the widget is garbage collected or when the
+    session displaying it is destroyed. Versions changed by another session
+    or thread are handled on the next tick of the session of the widget,
+    which holds the document lock.
+
+    Parameters
+    ----------
+    snapshot : StudySnapshot
+        Snapshot to watch.
+    callback : Callable[[param.parameterized.Event], None]
+        Function called with the event of the version change.
+    owner : Any
+        Widget updated by ``callback``. It must not be referenced by the
+        snapshot.
+    """
+    vars(owner).setdefault("_snapshot_callbacks", []).append(callback)
+    ref = weakref.ref(callback)
+    doc = pn.state.curdoc
+    if doc is not None and doc.session_context is None:
+        doc = None
+
+    def notify(event: param.parameterized.Event):
+        callback = ref()
+        if callback is None:
+            return
+        if doc is None or pn.state.curdoc is doc:
+            callback(event)
+        else:
+            doc.add_next_tick_callback(partial(__call_in, doc, callback, event))
+
+    watcher = snapshot.param.watch(notify, "version")
+    unwatch = partial(__unwatch, weakref.ref(snapshot), watcher)
+    weakref.finalize(owner, unwatch)
+    if doc is not None:
+        doc.on_session_destroyed(lambda context: unwatch())
+
+
+class _Version(param.Parameterized):
+    """Version of a snapshot, as seen by the widgets of a session."""
+
+    value = param.Integer(default=0, constant=True, doc="Version of the snapshot.")
+
+
+def _version(snapshot: StudySnapshot, owner: Any) -> param.Parameter:
+    """Get a parameter following the version of a snapshot while a widget exists.
+
+    Widgets depend on this parameter rather than on the version of the
+    snapshot, so that the snapshot does not hold them, see :func:`_watch`.
+
+    Parameters
+    ----------
+    snapshot : StudySnapshot
+        Snapshot to follow.
+    owner : Any
+        Widget depending on the version.
+
+    Returns
+    -------
+    param.Parameter
+        Parameter whose value is the version of the snapshot.
+    """
+    version = _Version(value=snapshot.version)
+
+    def update(event: param.parameterized.Event):
+        with param.edit_constant(version):
+            version.value = event.new
+
+    _watch(snapshot, update, owner)
+    return version.param.value
+
+
+def __call_in(doc: Any, callback: Callable, *args):
+    with set_curdoc(doc):
+        callback(*args)
+
+
+def __unwatch(ref: weakref.ref, watcher: param.parameterized.Watcher):
+    snapshot = ref()
+    if snapshot is not None and watcher in snapshot.param.watchers.get("version", {}).get(
+        "value", []
+    ):
+        snapshot.param.unwatch(watcher)
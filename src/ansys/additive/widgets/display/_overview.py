@@ -0,0 +1,133 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides an overview of the slices of a plot ranked by their values inside a range."""
+from __future__ import annotations
+
+from typing import Callable
+
+from bokeh.models.widgets.tables import NumberFormatter
+import numpy as np
+import pandas as pd
+import panel as pn
+
+from ._common_controls import _CONTROLS, _Selection
+from ._live import _watch
+from ._slice_index import _SliceIndex
+from .metrics import metrics
+from .snapshot import StudySnapshot
+
+# Names of the columns of the overview table.
+_SIMULATIONS = "Simulations"
+_INSIDE = "In range"
+_FRACTION = "Fraction in range"
+
+
+def _overview(
+    snapshot: StudySnapshot,
+    slice_index: Callable[[StudySnapshot], _SliceIndex],
+    column: str,
+    label: str,
+    range_slider: pn.widgets.RangeSlider,
+    selection: _Selection,
+    plot: str,
+) -> pn.widgets.Tabulator:
+    """Create a table ranking the slices of a plot by the fraction of their values inside a range.
+
+    The table has a row per slice with its process parameter values, its
+    number of simulations, the number and fraction of its values inside the
+    range of a slider, and its largest value. It is sorted by fraction, then
+    by largest value, and can be sorted by any column. The counts of all
+    slices are computed together, see :meth:`_SliceIndex.window`, when the
+    range or the study changes. Clicking a row selects its slice in the
+    controls of the plot.
+
+    Parameters
+    ----------
+    snapshot : StudySnapshot
+        Snapshot of the plotted study.
+    slice_index : Callable[[StudySnapshot], _SliceIndex]
+        Function returning the slice index of the plot for a snapshot.
+    column : str
+        Name of the column whose values are compared with the range.
+    label : str
+        Label of the column.
+    range_slider : pn.widgets.RangeSlider
+        Slider selecting the range.
+    selection : _Selection
+        Selection of the common controls of the plot.
+    plot : str
+        Name of the plot, used to label metrics.
+
+    Returns
+    -------
+    pn.widgets.Tabulator
+        Overview table.
+    """
+    best = f"Highest {label}"
+    table = pn.widgets.Tabulator(
+        pagination="remote",
+        page_size=10,
+        layout="fit_data_stretch",
+        disabled=True,
+        show_index=False,
+        sorters=[{"field": _FRACTION, "dir": "desc"}, {"field": best, "dir": "desc"}],
+        formatters={
+            _FRACTION: NumberFormatter(format="0%"),
+            best: NumberFormatter(format="0.00"),
+        },
+        sizing_mode="stretch_width",
+    ).servable()
+    slices = []
+
+    def update(*_):
+        nonlocal slices
+        with metrics.timer("overview", plot=plot):
+            index = slice_index(snapshot)
+            slices = index.slices()
+            table.value = __frame(index, slices, column, best, range_slider.value_throttled)
+
+    def on_click(event):
+        selection.requested = slices[event.row]
+
+    table.on_click(on_click)
+    range_slider.param.watch(update, "value_throttled")
+    _watch(snapshot, update, table)
+    update()
+    return table
+
+
+def __frame(
+    index: _SliceIndex, slices: list[tuple], column: str, best: str, range: tuple[float, float]
+) -> pd.DataFrame:
+    counts, inside, largest = index.window(column, range)
+    data = {}
+    for i, parameter in enumerate(index.columns):
+        name, label = _CONTROLS[parameter]
+        values = [values[i] for values in slices]
+        # Leave out parameters that no simulation of the plot has.
+        if any(value is not None for value in values):
+            data[name] = [None if value is None else label(value) for value in values]
+    data[_SIMULATIONS] = counts
+    data[_INSIDE] = inside
+    data[_FRACTION] = inside / np.maximum(counts, 1)
+    data[best] = largest
+    return pd.DataFrame(data)
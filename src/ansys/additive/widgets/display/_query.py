@@ -0,0 +1,309 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides queries of study sidecar files run by embedded query engines.
+
+A query selects the simulations of a type and status from the sidecar file
+of a study file, see :mod:`._sidecar`. The query engine scans the sidecar
+file one record batch at a time and only returns the rows and columns that
+are asked for, so that the simulations of a study never have to be held in
+memory at once.
+"""
+from __future__ import annotations
+
+import abc
+import os
+import threading
+
+from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import pandas as pd
+
+from . import _sidecar
+
+# Query backends of study snapshots. The pandas backend reads simulations
+# into data frames and does not run queries.
+BACKENDS = ("pandas", "duckdb", "polars")
+
+
+class _Query(abc.ABC):
+    """Query of the simulations of a type and status in a sidecar file.
+
+    Parameters
+    ----------
+    path : str, os.PathLike
+        Path of the sidecar file.
+    simulation_type : SimulationType
+        Type of the simulations.
+    status : SimulationStatus
+        Status of the simulations.
+    columns : list[str]
+        Columns returned by :meth:`select`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        simulation_type: SimulationType,
+        status: SimulationStatus,
+        columns: list[str],
+    ):
+        self._path = str(path)
+        self._simulation_type = simulation_type
+        self._status = status
+        self._columns = list(columns)
+
+    @property
+    def columns(self) -> list[str]:
+        """Columns returned by :meth:`select`."""
+        return self._columns
+
+    @abc.abstractmethod
+    def count(self) -> int:
+        """Get the number of matching simulations."""
+
+    @abc.abstractmethod
+    def distinct(self, columns: list[str]) -> pd.DataFrame:
+        """Get the distinct combinations of values of columns of the matching simulations."""
+
+    @abc.abstractmethod
+    def select(self, values: dict[str, np.ndarray]) -> pd.DataFrame:
+        """Get the matching simulations whose columns take given values.
+
+        Parameters
+        ----------
+        values : dict[str, np.ndarray]
+            Float values each column may take. A NaN value matches missing
+            values. Columns are compared as floats, and values that are not
+            numbers are missing.
+
+        Returns
+        -------
+        pd.DataFrame
+            The :attr:`columns` of the selected simulations.
+        """
+
+    @abc.abstractmethod
+    def range(self, columns: list[str]) -> tuple[float | None, float | None]:
+        """Get the smallest and largest value of columns of the matching simulations.
+
+        Missing values are ignored. Both values are ``None`` if there are no values.
+        """
+
+    @abc.abstractmethod
+    def window(self, columns: list[str], column: str, range: tuple[float, float]) -> pd.DataFrame:
+        """Count the values of a column inside a range for each combination of values of columns.
+
+        Values are rounded to two decimals, half to even as :func:`numpy.round`
+        does, before they are compared with the range, see
+        :meth:`._slice_index._SliceIndex.window`.
+
+        Parameters
+        ----------
+        columns : list[str]
+            Columns whose distinct combinations of values are counted. They
+            are compared as floats.
+        column : str
+            Column whose values are compared with the range.
+        range : tuple[float, float]
+            Smallest and largest value of the range.
+
+        Returns
+        -------
+        pd.DataFrame
+            The float values of ``columns`` of each combination, with its
+            number of simulations in the ``count`` column, the number of
+            values inside the range in the ``inside`` column, and the largest
+            value in the ``best`` column.
+        """
+
+
+class _DuckDBQuery(_Query):
+    """Query run by an embedded DuckDB database."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        import duckdb
+        import pyarrow.dataset as ds
+
+        # The sidecar file is scanned as a dataset, which DuckDB reads one
+        # record batch at a time and filters as it reads.
+        self._connection = duckdb.connect()
+        self._connection.register("simulations", ds.dataset(self._path, format="ipc"))
+        # Connections must not be used by several threads at once.
+        self._lock = threading.Lock()
+
+    def count(self) -> int:
+        return self.__execute("count(*)").column(0)[0].as_py()
+
+    def distinct(self, columns: list[str]) -> pd.DataFrame:
+        return self.__execute(f"DISTINCT {', '.join(map(_quote, columns))}", to_pandas=True)
+
+    def select(self, values: dict[str, np.ndarray]) -> pd.DataFrame:
+        conditions, parameters = [], []
+        for column, column_values in values.items():
+            present = np.unique(column_values[~np.isnan(column_values)]).tolist()
+            number = f"TRY_CAST({_quote(column)} AS DOUBLE)"
+            matches = []
+            if present:
+                matches.append(f"{number} IN ({', '.join('?' * len(present))})")
+                parameters.extend(present)
+            if np.isnan(column_values).any():
+                matches.append(f"{number} IS NULL")
+            conditions.append(f"({' OR '.join(matches) or 'FALSE'})")
+        return self.__execute(
+            ", ".join(map(_quote, self._columns)), conditions, parameters, to_pandas=True
+        )
+
+    def range(self, columns: list[str]) -> tuple[float | None, float | None]:
+        numbers = [f"TRY_CAST({_quote(column)} AS DOUBLE)" for column in columns]
+        row = self.__execute(
+            ", ".join(f"min({number}), max({number})" for number in numbers)
+        ).to_pylist()[0]
+        return _range(list(row.values()))
+
+    def window(self, columns: list[str], column: str, range: tuple[float, float]) -> pd.DataFrame:
+        number = f"TRY_CAST({_quote(column)} AS DOUBLE)"
+        low, high = (float(limit) for limit in range)
+        keys = [f"TRY_CAST({_quote(c)} AS DOUBLE) AS {_quote(c)}" for c in columns]
+        return self.__execute(
+            ", ".join(
+                [
+                    *keys,
+                    'count(*) AS "count"',
+                    f"count(*) FILTER (WHERE round_even({number}, 2) BETWEEN {low!r} AND {high!r})"
+                    ' AS "inside"',
+                    f'max({number}) AS "best"',
+                ]
+            ),
+            group=True,
+            to_pandas=True,
+        )
+
+    def __execute(
+        self,
+        select: str,
+        conditions: list[str] = (),
+        parameters: list = (),
+        group: bool = False,
+        to_pandas: bool = False,
+    ):
+        import pyarrow as pa
+
+        where = " AND ".join(
+            [f"{_quote(ColumnNames.TYPE)} = ?", f"{_quote(ColumnNames.STATUS)} = ?", *conditions]
+        )
+        with self._lock:
+            result = self._connection.execute(
+                f"SELECT {select} FROM simulations WHERE {where}"
+                + (" GROUP BY ALL" if group else ""),
+                [self._simulation_type.value, self._status.value, *parameters],
+            ).arrow()
+            # Recent DuckDB versions return a reader rather than a table.
+            table = result.read_all() if isinstance(result, pa.RecordBatchReader) else result
+        return _sidecar._to_pandas(table) if to_pandas else table
+
+
+class _PolarsQuery(_Query):
+    """Query run by a Polars lazy frame."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        import polars as pl
+
+        self._frame = pl.scan_ipc(self._path).filter(
+            (pl.col(ColumnNames.TYPE) == self._simulation_type.value)
+            & (pl.col(ColumnNames.STATUS) == self._status.value)
+        )
+
+    def count(self) -> int:
+        import polars as pl
+
+        return self._frame.select(pl.len()).collect().item()
+
+    def distinct(self, columns: list[str]) -> pd.DataFrame:
+        frame = self._frame.select(columns).unique(maintain_order=True)
+        return _sidecar._to_pandas(frame.collect().to_arrow())
+
+    def select(self, values: dict[str, np.ndarray]) -> pd.DataFrame:
+        import polars as pl
+
+        frame = self._frame
+        for column, column_values in values.items():
+            present = np.unique(column_values[~np.isnan(column_values)]).tolist()
+            number = pl.col(column).cast(pl.Float64, strict=False)
+            match = number.is_in(present)
+            if np.isnan(column_values).any():
+                match = match | number.is_null()
+            frame = frame.filter(match)
+        return _sidecar._to_pandas(frame.select(self._columns).collect().to_arrow())
+
+    def range(self, columns: list[str]) -> tuple[float | None, float | None]:
+        import polars as pl
+
+        numbers = [pl.col(column).cast(pl.Float64, strict=False) for column in columns]
+        row = self._frame.select(
+            *(number.min().alias(f"min{i}") for i, number in enumerate(numbers)),
+            *(number.max().alias(f"max{i}") for i, number in enumerate(numbers)),
+        ).collect()
+        return _range(row.row(0))
+
+    def window(self, columns: list[str], column: str, range: tuple[float, float]) -> pd.DataFrame:
+        import polars as pl
+
+        number = pl.col(column).cast(pl.Float64, strict=False)
+        frame = self._frame.group_by(
+            [pl.col(c).cast(pl.Float64, strict=False).alias(c) for c in columns]
+        ).agg(
+            pl.len().alias("count"),
+            number.round(2, mode="half_to_even").is_between(*range).sum().alias("inside"),
+            number.max().alias("best"),
+        )
+        return _sidecar._to_pandas(frame.collect().to_arrow())
+
+
+# Query of each backend running queries.
+_QUERIES = {
+    "duckdb": _DuckDBQuery,
+    "polars": _PolarsQuery,
+}
+
+
+def _query(
+    backend: str,
+    path: str | os.PathLike,
+    simulation_type: SimulationType,
+    status: SimulationStatus,
+    columns: list[str],
+) -> _Query:
+    """Create a query of a sidecar file run by a backend other than pandas."""
+    return _QUERIES[backend](path, simulation_type, status, columns)
+
+
+def _quote(column: str) -> str:
+    """Quote a column name in SQL."""
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _range(values: list) -> tuple[float | None, float | None]:
+    values = [value for value in values if value is not None and not np.isnan(value)]
+    return (min(values), max(values)) if values else (None, None)
@@ -0,0 +1,88 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides scatter layers of labeled points for the plots."""
+from __future__ import annotations
+
+from typing import Sequence
+
+import plotly.graph_objects as go
+
+# Number of points from which scatter layers are drawn with WebGL by default.
+_WEBGL_POINTS = 1000
+
+# Default maximum number of points labeled with their value.
+_MAX_LABELS = 500
+
+
+def _scatter(
+    x: Sequence[float],
+    y: Sequence[float],
+    values: Sequence[float],
+    texttemplate: str,
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
+    **params,
+) -> go.Scatter | go.Scattergl:
+    """Create a scatter layer of points labeled with their value.
+
+    The labels are formatted by the browser from the values, using a Plotly
+    ``texttemplate`` in which the value of a point is ``%{customdata}``, for
+    example ``"<b>%{customdata:.2f}</b>"``. Labels are left out when there are
+    too many points to read them. Large layers are drawn with WebGL, since
+    the SVG renderer slows down with thousands of points.
+
+    Parameters
+    ----------
+    x : Sequence[float]
+        X coordinates of the points.
+    y : Sequence[float]
+        Y coordinates of the points.
+    values : Sequence[float]
+        Values of the points.
+    texttemplate : str
+        Template of the labels.
+    webgl : bool, default: None
+        Whether to draw the layer with WebGL. If ``None``, WebGL is used
+        from 1000 points.
+    max_labels : int, default: 500
+        Maximum number of points to label.
+    **params
+        Other properties of the layer. ``cliponaxis`` is ignored with WebGL.
+
+    Returns
+    -------
+    go.Scatter, go.Scattergl
+        Scatter layer.
+    """
+    if webgl is None:
+        webgl = len(x) >= _WEBGL_POINTS
+    if webgl:
+        params.pop("cliponaxis", None)
+    labeled = len(x) <= max_labels
+    return (go.Scattergl if webgl else go.Scatter)(
+        x=x,
+        y=y,
+        customdata=values,
+        mode="markers+text" if labeled else "markers",
+        texttemplate=texttemplate if labeled else None,
+        **params,
+    )
@@ -0,0 +1,272 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a columnar cache of parametric study files for fast reopening.
+
+A study file is a pickle of the whole study, so reading it takes time
+proportional to the size of the study, even when only a few columns are
+used. The simulations of a study file are also written to a sidecar file
+in the Arrow IPC format, next to the study file. The sidecar file is
+memory-mapped when read, so reading a few columns only reads those columns.
+The sidecar file records the modification time and size of the study file
+it was written from, and is not used once the study file changes.
+Columns of numbers are read with numeric types, even if the study stores
+them as objects.
+
+Sidecar files require the optional ``pyarrow`` package. Without it, study
+files are read directly.
+"""
+from __future__ import annotations
+
+import contextlib
+from enum import Enum
+import importlib.util
+import json
+import os
+import pathlib
+import platform
+import threading
+
+from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
+import dill
+import numpy as np
+import pandas as pd
+
+# Serializes the replacement of the pathlib path classes while study files are read.
+_pathlib_lock = threading.Lock()
+# Suffix appended to the name of a study file to name its sidecar file.
+_SUFFIX = ".arrow"
+# Key of the schema metadata describing the study file of a sidecar file.
+_METADATA_KEY = b"ansys.additive.widgets"
+# Version of the sidecar file layout. Sidecar files of other versions are ignored.
+_VERSION = 1
+# Number of rows of each record batch of a sidecar file. Queries scan sidecar
+# files one record batch at a time.
+_BATCH_ROWS = 65536
+# Columns holding enumerations, which sidecar files store as strings.
+_ENUMERATIONS = {
+    ColumnNames.TYPE: SimulationType,
+    ColumnNames.STATUS: SimulationStatus,
+}
+
+
+def _file_stamp(file_name: str | os.PathLike | None) -> tuple[int, int] | None:
+    """Get the modification time and size of a file, ``None`` if it cannot be read."""
+    try:
+        stat = os.stat(file_name)
+    except (OSError, TypeError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _sidecar_path(file_name: str | os.PathLike) -> pathlib.Path:
+    """Get the path of the sidecar file of a study file."""
+    path = pathlib.Path(file_name)
+    return path.with_name(path.name + _SUFFIX)
+
+
+def _read(
+    file_name: str | os.PathLike,
+    stamp: tuple[int, int] | None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | None:
+    """Read simulations from the sidecar file of a study file.
+
+    Parameters
+    ----------
+    file_name : str, os.PathLike
+        Name of the study file.
+    stamp : tuple[int, int], None
+        Current stamp of the study file, see :func:`_file_stamp`.
+    columns : list[str], default: None
+        Columns to read. If ``None``, all columns are read.
+
+    Returns
+    -------
+    pd.DataFrame, None
+        Simulations, or ``None`` if ``pyarrow`` is not installed or the
+        sidecar file is missing, unreadable, or was written from another
+        version of the study file.
+    """
+    if stamp is None or importlib.util.find_spec("pyarrow") is None:
+        return None
+    import pyarrow as pa
+
+    try:
+        with pa.memory_map(str(_sidecar_path(file_name))) as source:
+            reader = pa.ipc.open_file(source)
+            if __metadata(reader.schema) != __expected_metadata(stamp):
+                return None
+            table = reader.read_all()
+            if columns is not None:
+                table = table.select(columns)
+            return _to_pandas(table)
+    except (OSError, KeyError, ValueError, pa.ArrowException):
+        return None
+
+
+def _is_current(file_name: str | os.PathLike, stamp: tuple[int, int] | None) -> bool:
+    """Check whether the sidecar file of a study file was written from its current version.
+
+    Parameters
+    ----------
+    file_name : str, os.PathLike
+        Name of the study file.
+    stamp : tuple[int, int], None
+        Current stamp of the study file, see :func:`_file_stamp`.
+
+    Returns
+    -------
+    bool
+        ``True`` if ``pyarrow`` is installed and the sidecar file matches
+        the stamp of the study file.
+    """
+    if stamp is None or importlib.util.find_spec("pyarrow") is None:
+        return False
+    import pyarrow as pa
+
+    try:
+        with pa.memory_map(str(_sidecar_path(file_name))) as source:
+            schema = pa.ipc.open_file(source).schema
+    except (OSError, ValueError, pa.ArrowException):
+        return False
+    return __metadata(schema) == __expected_metadata(stamp)
+
+
+def _write(file_name: str | os.PathLike, stamp: tuple[int, int] | None, df: pd.DataFrame):
+    """Write the sidecar file of a study file.
+
+    Nothing is written if ``pyarrow`` is not installed, or if the simulations
+    cannot be stored in the Arrow format or the sidecar file cannot be written.
+
+    Parameters
+    ----------
+    file_name : str, os.PathLike
+        Name of the study file.
+    stamp : tuple[int, int], None
+        Stamp of the study file the simulations were read from, see
+        :func:`_file_stamp`.
+    df : pd.DataFrame
+        Simulations of the study.
+    """
+    if stamp is None or importlib.util.find_spec("pyarrow") is None:
+        return
+    import pyarrow as pa
+
+    path = _sidecar_path(file_name)
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        # Store columns of numbers as numeric columns, even if they mix integers and floats.
+        table = pa.Table.from_pandas(df.infer_objects(), preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), _METADATA_KEY: __expected_metadata(stamp)}
+        table = table.replace_schema_metadata(metadata)
+        # Write the whole file before replacing the sidecar file, so that
+        # readers never see a partial file.
+        with pa.OSFile(str(temp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=_BATCH_ROWS)
+        os.replace(temp, path)
+    except (OSError, TypeError, ValueError, pa.ArrowException):
+        with contextlib.suppress(OSError):
+            os.remove(temp)
+
+
+def _read_study(file_name: str | os.PathLike) -> ParametricStudy:
+    """Read a parametric study from its file without modifying the file.
+
+    Unlike :meth:`ParametricStudy.load`, the status of pending simulations
+    is not reset and the study is not saved. As :meth:`ParametricStudy.load`
+    does, the path class of the other platform is replaced in the
+    :mod:`pathlib` module while the file is read, so that paths pickled on
+    that platform can be read. The replacement is global to the process,
+    so study files are read one at a time.
+
+    Parameters
+    ----------
+    file_name : str, os.PathLike
+        Name of the study file.
+
+    Returns
+    -------
+    ParametricStudy
+        Parametric study, in the latest format version.
+    """
+    if not pathlib.Path(file_name).is_file():
+        raise ValueError(f"{file_name} is not a valid file.")
+    # Read paths pickled on other platforms, as ParametricStudy.load does.
+    if platform.system() == "Windows":
+        name, alias = "PosixPath", pathlib.WindowsPath
+    else:
+        name, alias = "WindowsPath", pathlib.PosixPath
+    with _pathlib_lock:
+        original = getattr(pathlib, name)
+        setattr(pathlib, name, alias)
+        try:
+            with open(file_name, "rb") as f:
+                study = dill.load(f)  # noqa: S301
+        finally:
+            setattr(pathlib, name, original)
+    if not isinstance(study, ParametricStudy):
+        raise ValueError(f"{file_name} is not a parametric study.")
+    study.file_name = file_name
+    return ParametricStudy.update_format(study)
+
+
+def _to_pandas(table) -> pd.DataFrame:
+    """Convert a table read from a sidecar file to simulations with the types of the study."""
+    import pyarrow as pa
+
+    enumerations = [column for column in table.column_names if column in _ENUMERATIONS]
+    others = table.drop_columns(enumerations)
+    df = others.to_pandas()
+    for field in others.schema:
+        if pa.types.is_null(field.type):
+            # Columns without any value are stored with the null type.
+            df[field.name] = np.nan
+        elif not pd.api.types.is_numeric_dtype(df[field.name]):
+            df[field.name] = df[field.name].astype(object)
+    for column in enumerations:
+        df[column] = __members(table.column(column), _ENUMERATIONS[column], df.index)
+    return df.reindex(columns=pd.Index(table.column_names, dtype=object))
+
+
+def __expected_metadata(stamp: tuple[int, int]) -> bytes:
+    return json.dumps({"version": _VERSION, "stamp": list(stamp)}).encode()
+
+
+def __metadata(schema) -> bytes | None:
+    return (schema.metadata or {}).get(_METADATA_KEY)
+
+
+def __members(values, enumeration: type[Enum], index: pd.Index) -> pd.Series:
+    """Get the members of an enumeration from an array of their values."""
+    values = values.dictionary_encode().combine_chunks()
+    members = {member.value: member for member in enumeration}
+    # Missing values are looked up past the end of the dictionary.
+    lookup = np.array(
+        [members.get(value, value) for value in values.dictionary.to_pylist()] + [None],
+        dtype=object,
+    )
+    codes = values.indices.fill_null(len(values.dictionary)).to_numpy()
+    # Create the series with an explicit type, since pandas would otherwise
+    # infer a string type for enumerations deriving from str.
+    return pd.Series(lookup[codes], index=index, dtype=object)
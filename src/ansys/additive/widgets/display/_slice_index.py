@@ -0,0 +1,455 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides an index from process parameter values to parametric study rows."""
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Callable, Hashable
+
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import pandas as pd
+
+from ._codes import _UNKNOWN, _Codes, _values
+
+if TYPE_CHECKING:
+    from ._query import _Query
+
+# Process parameters selected with the common controls, in the order
+# in which the controls are returned.
+_PARAMETER_COLUMNS = [
+    ColumnNames.HEATER_TEMPERATURE,
+    ColumnNames.LAYER_THICKNESS,
+    ColumnNames.BEAM_DIAMETER,
+    ColumnNames.START_ANGLE,
+    ColumnNames.ROTATION_ANGLE,
+    ColumnNames.HATCH_SPACING,
+    ColumnNames.STRIPE_WIDTH,
+]
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
+class _SliceIndex:
+    """Maps process parameter values to the rows of a data frame.
+
+    The indexed columns are encoded once as compact categorical codes with
+    tolerance-based quantization, see :class:`_Codes`. The codes of each row
+    are combined into a single integer key, and the rows are sorted by key,
+    so that looking up a slice is a binary search over the distinct keys.
+    Slice selection and option generation only compare integer codes.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data frame to index. The data frame must not be modified afterwards.
+    columns : list[str], default: _PARAMETER_COLUMNS
+        Names of the columns to index on.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: list[str] = _PARAMETER_COLUMNS):
+        self._df = df
+        self._columns = list(columns)
+        self._codes = [_Codes(_values(df, column)) for column in self._columns]
+        # Shift the codes so that missing values are zero, then combine them.
+        sizes = [len(codes.levels) + 1 for codes in self._codes]
+        if math.prod(sizes) >= 2**63:
+            raise ValueError("There are too many distinct process parameter values to index.")
+        sizes = np.array(sizes, dtype=np.int64)
+        self._strides = np.cumprod(np.append(1, sizes[:-1]))
+        keys = np.zeros(len(df), dtype=np.int64)
+        for codes, stride in zip(self._codes, self._strides):
+            keys += (codes.codes.astype(np.int64) + 1) * stride
+        self._order = np.argsort(keys, kind="stable")
+        self._keys, self._starts = np.unique(keys[self._order], return_index=True)
+        self._ends = np.append(self._starts[1:], len(keys))
+        self._combinations = np.stack(
+            [(self._keys // stride) % size - 1 for size, stride in zip(sizes, self._strides)],
+            axis=1,
+        ).reshape(len(self._keys), len(self._columns))
+        self._options = {}
+        self._cache = {}
+
+    def __len__(self) -> int:
+        """Number of indexed rows."""
+        return len(self._df)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Indexed data frame."""
+        return self._df
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the indexed columns."""
+        return self._columns
+
+    @property
+    def combinations(self) -> np.ndarray:
+        """Codes of the distinct combinations of the indexed column values.
+
+        The array has one row per slice and one column per indexed column.
+        Use :meth:`levels` to get the values of the codes.
+        """
+        return self._combinations
+
+    def slices(self) -> list[tuple]:
+        """Get the values of every slice.
+
+        Values are given in the order of :attr:`columns`, and missing values
+        are ``None``, so each tuple can be passed to :meth:`take`.
+        """
+        columns = [
+            np.asarray(codes.decode(self._combinations[:, i]), dtype=object)
+            for i, codes in enumerate(self._codes)
+        ]
+        for values, combinations in zip(columns, self._combinations.T):
+            values[combinations < 0] = None
+        return list(zip(*(values.tolist() for values in columns)))
+
+    def levels(self, column: str) -> np.ndarray:
+        """Get the sorted distinct values of an indexed column."""
+        return self._codes[self._columns.index(column)].levels
+
+    def rows(self, *values) -> np.ndarray:
+        """Get the positions of the rows matching the given column values.
+
+        Values are given in the order of :attr:`columns`. They match the
+        column values within the quantization tolerance.
+        """
+        codes = [c.encode(v) for c, v in zip(self._codes, values)]
+        if _UNKNOWN in codes:
+            return _NO_ROWS
+        key = int(np.dot(np.array(codes, dtype=np.int64) + 1, self._strides))
+        i = np.searchsorted(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            return _NO_ROWS
+        return self._order[self._starts[i] : self._ends[i]]
+
+    def take(self, *values, columns: list[str] | None = None) -> pd.DataFrame:
+        """Get the rows matching the given column values.
+
+        Parameters
+        ----------
+        *values
+            Column values in the order of :attr:`columns`.
+        columns : list[str], default: None
+            Columns to return. If ``None``, all columns are returned.
+
+        Returns
+        -------
+        pd.DataFrame
+            Matching rows.
+        """
+        if columns is None:
+            return self._df.iloc[self.rows(*values)]
+        return self._df.iloc[self.rows(*values), self._df.columns.get_indexer(columns)]
+
+    def take_slices(
+        self, slices: np.ndarray, columns: list[str] | None = None
+    ) -> tuple[pd.DataFrame, np.ndarray]:
+        """Get the rows of several slices at once.
+
+        Parameters
+        ----------
+        slices : np.ndarray
+            Positions of the slices in :attr:`combinations`.
+        columns : list[str], default: None
+            Columns to return. If ``None``, all columns are returned.
+
+        Returns
+        -------
+        tuple[pd.DataFrame, np.ndarray]
+            Rows of the slices, and the position in ``slices`` of the slice
+            of each row.
+        """
+        rows, labels = self._ranges(slices)
+        if columns is None:
+            return self._df.iloc[rows], labels
+        return self._df.iloc[rows, self._df.columns.get_indexer(columns)], labels
+
+    def _ranges(self, slices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get the positions of the rows of slices, and the position in ``slices`` of each row."""
+        slices = np.asarray(slices, dtype=np.intp)
+        lengths = self._ends[slices] - self._starts[slices]
+        labels = np.repeat(np.arange(len(slices)), lengths)
+        # Offset a running count by the start of the slice of each row.
+        ends = np.cumsum(lengths)
+        sorted_rows = np.arange(ends[-1] if len(ends) else 0) + np.repeat(
+            self._starts[slices] - (ends - lengths), lengths
+        )
+        return self._order[sorted_rows], labels
+
+    def facets(self, values: tuple, columns: list[str]) -> tuple[list[np.ndarray], np.ndarray]:
+        """Get the slices that only differ from a slice in the values of some columns.
+
+        Parameters
+        ----------
+        values : tuple
+            Values of the slice in the order of :attr:`columns`.
+        columns : list[str]
+            Names of the columns whose values may differ.
+
+        Returns
+        -------
+        tuple[list[np.ndarray], np.ndarray]
+            Sorted distinct values of each column among the matching slices,
+            with NaN for missing values, and the positions of the matching
+            slices in :attr:`combinations`, in an array with one dimension
+            per column indexed by the positions of the values. Positions of
+            combinations of values without a slice are ``-1``.
+        """
+        positions = [self._columns.index(column) for column in columns]
+        matching = np.ones(len(self._combinations), dtype=bool)
+        for i, (codes, value) in enumerate(zip(self._codes, values)):
+            if i not in positions:
+                matching &= self._combinations[:, i] == codes.encode(value)
+        slices = np.flatnonzero(matching)
+        axes, coordinates = [], []
+        for i in positions:
+            axis, inverse = np.unique(self._combinations[slices, i], return_inverse=True)
+            axes.append(self._codes[i].decode(axis))
+            coordinates.append(inverse)
+        grid = np.full([len(axis) for axis in axes], -1, dtype=np.intp)
+        grid[tuple(coordinates)] = slices
+        return axes, grid
+
+    def unique(self, column: str) -> np.ndarray:
+        """Get the distinct values of a column in order of appearance, including missing values."""
+        return self._df[column].unique()
+
+    def range(self, columns: list[str]) -> tuple[float | None, float | None]:
+        """Get the smallest and largest value of columns.
+
+        Missing values are ignored. Both values are ``None`` if there are no values.
+        """
+        values = np.concatenate([_values(self._df, column) for column in columns])
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return None, None
+        return values.min().item(), values.max().item()
+
+    def positions(self, df: pd.DataFrame) -> np.ndarray:
+        """Get the slice of each row of a data frame.
+
+        Slices are given by their position in :attr:`combinations`. Rows
+        whose values do not select a slice are given ``-1``.
+        """
+        if len(self._keys) == 0:
+            return np.full(len(df), -1, dtype=np.intp)
+        keys = np.zeros(len(df), dtype=np.int64)
+        known = np.ones(len(df), dtype=bool)
+        for codes, stride, column in zip(self._codes, self._strides, self._columns):
+            column_codes = codes.encode_values(_values(df, column))
+            known &= column_codes != _UNKNOWN
+            keys += (column_codes + 1) * stride
+        i = np.searchsorted(self._keys, keys)
+        found = known & (i < len(self._keys))
+        found[found] = self._keys[i[found]] == keys[found]
+        return np.where(found, i, -1)
+
+    def window(
+        self, column: str, range: tuple[float, float]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Count the values of a column inside a range for every slice.
+
+        All slices are reduced in a single pass over the rows, which are
+        sorted by slice. Values are rounded to two decimals before they are
+        compared with the range, as in the heat maps of the plots.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column.
+        range : tuple[float, float]
+            Smallest and largest value of the range.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Number of rows, number of values inside the range, and largest
+            value of each slice, in the order of :attr:`combinations`. The
+            largest value of a slice without values is NaN.
+        """
+        if len(self._keys) == 0:
+            return _NO_ROWS, _NO_ROWS, np.empty(0)
+        values = self.cached(("window", column), lambda: _values(self._df, column)[self._order])
+        rounded = np.round(values, 2)
+        inside = ((rounded >= range[0]) & (rounded <= range[1])).astype(np.intp)
+        return (
+            self._ends - self._starts,
+            np.add.reduceat(inside, self._starts),
+            np.fmax.reduceat(values, self._starts),
+        )
+
+    def cached(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """Get a value derived from the indexed data frame, such as the data of a slice.
+
+        The value is created on first use and kept as long as the index.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the value.
+        create : Callable[[], Any]
+            Function that creates the value.
+
+        Returns
+        -------
+        Any
+            Cached or created value.
+        """
+        if key not in self._cache:
+            self._cache[key] = create()
+        return self._cache[key]
+
+    def options(
+        self, values: dict[str, Any], order: list[str] | None = None
+    ) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+        """Get the values of each column that co-occur with the values selected before it.
+
+        Columns are visited in ``order``. The options of a column are the
+        values of the slices matching the selected values of all columns
+        visited before it. A selected value that is not an option is replaced
+        by the first option, so the resolved values always select a slice.
+        Results are cached.
+
+        Parameters
+        ----------
+        values : dict[str, Any]
+            Selected value of each column.
+        order : list[str], default: None
+            Order in which the columns are visited. If ``None``, the columns
+            are visited in the order of :attr:`columns`.
+
+        Returns
+        -------
+        tuple[dict[str, np.ndarray], dict[str, Any]]
+            Sorted options of each column, and resolved value of each column.
+            A column without options resolves to ``None``.
+        """
+        order = self._columns if order is None else order
+        positions = [self._columns.index(column) for column in order]
+        codes = tuple(self._codes[i].encode(values.get(self._columns[i])) for i in positions)
+        key = (tuple(positions), codes)
+        if key not in self._options:
+            self._options[key] = self.__options(positions, codes)
+        return self._options[key]
+
+    def __options(self, positions: list[int], codes: tuple[int, ...]):
+        matching = np.ones(len(self._combinations), dtype=bool)
+        options, resolved = {}, {}
+        for i, code in zip(positions, codes):
+            column, column_codes = self._columns[i], self._combinations[:, i]
+            option_codes = np.unique(column_codes[matching])
+            if code not in option_codes:
+                code = option_codes[0] if len(option_codes) else None
+            options[column] = self._codes[i].decode(option_codes)
+            if code is None:
+                resolved[column] = None
+            else:
+                resolved[column] = self._codes[i].decode(code).item()
+                matching &= column_codes == code
+        return options, resolved
+
+
+class _QuerySliceIndex(_SliceIndex):
+    """Maps process parameter values to the rows selected by a query.
+
+    Only the distinct combinations of the indexed column values are read to
+    build the index, and the rows of a slice are read by :meth:`take`, so
+    that the memory used is bounded by the size of the slices rather than
+    the size of the study. :attr:`frame` holds the distinct combinations.
+
+    Parameters
+    ----------
+    query : _Query
+        Query selecting the rows.
+    columns : list[str], default: _PARAMETER_COLUMNS
+        Names of the columns to index on.
+    prepare : Callable[[pd.DataFrame], pd.DataFrame], default: None
+        Function applied to the rows read by :meth:`take`, for example to
+        fill missing values.
+    """
+
+    def __init__(
+        self,
+        query: _Query,
+        columns: list[str] = _PARAMETER_COLUMNS,
+        prepare: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    ):
+        super().__init__(query.distinct(columns), columns)
+        self._query = query
+        self._prepare = prepare
+        self._count = query.count()
+
+    def __len__(self) -> int:
+        """Number of indexed rows."""
+        return self._count
+
+    def take(self, *values, columns: list[str] | None = None) -> pd.DataFrame:
+        # Several combinations are in the same slice if their values are
+        # within tolerance, so select the values of all of them.
+        combinations = self._df.iloc[self.rows(*values)]
+        df = self._query.select({column: _values(combinations, column) for column in self._columns})
+        if self._prepare is not None:
+            df = self._prepare(df)
+        return df if columns is None else df[columns]
+
+    def take_slices(
+        self, slices: np.ndarray, columns: list[str] | None = None
+    ) -> tuple[pd.DataFrame, np.ndarray]:
+        # Selecting the values of each column selects every combination of
+        # them, so leave out the rows of other slices.
+        combinations, _ = self._ranges(slices)
+        combinations = self._df.iloc[combinations]
+        df = self._query.select({column: _values(combinations, column) for column in self._columns})
+        labels = np.full(len(self._keys), -1, dtype=np.intp)
+        labels[np.asarray(slices, dtype=np.intp)] = np.arange(len(slices))
+        positions = self.positions(df)
+        labels = np.where(positions >= 0, labels[positions], -1)
+        df, labels = df[labels >= 0], labels[labels >= 0]
+        if self._prepare is not None:
+            df = self._prepare(df)
+        return (df if columns is None else df[columns]), labels
+
+    def unique(self, column: str) -> np.ndarray:
+        return self._query.distinct([column])[column].unique()
+
+    def range(self, columns: list[str]) -> tuple[float | None, float | None]:
+        return self._query.range(columns)
+
+    def window(
+        self, column: str, range: tuple[float, float]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # The query reduces the rows of each distinct combination, and the
+        # combinations are then reduced by slice.
+        groups = self._query.window(self._columns, column, range)
+        positions = self.positions(groups)
+        groups, positions = groups[positions >= 0], positions[positions >= 0]
+        counts = np.zeros(len(self._keys), dtype=np.intp)
+        inside = np.zeros(len(self._keys), dtype=np.intp)
+        best = np.full(len(self._keys), np.nan)
+        np.add.at(counts, positions, groups["count"].to_numpy(dtype=np.intp))
+        np.add.at(inside, positions, groups["inside"].to_numpy(dtype=np.intp))
+        np.fmax.at(best, positions, _values(groups, "best"))
+        return counts, inside, best
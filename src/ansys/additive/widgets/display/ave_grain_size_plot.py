@@ -24,42 +24,80 @@
 from __future__ import annotations
 
 import os
+from typing import Iterator
 
-from ansys.additive.core import MachineConstants, SimulationStatus, SimulationType
+from ansys.additive.core import MachineConstants, SimulationType
 from ansys.additive.core.misc import short_uuid
 from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
+import numpy as np
 import pandas as pd
 import panel as pn
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from ._common_controls import _common_controls
+from ._codes import _values
+from ._common_controls import _common_controls, _default_selection
+from ._extension import _extension
+from ._figure_patch import _plotly_pane
+from ._live import _poll, _version
+from ._scatter import _MAX_LABELS, _scatter
+from ._slice_index import _PARAMETER_COLUMNS, _QuerySliceIndex, _SliceIndex
+from .cache import figure_cache
+from .metrics import metrics
+from .profiling import profiler
+from .snapshot import StudySnapshot
 
-# Initialize panel for plotly.
-pn.extension("plotly")
+# Columns used by the plot.
+_COLUMNS = _PARAMETER_COLUMNS + [
+    ColumnNames.LASER_POWER,
+    ColumnNames.SCAN_SPEED,
+    ColumnNames.XY_AVERAGE_GRAIN_SIZE,
+    ColumnNames.XZ_AVERAGE_GRAIN_SIZE,
+    ColumnNames.YZ_AVERAGE_GRAIN_SIZE,
+]
 
-# Min/Max average grain size
-min_ags = None
-max_ags = None
 
-
-def ave_grain_size_plot(ps: ParametricStudy):
+def ave_grain_size_plot(
+    ps: ParametricStudy | StudySnapshot,
+    poll_period: float | None = None,
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
+    background: bool = False,
+):
     """Plot average grain size for laser power versus scan speed.
 
     Parameters
     ----------
-    ps : ParametricStudy
+    ps : ParametricStudy, StudySnapshot
         Parametric study to plot.
+    poll_period : float, default: None
+        Period, in seconds, at which the study is checked for changes, for
+        example while its simulations run. The plot is updated when the study
+        changes. If ``None``, only changes made through the snapshot of the
+        study, such as edits in the table, update the plot.
+    webgl : bool, default: None
+        Whether to draw the simulation points with WebGL, which is faster for
+        thousands of points. If ``None``, WebGL is used for large slices.
+    max_labels : int, default: 500
+        Maximum number of simulation points labeled with their value. Points
+        of larger slices are not labeled.
+    background : bool, default: False
+        Whether to compute the figure in a background thread when a control
+        changes, so that the other widgets of the session stay responsive
+        while slow slices are computed. The plot shows a loading indicator
+        meanwhile, and the figures of selections changed again before they
+        are shown are dropped. Background computation requires a running
+        event loop, as in a served application or a notebook. Otherwise,
+        the figure is computed before the control change returns.
 
     Returns
     -------
     panel.Row
         Interactive plot.
     """
-    global min_ags, max_ags
-    df = __data_frame(ps)
-    min_ags, max_ags = __min_max_ave_grain_size(df)
-
+    _extension("plotly")
+    snapshot = StudySnapshot.of(ps)
+    _poll(snapshot, poll_period)
     (
         ht_select,
         lt_select,
@@ -68,7 +106,8 @@ def ave_grain_size_plot(ps: ParametricStudy):
         ra_select,
         hs_select,
         sw_select,
-    ) = _common_controls(df)
+        selection,
+    ) = _common_controls(snapshot, __slice_index)
     col1 = pn.Column(
         lt_select,
         ht_select,
@@ -79,20 +118,21 @@ def ave_grain_size_plot(ps: ParametricStudy):
         sw_select,
         width=200,
     )
-    plot_view = pn.bind(
+    plot_view = _plotly_pane(
         __update_plot,
-        df,
-        ht_select,
-        lt_select,
-        bd_select,
-        sa_select,
-        ra_select,
-        hs_select,
-        sw_select,
+        snapshot,
+        _version(snapshot, selection),
+        selection.param.value,
+        webgl,
+        max_labels,
+        background=background,
+        name=ave_grain_size_plot.__name__,
+        sizing_mode="stretch_both",
+        min_height=600,
     )
     plot = pn.Row(
         col1,
-        pn.pane.Plotly(plot_view, sizing_mode="stretch_both", min_height=600),
+        plot_view,
         sizing_mode="stretch_both",
     ).servable()
     if os.getenv("GENERATING_DOCS"):
@@ -102,19 +142,65 @@ def ave_grain_size_plot(ps: ParametricStudy):
     return plot
 
 
-def __data_frame(ps: ParametricStudy) -> pd.DataFrame:
-    df = ps.data_frame()
-    df = df[
-        (df[ColumnNames.TYPE] == SimulationType.MICROSTRUCTURE)
-        & (df[ColumnNames.STATUS] == SimulationStatus.COMPLETED)
-    ]
-    # convert build rate from m^3/s to mm^3/s
-    df.loc[:, ColumnNames.BUILD_RATE] *= 1e9
-    return df
+def __slice_index(snapshot: StudySnapshot) -> _SliceIndex:
+    @metrics.timed("index", plot=ave_grain_size_plot.__name__)
+    def create():
+        query = snapshot.query(SimulationType.MICROSTRUCTURE, _COLUMNS)
+        if query is None:
+            return _SliceIndex(__data_frame(snapshot))
+        return _QuerySliceIndex(query)
+
+    return snapshot.cached((ave_grain_size_plot.__name__, _SliceIndex), create)
+
 
+def __data_frame(snapshot: StudySnapshot) -> pd.DataFrame:
+    return snapshot.simulations(SimulationType.MICROSTRUCTURE, _COLUMNS)
 
+
+@profiler.profiled(ave_grain_size_plot.__name__)
 def __update_plot(
-    df: pd.DataFrame,
+    snapshot: StudySnapshot, version: int, values: tuple, webgl: bool | None, max_labels: int
+) -> go.Figure:
+    return figure_cache.get_or_create(
+        (snapshot.key, ave_grain_size_plot.__name__, *values, webgl, max_labels),
+        lambda: __figure(
+            __slice_index(snapshot),
+            __min_max_ave_grain_size(snapshot),
+            *values,
+            webgl,
+            max_labels,
+        ),
+    )
+
+
+def _warm(snapshot: StudySnapshot):
+    """Compute the figure of the default slice, as displayed by a new plot."""
+    values = _default_selection(__slice_index(snapshot))
+    __update_plot(snapshot, snapshot.version, values, None, _MAX_LABELS)
+
+
+def _export_slices(snapshot: StudySnapshot) -> Iterator[tuple[dict, tuple, pd.DataFrame]]:
+    """Get the slices written by :func:`.export.export_slices`.
+
+    Each slice is described by its parameter values, the arguments of
+    :func:`_export_figure`, and the rows the figure is computed from.
+    """
+    index = __slice_index(snapshot)
+    ags_range = __min_max_ave_grain_size(snapshot)
+    for values in index.slices():
+        rows = index.take(*values, columns=_COLUMNS)
+        yield dict(zip(index.columns, values)), (ags_range, *values), rows
+
+
+def _export_figure(snapshot: StudySnapshot, args: tuple) -> go.Figure:
+    """Create the figure of a slice returned by :func:`_export_slices`."""
+    return __figure(__slice_index(snapshot), *args)
+
+
+@metrics.timed("figure", plot=ave_grain_size_plot.__name__)
+def __figure(
+    index: _SliceIndex,
+    ags_range: tuple[float | None, float | None],
     ht: float,
     lt: float,
     bd: float,
@@ -122,9 +208,10 @@ def __update_plot(
     ra: float,
     hs: float,
     sw: float,
-) -> dict:
-    global min_ags, max_ags
-
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
+) -> go.Figure:
+    min_ags, max_ags = ags_range
     fig = make_subplots(
         rows=1,
         cols=3,
@@ -136,31 +223,37 @@ def __update_plot(
         vertical_spacing=0.11,
     )
 
-    x, y, xy, xz, yz = __scatter_data(df, ht, lt, bd, sa, ra, hs, sw)
+    x, y, xy, xz, yz = __scatter_data(index, ht, lt, bd, sa, ra, hs, sw)
 
-    xy_scatter = go.Scatter(
-        x=x,
-        y=y,
-        mode="markers+text",
-        text=[f"{z:.2f}" for z in xy],  # noqa: E231
+    xy_scatter = _scatter(
+        x,
+        y,
+        xy,
+        "%{customdata:.2f}",
+        webgl,
+        max_labels,
         textposition="top center",
         marker=dict(color="darkred", size=__normalized_markers(xy, min_ags, max_ags)),
         cliponaxis=False,
     )
-    xz_scatter = go.Scatter(
-        x=x,
-        y=y,
-        mode="markers+text",
-        text=[f"{z:.2f}" for z in xz],  # noqa: E231
+    xz_scatter = _scatter(
+        x,
+        y,
+        xz,
+        "%{customdata:.2f}",
+        webgl,
+        max_labels,
         textposition="top center",
         marker=dict(color="darkorchid", size=__normalized_markers(xz, min_ags, max_ags)),
         cliponaxis=False,
     )
-    yz_scatter = go.Scatter(
-        x=x,
-        y=y,
-        mode="markers+text",
-        text=[f"{z:.2f}" for z in yz],  # noqa: E231
+    yz_scatter = _scatter(
+        x,
+        y,
+        yz,
+        "%{customdata:.2f}",
+        webgl,
+        max_labels,
         textposition="top center",
         marker=dict(color="steelblue", size=__normalized_markers(yz, min_ags, max_ags)),
         cliponaxis=False,
@@ -194,13 +287,13 @@ def __update_plot(
 
 
 def __normalized_markers(
-    x: list[float], v_min: float, v_max: float, m_min: float = 5, m_max: float = 18
-) -> list:
-    """Normalize a list of values and map them to a range of marker values.
+    x: np.ndarray, v_min: float, v_max: float, m_min: float = 5, m_max: float = 18
+) -> np.ndarray:
+    """Normalize an array of values and map them to a range of marker values.
 
     Parameters
     ----------
-    x: list[float]
+    x: np.ndarray
         Values to normalize.
     v_min: float
         Minimum input value to map to minimum output value.
@@ -213,63 +306,59 @@ def __normalized_markers(
 
     Returns
     -------
-    list[float]
+    np.ndarray
         Normalized values.
     """
-    if not x:
-        return []
+    x = np.asarray(x, dtype=float)
+    if len(x) == 0:
+        return x
     range = v_max - v_min
     if range == 0:
-        return [m_max for _ in x]
+        return np.full(len(x), float(m_max))
     scale_factor = m_max - m_min
-    normalized = []
-    for i in x:
-        temp = (((i - v_min) * scale_factor) / range) + m_min
-        normalized.append(temp)
-    return normalized
+    return ((x - v_min) * scale_factor) / range + m_min
 
 
 def __scatter_data(
-    df: pd.DataFrame, ht: float, lt: float, bd: float, sa: float, ra: float, hs: float, sw: float
-) -> tuple[list[float], list[float], list[float], list[float], list[float]]:
-    idx = df[
-        (df[ColumnNames.LAYER_THICKNESS] == lt)
-        & (df[ColumnNames.BEAM_DIAMETER] == bd)
-        & (df[ColumnNames.HEATER_TEMPERATURE] == ht)
-        & (df[ColumnNames.START_ANGLE] == sa)
-        & (df[ColumnNames.ROTATION_ANGLE] == ra)
-        & (df[ColumnNames.HATCH_SPACING] == hs)
-        & (df[ColumnNames.STRIPE_WIDTH] == sw)
-    ].index
-
-    df = df.loc[
-        idx,
-        [
+    index: _SliceIndex, ht: float, lt: float, bd: float, sa: float, ra: float, hs: float, sw: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    df = index.take(
+        ht,
+        lt,
+        bd,
+        sa,
+        ra,
+        hs,
+        sw,
+        columns=[
             ColumnNames.LASER_POWER,
             ColumnNames.SCAN_SPEED,
             ColumnNames.XY_AVERAGE_GRAIN_SIZE,
             ColumnNames.XZ_AVERAGE_GRAIN_SIZE,
             ColumnNames.YZ_AVERAGE_GRAIN_SIZE,
         ],
-    ]
+    )
     df.sort_values(
         by=[ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED],
         inplace=True,
     )
     return (
-        df[ColumnNames.SCAN_SPEED].tolist(),
-        df[ColumnNames.LASER_POWER].tolist(),
-        df[ColumnNames.XY_AVERAGE_GRAIN_SIZE].tolist(),
-        df[ColumnNames.XZ_AVERAGE_GRAIN_SIZE].tolist(),
-        df[ColumnNames.YZ_AVERAGE_GRAIN_SIZE].tolist(),
+        _values(df, ColumnNames.SCAN_SPEED),
+        _values(df, ColumnNames.LASER_POWER),
+        _values(df, ColumnNames.XY_AVERAGE_GRAIN_SIZE),
+        _values(df, ColumnNames.XZ_AVERAGE_GRAIN_SIZE),
+        _values(df, ColumnNames.YZ_AVERAGE_GRAIN_SIZE),
     )
 
 
-def __min_max_ave_grain_size(df: pd.DataFrame) -> tuple[float | None, float | None]:
-    xy = df[ColumnNames.XY_AVERAGE_GRAIN_SIZE].to_list()
-    xz = df[ColumnNames.XZ_AVERAGE_GRAIN_SIZE].to_list()
-    yz = df[ColumnNames.YZ_AVERAGE_GRAIN_SIZE].to_list()
-    all = xy + xz + yz
-    min_ags = min(all) if len(all) > 0 else None
-    max_ags = max(all) if len(all) > 0 else None
-    return (min_ags, max_ags)
+def __min_max_ave_grain_size(snapshot: StudySnapshot) -> tuple[float | None, float | None]:
+    return snapshot.cached(
+        (ave_grain_size_plot.__name__, "ave_grain_size_range"),
+        lambda: __slice_index(snapshot).range(
+            [
+                ColumnNames.XY_AVERAGE_GRAIN_SIZE,
+                ColumnNames.XZ_AVERAGE_GRAIN_SIZE,
+                ColumnNames.YZ_AVERAGE_GRAIN_SIZE,
+            ]
+        ),
+    )
@@ -0,0 +1,228 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a bounded least recently used cache for plot figures."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Any, Callable, Hashable
+
+import numpy as np
+
+from .metrics import metrics
+
+
+class FigureCache:
+    """Least recently used cache for plot figures and plot data.
+
+    Keys are tuples whose first element identifies the study version the value
+    was computed from, for example ``(snapshot.key, plot_name, *widget_values)``.
+    Keys must only hold plain hashable values, such as numbers and strings,
+    and never objects that own study data. All entries of a study version
+    can be dropped with :meth:`invalidate`.
+
+    The cache is bounded by both the number of entries and an estimate
+    of the memory used by the cached values. When either bound is exceeded,
+    the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    max_entries : int, default: 128
+        Maximum number of cached entries.
+    max_bytes : int, default: 256 MiB
+        Maximum estimated memory used by the cached values, in bytes.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 256 * 2**20):
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of cached entries."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int):
+        with self._lock:
+            self._max_entries = value
+            self._evict()
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum estimated memory used by the cached values, in bytes."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that found a cached value."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that did not find a cached value."""
+        return self._misses
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory used by the cached values, in bytes."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        """Get a cached value and mark it as most recently used.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the value.
+        default : Any, default: None
+            Value to return if the key is not cached.
+
+        Returns
+        -------
+        Any
+            Cached value or ``default``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if metrics.enabled:
+                # Keys of plot figures start with the study version and the plot name.
+                plot = key[1] if len(key) > 1 and isinstance(key[1], str) else None
+                result = "miss" if entry is None else "hit"
+                metrics.increment("cache_lookups_total", plot=plot, result=result)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, value: Any):
+        """Cache a value, evicting least recently used entries if necessary.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the value.
+        value : Any
+            Value to cache.
+        """
+        nbytes = _nbytes(value)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+
+    def get_or_create(self, key: tuple, create: Callable[[], Any]) -> Any:
+        """Get a cached value, creating and caching it if it is not cached.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the value.
+        create : Callable[[], Any]
+            Function that creates the value.
+
+        Returns
+        -------
+        Any
+            Cached or created value.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = create()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, version: Hashable | None = None):
+        """Remove the entries of a study version.
+
+        Parameters
+        ----------
+        version : Hashable, default: None
+            Study version, that is the first element of the keys to remove.
+            If ``None``, all entries are removed.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if version is None or k[0] == version]:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+        with self._lock:
+            self.invalidate()
+            self._hits = 0
+            self._misses = 0
+
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._nbytes > self._max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+
+
+_MISSING = object()
+
+# Cache shared by all plots.
+figure_cache = FigureCache()
+
+
+def _nbytes(value: Any) -> int:
+    """Estimate the memory used by a value, in bytes.
+
+    Plotly figures are estimated from their trace data. Layouts are small
+    and mostly shared between the figures of a plot, so they are ignored.
+    """
+    if hasattr(value, "to_plotly_json"):
+        return sum(_nbytes(trace.to_plotly_json()) for trace in value.data)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return 8 * len(value) + sum(_nbytes(v) for v in value)
+    return 8
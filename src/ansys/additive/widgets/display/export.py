@@ -0,0 +1,372 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a headless export of the plots of every slice of a parametric study.
+
+The export can also be run from the command line, for example::
+
+    python -m ansys.additive.widgets.display.export study.ps report --format png html
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import pathlib
+from typing import Any, Callable, Sequence
+import warnings
+
+from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from ansys.additive.widgets import __version__
+
+from ._query import BACKENDS
+from .snapshot import StudySnapshot
+
+# Plots that can be exported.
+PLOTS = [
+    "porosity_contour_plot",
+    "porosity_eval_plot",
+    "single_bead_eval_plot",
+    "ave_grain_size_plot",
+]
+
+# Export formats and the functions writing a figure to a file of each format.
+FORMATS: dict[str, Callable[[go.Figure, pathlib.Path], None]] = {
+    "png": lambda fig, path: fig.write_image(path),
+    "html": lambda fig, path: pio.write_html(
+        __typed_arrays(fig), path, include_plotlyjs=True, validate=False
+    ),
+    "json": lambda fig, path: pio.write_json(__typed_arrays(fig), path, validate=False),
+}
+
+# Name of the file recording the inputs of the exported files.
+MANIFEST = "export-manifest.json"
+
+# Short names of the process parameters in file names.
+_SHORT_NAMES = {
+    ColumnNames.HEATER_TEMPERATURE: "ht",
+    ColumnNames.LAYER_THICKNESS: "lt",
+    ColumnNames.BEAM_DIAMETER: "bd",
+    ColumnNames.START_ANGLE: "sa",
+    ColumnNames.ROTATION_ANGLE: "ra",
+    ColumnNames.HATCH_SPACING: "hs",
+    ColumnNames.STRIPE_WIDTH: "sw",
+}
+
+# Plotly typed array types of NumPy types.
+_TYPED_ARRAY_TYPES = {
+    np.dtype(np.float64): "f8",
+    np.dtype(np.float32): "f4",
+    np.dtype(np.int32): "i4",
+    np.dtype(np.uint32): "u4",
+    np.dtype(np.int16): "i2",
+    np.dtype(np.uint16): "u2",
+    np.dtype(np.int8): "i1",
+    np.dtype(np.uint8): "u1",
+}
+
+# Number of slices written by each task of the process pool.
+_CHUNK_SIZE = 16
+
+# Snapshot of the exported study in a worker process.
+_worker_snapshot: StudySnapshot | None = None
+
+
+def export_slices(
+    ps: ParametricStudy | StudySnapshot,
+    directory: str | os.PathLike,
+    plots: Sequence[str] | None = None,
+    formats: Sequence[str] = ("html",),
+    processes: int | None = None,
+    force: bool = False,
+) -> list[pathlib.Path]:
+    """Write the plot of every slice of a parametric study to files.
+
+    A slice is an existing combination of the process parameters selected
+    with the controls of a plot. Each slice is plotted as it is displayed
+    initially by the interactive plot, and the single bead plot is written
+    once per melt pool parameter of interest. Files are written to
+    ``<directory>/<plot>/<slice>.<format>``, where the slice name is made of
+    the short names and values of its parameters, for example
+    ``ht80_lt3e-05_bd0.0001``.
+
+    The inputs of each written file are recorded in a manifest in the
+    directory. A file whose inputs have not changed since it was written is
+    not written again.
+
+    Parameters
+    ----------
+    ps : ParametricStudy, StudySnapshot
+        Parametric study to export.
+    directory : str, os.PathLike
+        Directory to write the files to. It is created if it does not exist.
+    plots : Sequence[str], default: None
+        Names of the plots to export, see :data:`PLOTS`. If ``None``, all plots
+        are exported. Plots without enough data are skipped with a warning.
+    formats : Sequence[str], default: ("html",)
+        Formats of the files: ``"png"``, ``"html"`` for standalone HTML
+        pages, or ``"json"`` for Plotly figure JSON. Writing PNG files
+        requires the ``kaleido`` package.
+    processes : int, default: None
+        Number of worker processes building the figures. If ``None``, the
+        number of CPUs is used. If ``1``, figures are built in this process.
+    force : bool, default: False
+        Whether to write all files even if their inputs have not changed.
+
+    Returns
+    -------
+    list[pathlib.Path]
+        Paths of the written files.
+    """
+    plots = PLOTS if plots is None else list(plots)
+    for name in plots:
+        if name not in PLOTS:
+            raise ValueError(f"Unknown plot {name!r}, expected one of {PLOTS}.")
+    for format in formats:
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}, expected one of {list(FORMATS)}.")
+    if "png" in formats and importlib.util.find_spec("kaleido") is None:
+        raise ImportError(
+            "Writing PNG files requires the kaleido package. "
+            "Install it with 'pip install ansys-additive-widgets[export]'."
+        )
+    snapshot = StudySnapshot.of(ps)
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = __read_manifest(directory)
+
+    chunks = []
+    for name in plots:
+        tasks = __tasks(snapshot, name, formats, manifest, directory, force)
+        for i in range(0, len(tasks), _CHUNK_SIZE):
+            chunks.append((name, tasks[i : i + _CHUNK_SIZE]))
+
+    written = []
+    try:
+        if processes == 1 or len(chunks) <= 1:
+            for name, tasks in chunks:
+                written += __write(snapshot, name, tasks, directory)
+                manifest.update(__manifest_entries(tasks))
+        else:
+            # Workers read the study file like the snapshot does, or get a
+            # copy of the loaded study.
+            study = snapshot.study if snapshot.loaded else snapshot.file_name
+            with ProcessPoolExecutor(
+                processes, initializer=_init_worker, initargs=(study, snapshot.backend)
+            ) as executor:
+                futures = {
+                    executor.submit(_export_chunk, name, tasks, str(directory)): tasks
+                    for name, tasks in chunks
+                }
+                for future in as_completed(futures):
+                    written += future.result()
+                    manifest.update(__manifest_entries(futures[future]))
+    finally:
+        # Record the files written so far, so that they are not written again.
+        __write_manifest(directory, manifest)
+    return [directory / path for path in written]
+
+
+def _init_worker(study: ParametricStudy | str | os.PathLike, backend: str = "pandas"):
+    """Initialize a worker process of the export."""
+    global _worker_snapshot
+    # A loaded study is copied to the worker rather than loaded from its
+    # file, since loading a study may modify it.
+    _worker_snapshot = StudySnapshot(study, backend)
+
+
+def _export_chunk(name: str, tasks: list, directory: str) -> list[str]:
+    """Write the files of slices of a plot in a worker process."""
+    return __write(_worker_snapshot, name, tasks, pathlib.Path(directory))
+
+
+def __tasks(
+    snapshot: StudySnapshot,
+    name: str,
+    formats: Sequence[str],
+    manifest: dict[str, str],
+    directory: pathlib.Path,
+    force: bool,
+) -> list[tuple[tuple, str, list[str]]]:
+    """Get the figure arguments, inputs digest, and file paths of the slices to write."""
+    module = importlib.import_module(f"{__package__}.{name}")
+    try:
+        slices = list(module._export_slices(snapshot))
+    except ValueError as e:
+        warnings.warn(f"Skipping {name}: {e}")
+        return []
+    tasks = []
+    for fields, args, rows in slices:
+        digest = __digest(name, args, rows)
+        stem = __file_stem(fields)
+        paths = [
+            path
+            for path in (f"{name}/{stem}.{format}" for format in formats)
+            if force or manifest.get(path) != digest or not (directory / path).is_file()
+        ]
+        if paths:
+            tasks.append((args, digest, paths))
+    return tasks
+
+
+def __write(snapshot: StudySnapshot, name: str, tasks: list, directory: pathlib.Path) -> list[str]:
+    module = importlib.import_module(f"{__package__}.{name}")
+    written = []
+    for args, _, paths in tasks:
+        fig = module._export_figure(snapshot, args)
+        for path in paths:
+            file = directory / path
+            file.parent.mkdir(parents=True, exist_ok=True)
+            FORMATS[file.suffix[1:]](fig, file)
+            written.append(path)
+    return written
+
+
+def __typed_arrays(fig: go.Figure) -> dict:
+    """Get the JSON of a figure with its numeric arrays as Plotly typed arrays.
+
+    A typed array holds the base64 encoded binary values of an array, which
+    is smaller and faster to write and to parse than the decimal values.
+    """
+    return __encode(fig.to_plotly_json())
+
+
+def __encode(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: __encode(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [__encode(v) for v in value]
+    if isinstance(value, np.ndarray) and value.dtype.kind in "iuf" and value.ndim <= 3:
+        if value.dtype.newbyteorder("=") not in _TYPED_ARRAY_TYPES:
+            value = value.astype(np.float64)
+        # Typed arrays are little endian and in row-major order, whatever the
+        # layout of the array, for example a transposed grid.
+        value = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder("<"))
+        spec = {
+            "dtype": _TYPED_ARRAY_TYPES[value.dtype.newbyteorder("=")],
+            "bdata": base64.b64encode(value).decode(),
+        }
+        if value.ndim > 1:
+            spec["shape"] = ",".join(map(str, value.shape))
+        return spec
+    return value
+
+
+def __digest(name: str, args: tuple, rows: pd.DataFrame) -> str:
+    """Get a digest of the inputs of the figure of a slice."""
+    digest = hashlib.sha256(repr((__version__, name, args, list(rows.columns))).encode())
+    digest.update(pd.util.hash_pandas_object(rows, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def __file_stem(fields: dict[str, Any]) -> str:
+    parts = []
+    for key, value in fields.items():
+        if key in _SHORT_NAMES:
+            value = "none" if value is None else f"{value:.10g}"  # noqa: E231
+            parts.append(_SHORT_NAMES[key] + value)
+        else:
+            parts.append(str(value))
+    return "_".join(parts)
+
+
+def __manifest_entries(tasks: list) -> dict[str, str]:
+    return {path: digest for _, digest, paths in tasks for path in paths}
+
+
+def __read_manifest(directory: pathlib.Path) -> dict[str, str]:
+    try:
+        return json.loads((directory / MANIFEST).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def __write_manifest(directory: pathlib.Path, manifest: dict[str, str]):
+    (directory / MANIFEST).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the export from the command line.
+
+    Parameters
+    ----------
+    argv : Sequence[str], default: None
+        Command line arguments. If ``None``, the arguments of the process are used.
+
+    Returns
+    -------
+    int
+        Exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ansys.additive.widgets.display.export",
+        description="Write the plot of every slice of a parametric study to files.",
+    )
+    parser.add_argument("study", help="parametric study file")
+    parser.add_argument("directory", help="directory to write the files to")
+    parser.add_argument(
+        "--plot", nargs="+", choices=PLOTS, dest="plots", help="plots to export (default: all)"
+    )
+    parser.add_argument(
+        "--format",
+        nargs="+",
+        choices=list(FORMATS),
+        default=["html"],
+        dest="formats",
+        help="formats of the files (default: html)",
+    )
+    parser.add_argument(
+        "--processes", type=int, help="number of worker processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="pandas",
+        help="query backend reading the study file (default: pandas)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="write files even if their inputs have not changed"
+    )
+    args = parser.parse_args(argv)
+    written = export_slices(
+        StudySnapshot(args.study, args.backend),
+        args.directory,
+        plots=args.plots,
+        formats=args.formats,
+        processes=args.processes,
+        force=args.force,
+    )
+    print(f"Wrote {len(written)} files to {args.directory}.")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,447 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides timing and size metrics of the display widgets.
+
+The widgets record how long each stage of an update takes, how many bytes
+of figure data are sent to the browser, and how often cached figures are
+reused. Stages nest: for example, the ``figure`` stage of a plot includes
+its ``grid`` stage. The stages are:
+
+- ``read``: reading the simulations of a study or study file.
+- ``select``: filtering and projecting the simulations of a plot.
+- ``index``: building the slice index of a plot.
+- ``grid``: computing the contour grid of a slice.
+- ``figure``: building the figure of a slice.
+- ``update``: getting the figure of a slice, from the figure cache or by building it.
+- ``patch``: comparing the new figure with the displayed one and sending
+  the differences to the browser.
+- ``edit``: applying an edit made in the table to the study.
+
+Metrics are off by default and cost a single attribute check per stage
+while off. Turn them on with :meth:`Metrics.enable`, or by setting the
+``ANSYS_ADDITIVE_WIDGETS_METRICS`` environment variable to ``1`` before
+the widgets are imported. Serve them in the Prometheus text format with
+:meth:`Metrics.serve`, for example in the script of a ``panel serve`` app,
+or with the ``--metrics`` option of :mod:`ansys.additive.widgets.serve`.
+"""
+from __future__ import annotations
+
+import bisect
+import contextlib
+import functools
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import math
+import os
+import threading
+import time
+from typing import Any, Callable
+
+import pandas as pd
+
+# Prefix of the names of the metrics in the Prometheus text format.
+_PREFIX = "ansys_additive_widgets_"
+# Upper bounds of the histogram buckets of each metric.
+_BUCKETS = {
+    "stage_seconds": (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    ),
+    "payload_bytes": tuple(float(4**n) for n in range(5, 14)),
+}
+_HELP = {
+    "stage_seconds": "Duration of the stages of widget updates, in seconds.",
+    "payload_bytes": "Size of the figure data sent to the browser, in bytes.",
+    "cache_lookups_total": "Lookups of the figure cache by plot and result.",
+}
+
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets.
+
+    Parameters
+    ----------
+    buckets : tuple[float, ...]
+        Sorted upper bounds of the buckets. A last bucket without upper
+        bound is added.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self._buckets = tuple(buckets) + (math.inf,)
+        self._counts = [0] * len(self._buckets)
+        self._sum = 0.0
+
+    @property
+    def buckets(self) -> tuple[float, ...]:
+        """Upper bounds of the buckets."""
+        return self._buckets
+
+    @property
+    def counts(self) -> list[int]:
+        """Number of values at most the upper bound of each bucket."""
+        counts, total = [], 0
+        for count in self._counts:
+            total += count
+            counts.append(total)
+        return counts
+
+    @property
+    def count(self) -> int:
+        """Number of observed values."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Sum of the observed values."""
+        return self._sum
+
+    def observe(self, value: float):
+        """Add a value to the histogram."""
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile of the observed values.
+
+        The quantile is interpolated linearly within its bucket, as Prometheus does.
+        NaN is returned if no value was observed.
+        """
+        counts = self.counts
+        if not counts[-1]:
+            return math.nan
+        rank = q * counts[-1]
+        i = bisect.bisect_left(counts, rank)
+        if i == len(self._buckets) - 1:
+            # The last bucket has no upper bound.
+            return self._buckets[-2]
+        lower = self._buckets[i - 1] if i else 0.0
+        below = counts[i - 1] if i else 0
+        in_bucket = counts[i] - below
+        if not in_bucket:
+            return lower
+        return lower + (self._buckets[i] - lower) * (rank - below) / in_bucket
+
+
+class Metrics:
+    """Registry of the metrics recorded by the display widgets.
+
+    Values are recorded with labels, such as the stage and the plot, and
+    aggregated into a histogram or counter per metric name and labels.
+    The registry can be used from several threads.
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, tuple], Histogram] = {}
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._servers: dict[tuple[str, int], ThreadingHTTPServer] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether metrics are recorded."""
+        return self._enabled
+
+    def enable(self, enabled: bool = True):
+        """Turn the recording of metrics on or off.
+
+        Parameters
+        ----------
+        enabled : bool, default: True
+            Whether to record metrics.
+        """
+        self._enabled = enabled
+
+    def timer(self, stage: str, **labels: str):
+        """Time a stage of a widget update.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        **labels : str
+            Other labels of the duration, such as the plot.
+
+        Returns
+        -------
+        contextlib.AbstractContextManager
+            Context manager recording the time spent in its block.
+        """
+        if not self._enabled:
+            return _NO_TIMER
+        return _Timer(self, {"stage": stage, **labels})
+
+    def timed(self, stage: str, **labels: str) -> Callable[[Callable], Callable]:
+        """Time the calls of a function as a stage of widget updates.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        **labels : str
+            Other labels of the duration, such as the plot.
+
+        Returns
+        -------
+        Callable[[Callable], Callable]
+            Decorator of the function.
+        """
+
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def timed(*args, **kwargs):
+                if not self._enabled:
+                    return function(*args, **kwargs)
+                with _Timer(self, {"stage": stage, **labels}):
+                    return function(*args, **kwargs)
+
+            return timed
+
+        return decorator
+
+    def observe(self, name: str, value: float, **labels: str):
+        """Add a value to the histogram of a metric.
+
+        Nothing is recorded if metrics are off.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric, for example ``"payload_bytes"``.
+        value : float
+            Observed value.
+        **labels : str
+            Labels of the value. Labels whose value is ``None`` are ignored.
+        """
+        if not self._enabled:
+            return
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(_BUCKETS[name])
+            histogram.observe(value)
+
+    def increment(self, name: str, value: float = 1, **labels: str):
+        """Increment the counter of a metric.
+
+        Nothing is recorded if metrics are off.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric, for example ``"cache_lookups_total"``.
+        value : float, default: 1
+            Increment.
+        **labels : str
+            Labels of the counter. Labels whose value is ``None`` are ignored.
+        """
+        if not self._enabled:
+            return
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def histograms(self) -> dict[tuple[str, tuple[tuple[str, str], ...]], Histogram]:
+        """Get the histograms recorded so far, by metric name and sorted labels."""
+        with self._lock:
+            return dict(self._histograms)
+
+    def counters(self) -> dict[tuple[str, tuple[tuple[str, str], ...]], float]:
+        """Get the counters recorded so far, by metric name and sorted labels."""
+        with self._lock:
+            return dict(self._counters)
+
+    def summary(self) -> pd.DataFrame:
+        """Summarize the histograms recorded so far.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per metric name and labels, with the labels as columns,
+            followed by the number of values, their sum and mean, and
+            estimates of their median and 95th percentile.
+        """
+        rows = []
+        for (name, labels), histogram in sorted(self.histograms().items()):
+            rows.append(
+                {
+                    "metric": name,
+                    **dict(labels),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.sum / histogram.count,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def clear(self):
+        """Remove all recorded values."""
+        with self._lock:
+            self._histograms = {}
+            self._counters = {}
+
+    def to_prometheus(self) -> str:
+        """Get the metrics in the Prometheus text exposition format.
+
+        The state of the figure cache is included as gauges and counters.
+
+        Returns
+        -------
+        str
+            Metrics in the Prometheus text format.
+        """
+        from .cache import figure_cache
+
+        lines = []
+        histograms = self.histograms()
+        for name in sorted({name for name, _ in histograms}):
+            lines += [f"# HELP {_PREFIX}{name} {_HELP[name]}", f"# TYPE {_PREFIX}{name} histogram"]
+            for (other, labels), histogram in sorted(histograms.items()):
+                if other != name:
+                    continue
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(f"{_PREFIX}{name}_bucket{_format(labels + (('le', le),))} {count}")
+                lines.append(f"{_PREFIX}{name}_sum{_format(labels)} {histogram.sum!r}")
+                lines.append(f"{_PREFIX}{name}_count{_format(labels)} {histogram.count}")
+        counters = self.counters()
+        for name in sorted({name for name, _ in counters}):
+            lines += [f"# HELP {_PREFIX}{name} {_HELP[name]}", f"# TYPE {_PREFIX}{name} counter"]
+            for (other, labels), value in sorted(counters.items()):
+                if other == name:
+                    lines.append(f"{_PREFIX}{name}{_format(labels)} {value!r}")
+        for name, kind, value, help in [
+            ("figure_cache_hits_total", "counter", figure_cache.hits, "Figure cache hits."),
+            ("figure_cache_misses_total", "counter", figure_cache.misses, "Figure cache misses."),
+            ("figure_cache_entries", "gauge", len(figure_cache), "Cached figures."),
+            ("figure_cache_bytes", "gauge", figure_cache.nbytes, "Estimated cache memory."),
+        ]:
+            lines += [
+                f"# HELP {_PREFIX}{name} {help}",
+                f"# TYPE {_PREFIX}{name} {kind}",
+                f"{_PREFIX}{name} {value}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, address: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve the metrics in the Prometheus text format over HTTP.
+
+        The metrics are served at any path by a server running in a daemon
+        thread, and metrics are turned on. Serving again on the same
+        address and port returns the running server.
+
+        Parameters
+        ----------
+        port : int
+            Port of the server. If ``0``, a free port is chosen.
+        address : str, default: "127.0.0.1"
+            Address of the server. If empty, all interfaces are used.
+
+        Returns
+        -------
+        http.server.ThreadingHTTPServer
+            Running server. Call its ``shutdown()`` method to stop it.
+        """
+        self.enable()
+        with self._lock:
+            server = self._servers.get((address, port))
+            if server is None:
+                handler = functools.partial(_MetricsHandler, self)
+                server = ThreadingHTTPServer((address, port), handler)
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+                self._servers[(address, port)] = server
+            return server
+
+
+class _Timer:
+    """Context manager recording the duration of a stage."""
+
+    __slots__ = ("_metrics", "_labels", "_start")
+
+    def __init__(self, metrics: Metrics, labels: dict[str, Any]):
+        self._metrics = metrics
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._metrics.observe("stage_seconds", time.perf_counter() - self._start, **self._labels)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """HTTP request handler serving metrics in the Prometheus text format."""
+
+    def __init__(self, metrics: Metrics, *args, **kwargs):
+        self._metrics = metrics
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):  # noqa: N802
+        body = self._metrics.to_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        # Scrapes are frequent, so they are not logged.
+        pass
+
+
+_NO_TIMER = contextlib.nullcontext()
+
+
+def _labels(labels: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+def _format(labels: tuple[tuple[str, str], ...]) -> str:
+    """Format labels in the Prometheus text format."""
+    if not labels:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+# Metrics recorded by all widgets.
+metrics = Metrics()
+
+if os.getenv("ANSYS_ADDITIVE_WIDGETS_METRICS") == "1":
+    metrics.enable()
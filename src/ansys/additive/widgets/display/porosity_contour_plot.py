@@ -22,9 +22,11 @@
 """Provides a contour plot for relative density and build rate."""
 from __future__ import annotations
 
+from functools import partial
 import os
+from typing import Iterator
 
-from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core import SimulationType
 from ansys.additive.core.misc import short_uuid
 from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
 import numpy as np
@@ -32,26 +34,70 @@ import pandas as pd
 import panel as pn
 import plotly.graph_objects as go
 
-from ._common_controls import _common_controls
+from ._codes import _values
+from ._common_controls import _common_controls, _default_selection
+from ._extension import _extension
+from ._facets import _facet_controls, _facet_figure, _facet_grids, _FacetGrids, _shared_range
+from ._figure_patch import _plotly_pane
+from ._grid import _grid, _grids
+from ._live import _poll, _version
+from ._scatter import _MAX_LABELS, _scatter
+from ._slice_index import _PARAMETER_COLUMNS, _QuerySliceIndex, _SliceIndex
+from .cache import figure_cache
+from .metrics import metrics
+from .profiling import profiler
+from .snapshot import StudySnapshot
 
-# Initialize panel for plotly.
-pn.extension("plotly")
+# Columns used by the plot.
+_COLUMNS = _PARAMETER_COLUMNS + [
+    ColumnNames.LASER_POWER,
+    ColumnNames.SCAN_SPEED,
+    ColumnNames.BUILD_RATE,
+    ColumnNames.RELATIVE_DENSITY,
+]
 
 
-def porosity_contour_plot(ps: ParametricStudy):
+def porosity_contour_plot(
+    ps: ParametricStudy | StudySnapshot,
+    poll_period: float | None = None,
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
+    background: bool = False,
+):
     """Generates a contour plot of build rate and relative density.
 
     Parameters
     ----------
-    ps : ParametricStudy
+    ps : ParametricStudy, StudySnapshot
         Parametric study to plot.
+    poll_period : float, default: None
+        Period, in seconds, at which the study is checked for changes, for
+        example while its simulations run. The plot is updated when the study
+        changes. If ``None``, only changes made through the snapshot of the
+        study, such as edits in the table, update the plot.
+    webgl : bool, default: None
+        Whether to draw the simulation points with WebGL, which is faster for
+        thousands of points. If ``None``, WebGL is used for large slices.
+    max_labels : int, default: 500
+        Maximum number of simulation points labeled with their value. Points
+        of larger slices are not labeled.
+    background : bool, default: False
+        Whether to compute the figure in a background thread when a control
+        changes, so that the other widgets of the session stay responsive
+        while slow slices are computed. The plot shows a loading indicator
+        meanwhile, and the figures of selections changed again before they
+        are shown are dropped. Background computation requires a running
+        event loop, as in a served application or a notebook. Otherwise,
+        the figure is computed before the control change returns.
 
     Returns
     -------
     panel.Row
         Interactive plot.
     """
-    df = __data_frame(ps)
+    _extension("plotly")
+    snapshot = StudySnapshot.of(ps)
+    _poll(snapshot, poll_period)
     (
         ht_select,
         lt_select,
@@ -60,9 +106,12 @@ def porosity_contour_plot(ps: ParametricStudy):
         ra_select,
         hs_select,
         sw_select,
+        selection,
         show_scatter_cb,
         show_contours_cb,
-    ) = __init_controls(df)
+        rows_select,
+        columns_select,
+    ) = __init_controls(snapshot)
     row1 = pn.Column(
         show_scatter_cb,
         show_contours_cb,
@@ -73,24 +122,29 @@ def porosity_contour_plot(ps: ParametricStudy):
         ra_select,
         hs_select,
         sw_select,
+        rows_select,
+        columns_select,
         width=200,
     )
-    plot_view = pn.bind(
+    plot_view = _plotly_pane(
         __update_plot,
-        df,
-        ht_select,
-        lt_select,
-        bd_select,
-        sa_select,
-        ra_select,
-        hs_select,
-        sw_select,
+        snapshot,
+        _version(snapshot, selection),
+        selection.param.value,
         show_scatter_cb,
         show_contours_cb,
+        rows_select,
+        columns_select,
+        webgl,
+        max_labels,
+        background=background,
+        name=porosity_contour_plot.__name__,
+        sizing_mode="stretch_both",
+        min_height=600,
     )
     plot = pn.Row(
         row1,
-        pn.pane.Plotly(plot_view, sizing_mode="stretch_both", min_height=600),
+        plot_view,
         sizing_mode="stretch_both",
     ).servable()
     if os.getenv("GENERATING_DOCS"):
@@ -100,20 +154,35 @@ def porosity_contour_plot(ps: ParametricStudy):
     return plot
 
 
-def __data_frame(ps: ParametricStudy) -> pd.DataFrame:
-    df = ps.data_frame()
-    df = df[
-        (df[ColumnNames.TYPE] == SimulationType.POROSITY)
-        & (df[ColumnNames.STATUS] == SimulationStatus.COMPLETED)
-    ]
+def __slice_index(snapshot: StudySnapshot) -> _SliceIndex:
+    @metrics.timed("index", plot=porosity_contour_plot.__name__)
+    def create():
+        query = snapshot.query(SimulationType.POROSITY, _COLUMNS)
+        if query is None:
+            return _SliceIndex(__data_frame(snapshot))
+        index = _QuerySliceIndex(query, prepare=__prepare)
+        if len(index) < 2:
+            raise ValueError("There are too few data points to plot.")
+        return index
+
+    return snapshot.cached((porosity_contour_plot.__name__, _SliceIndex), create)
+
+
+def __data_frame(snapshot: StudySnapshot) -> pd.DataFrame:
+    df = snapshot.simulations(SimulationType.POROSITY, _COLUMNS)
     if len(df.index) < 2:
         raise ValueError("There are too few data points to plot.")
+    return __prepare(df)
+
+
+def __prepare(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
     # convert build rate from m^3/s to mm^3/s
     df.loc[:, ColumnNames.BUILD_RATE] *= 1e9
     return df
 
 
-def __init_controls(df: pd.DataFrame):
+def __init_controls(snapshot: StudySnapshot):
     (
         ht_select,
         lt_select,
@@ -122,7 +191,8 @@ def __init_controls(df: pd.DataFrame):
         ra_select,
         hs_select,
         sw_select,
-    ) = _common_controls(df)
+        selection,
+    ) = _common_controls(snapshot, __slice_index)
     show_scatter_cb = pn.widgets.Checkbox(
         name="Relative Density Points", sizing_mode="stretch_width"
     ).servable()
@@ -131,6 +201,7 @@ def __init_controls(df: pd.DataFrame):
         name="Relative Density Contours", sizing_mode="stretch_width"
     ).servable()
     show_contours_cb.value = True
+    rows_select, columns_select = _facet_controls(__slice_index(snapshot).columns)
     return (
         ht_select,
         lt_select,
@@ -139,13 +210,71 @@ def __init_controls(df: pd.DataFrame):
         ra_select,
         hs_select,
         sw_select,
+        selection,
         show_scatter_cb,
         show_contours_cb,
+        rows_select,
+        columns_select,
     )
 
 
+@profiler.profiled(porosity_contour_plot.__name__)
 def __update_plot(
-    df: pd.DataFrame,
+    snapshot: StudySnapshot,
+    version: int,
+    values: tuple,
+    show_scatter: bool,
+    show_contours: bool,
+    rows: str | None,
+    columns: str | None,
+    webgl: bool | None,
+    max_labels: int,
+) -> go.Figure:
+    key = (*values, show_scatter, show_contours, webgl, max_labels)
+    if rows is None and columns is None:
+        create = partial(__figure, __slice_index(snapshot), *key)
+    else:
+        create = partial(
+            __facet_figure,
+            __slice_index(snapshot),
+            values,
+            rows,
+            columns,
+            show_scatter,
+            show_contours,
+            webgl,
+        )
+    return figure_cache.get_or_create(
+        (snapshot.key, porosity_contour_plot.__name__, *key, rows, columns), create
+    )
+
+
+def _warm(snapshot: StudySnapshot):
+    """Compute the figure of the default slice, as displayed by a new plot."""
+    values = _default_selection(__slice_index(snapshot))
+    __update_plot(snapshot, snapshot.version, values, True, True, None, None, None, _MAX_LABELS)
+
+
+def _export_slices(snapshot: StudySnapshot) -> Iterator[tuple[dict, tuple, pd.DataFrame]]:
+    """Get the slices written by :func:`.export.export_slices`.
+
+    Each slice is described by its parameter values, the arguments of
+    :func:`_export_figure`, and the rows the figure is computed from.
+    """
+    index = __slice_index(snapshot)
+    for values in index.slices():
+        rows = index.take(*values, columns=_COLUMNS)
+        yield dict(zip(index.columns, values)), (*values, True, True), rows
+
+
+def _export_figure(snapshot: StudySnapshot, args: tuple) -> go.Figure:
+    """Create the figure of a slice returned by :func:`_export_slices`."""
+    return __figure(__slice_index(snapshot), *args)
+
+
+@metrics.timed("figure", plot=porosity_contour_plot.__name__)
+def __figure(
+    index: _SliceIndex,
     ht: float,
     lt: float,
     bd: float,
@@ -155,10 +284,12 @@ def __update_plot(
     sw: float,
     show_scatter: bool,
     show_contours: bool,
-) -> dict:
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
+) -> go.Figure:
     fig = go.Figure()
 
-    x, y, br, rd = __contour_data(df, ht, lt, bd, sa, ra, hs, sw)
+    x, y, br, rd = __contour_data(index, ht, lt, bd, sa, ra, hs, sw)
     br_contour = go.Contour(
         x=x,
         y=y,
@@ -204,12 +335,14 @@ def __update_plot(
     )
     fig.add_trace(rd_contour)
 
-    scatter_x, scatter_y, rd_scatter = __scatter_data(df, ht, lt, bd, sa, ra, hs, sw)
-    scatter = go.Scatter(
-        x=scatter_x,
-        y=scatter_y,
-        mode="markers+text",
-        text=[f"{z:.4f}" for z in rd_scatter],  # noqa: E231
+    scatter_x, scatter_y, rd_scatter = __scatter_data(index, ht, lt, bd, sa, ra, hs, sw)
+    scatter = _scatter(
+        scatter_x,
+        scatter_y,
+        rd_scatter,
+        "%{customdata:.4f}",
+        webgl,
+        max_labels,
         textposition="top center",
         visible=show_scatter,
         marker=dict(color="slategrey", size=5),
@@ -240,110 +373,176 @@ def __update_plot(
     return fig
 
 
+@metrics.timed("figure", plot=porosity_contour_plot.__name__)
+def __facet_figure(
+    index: _SliceIndex,
+    values: tuple,
+    rows: str | None,
+    columns: str | None,
+    show_scatter: bool,
+    show_contours: bool,
+    webgl: bool | None = None,
+) -> go.Figure:
+    facets = __facet_data(index, values, rows, columns)
+    build_rates, relative_densities = facets.grids
+    # Draw the same contour levels in all subplots.
+    br_min, br_max = _shared_range(build_rates)
+    rd_min, rd_max = _shared_range(relative_densities)
+    traces = []
+    for i, (br, rd, points) in enumerate(zip(build_rates, relative_densities, facets.points)):
+        br_contour = go.Contour(
+            x=facets.speeds,
+            y=facets.powers,
+            z=br,
+            zmin=br_min,
+            zmax=br_max,
+            contours=dict(showlabels=True, labelfont=dict(size=10, color="black")),
+            contours_coloring="lines",
+            line=dict(dash="dot", width=2),
+            colorscale="Phase",
+            showscale=i == 0,
+            colorbar=dict(
+                title="Build Rate (mm^3/s)",
+                titlefont=dict(size=12),
+                titleside="right",
+                tickfont=dict(size=12),
+                thickness=20,
+                len=0.25,
+                lenmode="fraction",
+                x=1.08,
+                y=0.2,
+            ),
+            connectgaps=True,
+        )
+        rd_contour = go.Contour(
+            x=facets.speeds,
+            y=facets.powers,
+            z=rd,
+            zmin=rd_min,
+            zmax=rd_max,
+            contours=dict(showlabels=True, labelfont=dict(size=10, color="black")),
+            contours_coloring="lines",
+            line=dict(dash="solid", width=2),
+            colorscale="Rainbow",
+            showscale=i == 0,
+            colorbar=dict(
+                title="Relative Density",
+                titlefont=dict(size=12),
+                titleside="right",
+                thickness=20,
+                tickfont=dict(size=12),
+                len=0.25,
+                lenmode="fraction",
+                x=1.08,
+                y=0.6,
+            ),
+            connectgaps=True,
+            visible=show_contours,
+        )
+        # Labels of many small subplots would overlap, so only hovered points show their value.
+        scatter = _scatter(
+            _values(points, ColumnNames.SCAN_SPEED),
+            _values(points, ColumnNames.LASER_POWER),
+            _values(points, ColumnNames.RELATIVE_DENSITY),
+            "%{customdata:.4f}",
+            webgl,
+            0,
+            hovertemplate="%{customdata:.4f}<extra></extra>",
+            visible=show_scatter,
+            marker=dict(color="slategrey", size=4),
+        )
+        traces.append([br_contour, rd_contour, scatter])
+    x, y = facets.speeds, facets.powers
+    grid = dict(showgrid=True, gridwidth=1, gridcolor="white")
+    return _facet_figure(
+        facets,
+        traces,
+        xaxis=dict(
+            title=dict(text="Scan Speed (m/s)", font=dict(size=12)),
+            range=[min(x) - 0.1, max(x) + 0.1] if len(x) else None,
+            **grid,
+        ),
+        yaxis=dict(
+            title=dict(text="Laser Power (W)", font=dict(size=12)),
+            range=[min(y) - 20, max(y) + 70] if len(y) else None,
+            **grid,
+        ),
+        title_text="Relative Density and Build Rate",
+        showlegend=False,
+    )
+
+
+@metrics.timed("grid", plot=porosity_contour_plot.__name__)
+def __facet_data(
+    index: _SliceIndex, values: tuple, rows: str | None, columns: str | None
+) -> _FacetGrids:
+    """Get the build rate and relative density grids of the subplots of a
+    faceted view."""
+    return index.cached(
+        (_grids, *values, rows, columns),
+        lambda: _facet_grids(
+            index,
+            values,
+            rows,
+            columns,
+            [ColumnNames.BUILD_RATE, ColumnNames.RELATIVE_DENSITY],
+            [ColumnNames.RELATIVE_DENSITY],
+        ),
+    )
+
+
+@metrics.timed("grid", plot=porosity_contour_plot.__name__)
 def __contour_data(
-    df: pd.DataFrame, ht: float, lt: float, bd: float, sa: float, ra: float, hs: float, sw: float
-) -> tuple[list, list, list, list]:
-    """Returns lists of scan speed, laser power, build rate, and relative
+    index: _SliceIndex, ht: float, lt: float, bd: float, sa: float, ra: float, hs: float, sw: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns arrays of scan speed, laser power, build rate, and relative
     density values."""
 
-    idx = df[
-        (df[ColumnNames.LAYER_THICKNESS] == lt)
-        & (df[ColumnNames.BEAM_DIAMETER] == bd)
-        & (df[ColumnNames.HEATER_TEMPERATURE] == ht)
-        & (df[ColumnNames.START_ANGLE] == sa)
-        & (df[ColumnNames.ROTATION_ANGLE] == ra)
-        & (df[ColumnNames.HATCH_SPACING] == hs)
-        & (df[ColumnNames.STRIPE_WIDTH] == sw)
-    ].index
-
-    df = df.loc[
-        idx,
-        [
+    df = index.take(
+        ht,
+        lt,
+        bd,
+        sa,
+        ra,
+        hs,
+        sw,
+        columns=[
             ColumnNames.LASER_POWER,
             ColumnNames.SCAN_SPEED,
             ColumnNames.BUILD_RATE,
             ColumnNames.RELATIVE_DENSITY,
         ],
-    ]
-    df.sort_values(
-        by=[ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED],
-        inplace=True,
     )
-    speeds = df[ColumnNames.SCAN_SPEED].unique()
-    powers = df[ColumnNames.LASER_POWER].unique()
-    build_rate_z = []
-    relative_density_z = []
-    for p in powers:
-        br_row = []
-        rd_row = []
-        for v in speeds:
-            if (
-                len(
-                    df.loc[
-                        (df[ColumnNames.LASER_POWER] == p) & (df[ColumnNames.SCAN_SPEED] == v),
-                        ColumnNames.BUILD_RATE,
-                    ].values
-                )
-                > 0
-            ):
-                br_row.append(
-                    df.loc[
-                        (df[ColumnNames.LASER_POWER] == p) & (df[ColumnNames.SCAN_SPEED] == v),
-                        ColumnNames.BUILD_RATE,
-                    ].values[0]
-                )
-            else:
-                br_row.append(np.nan)
-            if (
-                len(
-                    df.loc[
-                        (df[ColumnNames.LASER_POWER] == p) & (df[ColumnNames.SCAN_SPEED] == v),
-                        ColumnNames.RELATIVE_DENSITY,
-                    ].values
-                )
-                > 0
-            ):
-                rd_row.append(
-                    df.loc[
-                        (df[ColumnNames.LASER_POWER] == p) & (df[ColumnNames.SCAN_SPEED] == v),
-                        ColumnNames.RELATIVE_DENSITY,
-                    ].values[0]
-                )
-            else:
-                rd_row.append(np.nan)
-        build_rate_z.append(br_row)
-        relative_density_z.append(rd_row)
+    speeds, powers, (build_rate_z, relative_density_z) = _grid(
+        df, [ColumnNames.BUILD_RATE, ColumnNames.RELATIVE_DENSITY]
+    )
     return (speeds, powers, build_rate_z, relative_density_z)
 
 
 def __scatter_data(
-    df: pd.DataFrame, ht: float, lt: float, bd: float, sa: float, ra: float, hs: float, sw: float
-) -> tuple[list, list, list]:
-    idx = df[
-        (df[ColumnNames.LAYER_THICKNESS] == lt)
-        & (df[ColumnNames.BEAM_DIAMETER] == bd)
-        & (df[ColumnNames.HEATER_TEMPERATURE] == ht)
-        & (df[ColumnNames.START_ANGLE] == sa)
-        & (df[ColumnNames.ROTATION_ANGLE] == ra)
-        & (df[ColumnNames.HATCH_SPACING] == hs)
-        & (df[ColumnNames.STRIPE_WIDTH] == sw)
-    ].index
-
-    df = df.loc[
-        idx,
-        [
+    index: _SliceIndex, ht: float, lt: float, bd: float, sa: float, ra: float, hs: float, sw: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    df = index.take(
+        ht,
+        lt,
+        bd,
+        sa,
+        ra,
+        hs,
+        sw,
+        columns=[
             ColumnNames.LASER_POWER,
             ColumnNames.SCAN_SPEED,
             ColumnNames.BUILD_RATE,
             ColumnNames.RELATIVE_DENSITY,
         ],
-    ]
+    )
     df.sort_values(
         by=[ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED],
         inplace=True,
     )
     return (
-        df[ColumnNames.SCAN_SPEED].tolist(),
-        df[ColumnNames.LASER_POWER].tolist(),
-        df[ColumnNames.RELATIVE_DENSITY].tolist(),
+        _values(df, ColumnNames.SCAN_SPEED),
+        _values(df, ColumnNames.LASER_POWER),
+        _values(df, ColumnNames.RELATIVE_DENSITY),
     )
@@ -25,8 +25,9 @@ from __future__ import annotations
 
 import math
 import os
+from typing import Iterator
 
-from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core import SimulationType
 from ansys.additive.core.misc import short_uuid
 from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
 import numpy as np
@@ -34,27 +35,76 @@ import pandas as pd
 import panel as pn
 import plotly.graph_objects as go
 
-from ._common_controls import _common_controls
+from ._codes import _values
+from ._common_controls import _common_controls, _default_selection, _range_slider
+from ._extension import _extension
+from ._figure_patch import _plotly_pane
+from ._grid import _grid, _range_scores
+from ._live import _poll, _version
+from ._overview import _overview
+from ._scatter import _MAX_LABELS, _scatter
+from ._slice_index import _PARAMETER_COLUMNS, _QuerySliceIndex, _SliceIndex
+from .cache import figure_cache
+from .metrics import metrics
+from .profiling import profiler
+from .snapshot import StudySnapshot
 
-# global variables
-_range_slider = None
+# Columns used by the plot.
+_COLUMNS = _PARAMETER_COLUMNS + [
+    ColumnNames.LASER_POWER,
+    ColumnNames.SCAN_SPEED,
+    ColumnNames.RELATIVE_DENSITY,
+]
+# Relative density range selected initially.
+_RANGE = (0.85, 1.0)
 
-pn.extension("plotly")
 
-
-def porosity_eval_plot(ps: ParametricStudy):
+def porosity_eval_plot(
+    ps: ParametricStudy | StudySnapshot,
+    poll_period: float | None = None,
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
+    background: bool = False,
+    overview: bool = False,
+):
     """Generate a heat map plot of porosity results to determine parametric regions with desirable relative density statistics.
 
     Parameters
     ----------
-    ps : Parametric study to plot.
+    ps : ParametricStudy, StudySnapshot
+        Parametric study to plot.
+    poll_period : float, default: None
+        Period, in seconds, at which the study is checked for changes, for
+        example while its simulations run. The plot is updated when the study
+        changes. If ``None``, only changes made through the snapshot of the
+        study, such as edits in the table, update the plot.
+    webgl : bool, default: None
+        Whether to draw the simulation points with WebGL, which is faster for
+        thousands of points. If ``None``, WebGL is used for large slices.
+    max_labels : int, default: 500
+        Maximum number of simulation points labeled with their value. Points
+        of larger slices are not labeled.
+    background : bool, default: False
+        Whether to compute the figure in a background thread when a control
+        changes, so that the other widgets of the session stay responsive
+        while slow slices are computed. The plot shows a loading indicator
+        meanwhile, and the figures of selections changed again before they
+        are shown are dropped. Background computation requires a running
+        event loop, as in a served application or a notebook. Otherwise,
+        the figure is computed before the control change returns.
+    overview : bool, default: False
+        Whether to show a table of all slices below the plot, ranked by the
+        fraction of their relative density values inside the selected range.
+        Clicking a slice in the table selects it in the plot.
 
     Returns
     -------
     :class: `panel.Row <panel.Row>`
         Interactive plot.
     """  # noqa
-    df = __data_frame(ps)
+    _extension("plotly")
+    snapshot = StudySnapshot.of(ps)
+    _poll(snapshot, poll_period)
     (
         ht_select,
         lt_select,
@@ -63,11 +113,12 @@ def porosity_eval_plot(ps: ParametricStudy):
         ra_select,
         hs_select,
         sw_select,
-        _range_slider,
-    ) = __init_controls(df)
+        selection,
+        range_slider,
+    ) = __init_controls(snapshot)
     side_bar = pn.Column(
         pn.Spacer(height=50),
-        _range_slider,
+        range_slider,
         lt_select,
         ht_select,
         bd_select,
@@ -77,21 +128,34 @@ def porosity_eval_plot(ps: ParametricStudy):
         sw_select,
         width=200,
     )
-    plot_view = pn.bind(
+    # Moving the range only changes the heat map values, so only they are sent.
+    plot_view = _plotly_pane(
         __update_plot,
-        df,
-        ht_select,
-        lt_select,
-        bd_select,
-        sa_select,
-        ra_select,
-        hs_select,
-        sw_select,
-        _range_slider,
+        snapshot,
+        _version(snapshot, selection),
+        selection.param.value,
+        range_slider.param.value_throttled,
+        webgl,
+        max_labels,
+        background=background,
+        name=porosity_eval_plot.__name__,
+        sizing_mode="stretch_both",
+        min_height=600,
     )
+    if overview:
+        table = _overview(
+            snapshot,
+            __slice_index,
+            ColumnNames.RELATIVE_DENSITY,
+            "Relative density",
+            range_slider,
+            selection,
+            porosity_eval_plot.__name__,
+        )
+        plot_view = pn.Column(plot_view, table, sizing_mode="stretch_both")
     plot = pn.Row(
         side_bar,
-        pn.pane.Plotly(plot_view, sizing_mode="stretch_both", min_height=600),
+        plot_view,
         sizing_mode="stretch_both",
     ).servable()
     if os.getenv("GENERATING_DOCS"):
@@ -101,12 +165,23 @@ def porosity_eval_plot(ps: ParametricStudy):
     return plot
 
 
-def __data_frame(ps: ParametricStudy) -> pd.DataFrame:
-    df = ps.data_frame()
-    df = df[
-        (df[ColumnNames.TYPE] == SimulationType.POROSITY)
-        & (df[ColumnNames.STATUS] == SimulationStatus.COMPLETED)
-    ]
+def __slice_index(snapshot: StudySnapshot) -> _SliceIndex:
+    @metrics.timed("index", plot=porosity_eval_plot.__name__)
+    def create():
+        query = snapshot.query(SimulationType.POROSITY, _COLUMNS)
+        if query is None:
+            return _SliceIndex(__data_frame(snapshot))
+        return _QuerySliceIndex(query, prepare=__prepare)
+
+    return snapshot.cached((porosity_eval_plot.__name__, _SliceIndex), create)
+
+
+def __data_frame(snapshot: StudySnapshot) -> pd.DataFrame:
+    return __prepare(snapshot.simulations(SimulationType.POROSITY, _COLUMNS))
+
+
+def __prepare(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
     df.update(
         df[
             [
@@ -117,9 +192,7 @@ def __data_frame(ps: ParametricStudy) -> pd.DataFrame:
     return df
 
 
-def __init_controls(df: pd.DataFrame):
-    global _range_slider
-
+def __init_controls(snapshot: StudySnapshot):
     (
         ht_select,
         lt_select,
@@ -128,14 +201,14 @@ def __init_controls(df: pd.DataFrame):
         ra_select,
         hs_select,
         sw_select,
-    ) = _common_controls(df)
-    range_end = 1.0
-    _range_slider = pn.widgets.RangeSlider(
+        selection,
+    ) = _common_controls(snapshot, __slice_index)
+    range_slider = _range_slider(
         name="Relative density",
         sizing_mode="stretch_width",
         start=0,
-        end=range_end,
-        value=(0.85 * range_end, 1.0 * range_end),
+        end=1.0,
+        value=_RANGE,
         step=0.01,
         bar_color="green",
     ).servable()
@@ -147,7 +220,8 @@ def __init_controls(df: pd.DataFrame):
         ra_select,
         hs_select,
         sw_select,
-        _range_slider,
+        selection,
+        range_slider,
     )
 
 
@@ -161,9 +235,57 @@ def __contour_colorscale() -> list:
     ]
 
 
-# @pn.cache
+@profiler.profiled(porosity_eval_plot.__name__)
 def __update_plot(
-    df: pd.DataFrame,
+    snapshot: StudySnapshot,
+    version: int,
+    values: tuple,
+    range: tuple[float, float],
+    webgl: bool | None,
+    max_labels: int,
+) -> go.Figure:
+    return __cached_figure(snapshot, values, range, webgl, max_labels)
+
+
+def __cached_figure(
+    snapshot: StudySnapshot,
+    values: tuple,
+    range: tuple[float, float],
+    webgl: bool | None,
+    max_labels: int,
+) -> go.Figure:
+    return figure_cache.get_or_create(
+        (snapshot.key, porosity_eval_plot.__name__, *values, range, webgl, max_labels),
+        lambda: __figure(__slice_index(snapshot), *values, range, webgl, max_labels),
+    )
+
+
+def _warm(snapshot: StudySnapshot):
+    """Compute the figure of the default slice, as displayed by a new plot."""
+    values = _default_selection(__slice_index(snapshot))
+    __cached_figure(snapshot, values, _RANGE, None, _MAX_LABELS)
+
+
+def _export_slices(snapshot: StudySnapshot) -> Iterator[tuple[dict, tuple, pd.DataFrame]]:
+    """Get the slices written by :func:`.export.export_slices`.
+
+    Each slice is described by its parameter values, the arguments of
+    :func:`_export_figure`, and the rows the figure is computed from.
+    """
+    index = __slice_index(snapshot)
+    for values in index.slices():
+        rows = index.take(*values, columns=_COLUMNS)
+        yield dict(zip(index.columns, values)), (*values, _RANGE), rows
+
+
+def _export_figure(snapshot: StudySnapshot, args: tuple) -> go.Figure:
+    """Create the figure of a slice returned by :func:`_export_slices`."""
+    return __figure(__slice_index(snapshot), *args)
+
+
+@metrics.timed("figure", plot=porosity_eval_plot.__name__)
+def __figure(
+    index: _SliceIndex,
     ht: float,
     lt: float,
     bd: float,
@@ -172,10 +294,12 @@ def __update_plot(
     hs: float,
     sw: float,
     range: tuple[float, float],
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
 ) -> go.Figure:
     fig = go.Figure()
 
-    x, y, z = __contour_data(df, ht, lt, bd, sa, ra, hs, sw, range)
+    x, y, z = __contour_data(index, (ht, lt, bd, sa, ra, hs, sw), range)
     contour = go.Heatmap(
         x=x,
         y=y,
@@ -188,12 +312,14 @@ def __update_plot(
     )
     fig.add_trace(contour)
 
-    scatter_x, scatter_y, z_scatter = __scatter_data(df, ht, lt, bd, sa, ra, hs, sw, range)
-    scatter = go.Scatter(
-        x=scatter_x,
-        y=scatter_y,
-        mode="markers+text",
-        text=[f"<b>{z:.2f}</b>" for z in z_scatter],  # noqa: E231
+    scatter_x, scatter_y, z_scatter = __scatter_data(index, ht, lt, bd, sa, ra, hs, sw)
+    scatter = _scatter(
+        scatter_x,
+        scatter_y,
+        z_scatter,
+        "<b>%{customdata:.2f}</b>",
+        webgl,
+        max_labels,
         textposition="top center",
         marker=dict(color="black", size=5),
         cliponaxis=False,
@@ -221,8 +347,20 @@ def __update_plot(
     return fig
 
 
+@metrics.timed("grid", plot=porosity_eval_plot.__name__)
 def __contour_data(
-    df: pd.DataFrame,
+    index: _SliceIndex, values: tuple, range: tuple[float, float]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get arrays of scan speed, laser power, and relative density
+    scores."""
+    speeds, powers, z_vals, z_max = index.cached(
+        (_grid, *values), lambda: __grid_data(index, *values)
+    )
+    return (speeds, powers, _range_scores(z_vals, range, z_max))
+
+
+def __grid_data(
+    index: _SliceIndex,
     ht: float,
     lt: float,
     bd: float,
@@ -230,70 +368,33 @@ def __contour_data(
     ra: float,
     hs: float,
     sw: float,
-    range: tuple[float, float],
-) -> tuple[list, list, list]:
-    """Get lists of scan speed, laser power, and relative density
-    values."""
-
-    idx = df[
-        (df[ColumnNames.LAYER_THICKNESS] == lt)
-        & (df[ColumnNames.BEAM_DIAMETER] == bd)
-        & (df[ColumnNames.HEATER_TEMPERATURE] == ht)
-        & (df[ColumnNames.START_ANGLE] == sa)
-        & (df[ColumnNames.ROTATION_ANGLE] == ra)
-        & (df[ColumnNames.HATCH_SPACING] == hs)
-        & (df[ColumnNames.STRIPE_WIDTH] == sw)
-    ].index
-
-    df = df.loc[
-        idx,
-        [
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Get arrays of scan speed, laser power, and relative density
+    values, and the maximum relative density."""
+
+    df = index.take(
+        ht,
+        lt,
+        bd,
+        sa,
+        ra,
+        hs,
+        sw,
+        columns=[
             ColumnNames.LASER_POWER,
             ColumnNames.SCAN_SPEED,
             ColumnNames.RELATIVE_DENSITY,
         ],
-    ]
-    df.sort_values(
-        by=[ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED],
-        inplace=True,
     )
-    speeds = df[ColumnNames.SCAN_SPEED].unique()
-    powers = df[ColumnNames.LASER_POWER].unique()
-    z_vals = []
+    speeds, powers, (z_vals,) = _grid(df, [ColumnNames.RELATIVE_DENSITY])
     z_max = df[ColumnNames.RELATIVE_DENSITY].max()
     if math.isclose(z_max, 0, abs_tol=1e-5):
         z_max = 1
-    min_range = range[0]
-    max_range = range[1]
-    for p in powers:
-        row = []
-        for v in speeds:
-            if (
-                len(
-                    df.loc[
-                        (df[ColumnNames.LASER_POWER] == p) & (df[ColumnNames.SCAN_SPEED] == v),
-                        ColumnNames.RELATIVE_DENSITY,
-                    ].values
-                )
-                > 0
-            ):
-                z = df.loc[
-                    (df[ColumnNames.LASER_POWER] == p) & (df[ColumnNames.SCAN_SPEED] == v),
-                    ColumnNames.RELATIVE_DENSITY,
-                ].values[0]
-                z = round(z, 2)
-                if z >= min_range and z <= max_range:
-                    row.append(0.01)
-                else:
-                    row.append(0.1 + min(abs(max_range - z) / z_max, abs(min_range - z) / z_max))
-            else:
-                row.append(np.nan)
-        z_vals.append(row)
-    return (speeds, powers, z_vals)
+    return (speeds, powers, z_vals, z_max)
 
 
 def __scatter_data(
-    df: pd.DataFrame,
+    index: _SliceIndex,
     ht: float,
     lt: float,
     bd: float,
@@ -301,21 +402,25 @@ def __scatter_data(
     ra: float,
     hs: float,
     sw: float,
-    float,
-) -> tuple[list, list, list]:
-    idx = df[
-        (df[ColumnNames.LAYER_THICKNESS] == lt)
-        & (df[ColumnNames.HEATER_TEMPERATURE] == ht)
-        & (df[ColumnNames.BEAM_DIAMETER] == bd)
-        & (df[ColumnNames.START_ANGLE] == sa)
-        & (df[ColumnNames.ROTATION_ANGLE] == ra)
-        & (df[ColumnNames.HATCH_SPACING] == hs)
-        & (df[ColumnNames.STRIPE_WIDTH] == sw)
-        & (~df[ColumnNames.RELATIVE_DENSITY].isna())
-    ].index
-    scatter_x = df.loc[idx, ColumnNames.SCAN_SPEED].tolist()
-    scatter_y = df.loc[idx, ColumnNames.LASER_POWER].tolist()
-    scatter_z = df.loc[idx, ColumnNames.RELATIVE_DENSITY].tolist()
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    df = index.take(
+        ht,
+        lt,
+        bd,
+        sa,
+        ra,
+        hs,
+        sw,
+        columns=[
+            ColumnNames.LASER_POWER,
+            ColumnNames.SCAN_SPEED,
+            ColumnNames.RELATIVE_DENSITY,
+        ],
+    )
+    df = df[~df[ColumnNames.RELATIVE_DENSITY].isna()]
+    scatter_x = _values(df, ColumnNames.SCAN_SPEED)
+    scatter_y = _values(df, ColumnNames.LASER_POWER)
+    scatter_z = _values(df, ColumnNames.RELATIVE_DENSITY)
     return (
         scatter_x,
         scatter_y,
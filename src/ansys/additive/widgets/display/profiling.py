@@ -0,0 +1,237 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides profiling of the interactions with the display widgets.
+
+When profiling is on, each plot update and table edit is run under a
+profiler, and its profile is written to a directory together with a JSON
+file describing the interaction: the widget, the function, the widget
+values it was called with, and its duration. Interactions are sampled at
+a given rate, so that profiling can stay on in production to catch slow
+interactions that cannot be reproduced.
+
+Profiles are written with :mod:`cProfile` as ``.prof`` files, which can be
+read with :mod:`pstats` or tools such as ``snakeviz``, or with the optional
+``pyinstrument`` package as HTML pages. Only one interaction is profiled at
+a time, and interactions running while another is profiled are not.
+
+Profiling is off by default. Turn it on with :meth:`Profiler.enable`, or by
+setting the ``ANSYS_ADDITIVE_WIDGETS_PROFILE`` environment variable to the
+directory to write profiles to before the widgets are imported. The
+``ANSYS_ADDITIVE_WIDGETS_PROFILE_RATE`` and
+``ANSYS_ADDITIVE_WIDGETS_PROFILER`` environment variables set the sampling
+rate and the profiler:
+
+.. code:: console
+
+   ANSYS_ADDITIVE_WIDGETS_PROFILE=profiles ANSYS_ADDITIVE_WIDGETS_PROFILE_RATE=0.05 panel serve app.py
+"""
+from __future__ import annotations
+
+import datetime
+import functools
+import importlib.util
+import json
+import os
+import pathlib
+import random
+import threading
+import time
+from typing import Any, Callable
+import warnings
+
+from ansys.additive.core.misc import short_uuid
+
+# Attributes of the edit events of the table describing the edit.
+_EVENT_ATTRIBUTES = ("column", "row", "value")
+# Profilers that can be used, and the suffix of the files they write.
+PROFILERS = {
+    "cprofile": ".prof",
+    "pyinstrument": ".html",
+}
+
+
+class Profiler:
+    """Profiler of the interactions with the display widgets."""
+
+    def __init__(self):
+        self._directory = None
+        self._rate = 1.0
+        self._engine = "cprofile"
+        # Held while an interaction is profiled.
+        self._busy = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether interactions are profiled."""
+        return self._directory is not None
+
+    @property
+    def directory(self) -> pathlib.Path | None:
+        """Directory the profiles are written to, ``None`` if profiling is off."""
+        return self._directory
+
+    @property
+    def rate(self) -> float:
+        """Fraction of the interactions that are profiled."""
+        return self._rate
+
+    @property
+    def engine(self) -> str:
+        """Name of the profiler, see :data:`PROFILERS`."""
+        return self._engine
+
+    def enable(self, directory: str | os.PathLike, rate: float = 1.0, engine: str = "cprofile"):
+        """Turn profiling on.
+
+        Parameters
+        ----------
+        directory : str, os.PathLike
+            Directory to write the profiles to. It is created if it does not exist.
+        rate : float, default: 1.0
+            Fraction of the interactions to profile, between 0 and 1.
+        engine : str, default: "cprofile"
+            Name of the profiler, ``"cprofile"`` or ``"pyinstrument"``. The
+            ``pyinstrument`` profiler requires the ``pyinstrument`` package.
+        """
+        if engine not in PROFILERS:
+            raise ValueError(f"Unknown profiler {engine!r}, expected one of {list(PROFILERS)}.")
+        if not 0 <= rate <= 1:
+            raise ValueError(f"The sampling rate must be between 0 and 1, not {rate}.")
+        if engine == "pyinstrument" and importlib.util.find_spec("pyinstrument") is None:
+            raise ImportError(
+                "The pyinstrument profiler requires the pyinstrument package. "
+                "Install it with 'pip install ansys-additive-widgets[profile]'."
+            )
+        directory = pathlib.Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._directory, self._rate, self._engine = directory, rate, engine
+
+    def disable(self):
+        """Turn profiling off."""
+        self._directory = None
+
+    def profiled(self, widget: str) -> Callable[[Callable], Callable]:
+        """Profile the calls of a function handling interactions with a widget.
+
+        Parameters
+        ----------
+        widget : str
+            Name of the widget, for example the name of its display function.
+
+        Returns
+        -------
+        Callable[[Callable], Callable]
+            Decorator of the function.
+        """
+
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def profiled(*args, **kwargs):
+                directory = self._directory
+                if directory is None or random.random() >= self._rate:
+                    return function(*args, **kwargs)
+                # Profilers cannot run in several threads at once.
+                if not self._busy.acquire(blocking=False):
+                    return function(*args, **kwargs)
+                try:
+                    return self.__profile(directory, widget, function, args, kwargs)
+                finally:
+                    self._busy.release()
+
+            return profiled
+
+        return decorator
+
+    def __profile(
+        self,
+        directory: pathlib.Path,
+        widget: str,
+        function: Callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> Any:
+        engine = self._engine
+        if engine == "pyinstrument":
+            import pyinstrument
+
+            profiler = pyinstrument.Profiler(interval=0.001)
+            start_profiler, stop_profiler = profiler.start, profiler.stop
+        else:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            start_profiler, stop_profiler = profiler.enable, profiler.disable
+        start = datetime.datetime.now()
+        begin = time.perf_counter()
+        start_profiler()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stop_profiler()
+            duration = time.perf_counter() - begin
+            name = f"{start:%Y%m%d-%H%M%S}-{widget}-{short_uuid()}"
+            try:
+                if engine == "pyinstrument":
+                    (directory / f"{name}.html").write_text(profiler.output_html())
+                else:
+                    profiler.dump_stats(directory / f"{name}.prof")
+                tags = {
+                    "widget": widget,
+                    "function": function.__name__.lstrip("_"),
+                    "arguments": [_tag(arg) for arg in args],
+                    "keywords": {key: _tag(value) for key, value in kwargs.items()},
+                    "start": start.isoformat(),
+                    "duration": duration,
+                    "profile": name + PROFILERS[engine],
+                }
+                (directory / f"{name}.json").write_text(json.dumps(tags, indent=2))
+            except OSError as e:
+                warnings.warn(f"The profile of {widget} could not be written: {e}")
+
+
+def _tag(value: Any) -> Any:
+    """Describe a widget value in JSON. Objects that are not values are described by their type."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return [_tag(v) for v in value]
+    if hasattr(value, "item") and getattr(value, "ndim", None) == 0:
+        # NumPy scalars.
+        return value.item()
+    if all(hasattr(value, attribute) for attribute in _EVENT_ATTRIBUTES):
+        # Edit events of the table.
+        return {attribute: _tag(getattr(value, attribute)) for attribute in _EVENT_ATTRIBUTES}
+    return f"<{type(value).__name__}>"
+
+
+# Profiler of all widgets.
+profiler = Profiler()
+
+if os.getenv("ANSYS_ADDITIVE_WIDGETS_PROFILE"):
+    try:
+        profiler.enable(
+            os.environ["ANSYS_ADDITIVE_WIDGETS_PROFILE"],
+            float(os.getenv("ANSYS_ADDITIVE_WIDGETS_PROFILE_RATE", "1")),
+            os.getenv("ANSYS_ADDITIVE_WIDGETS_PROFILER", "cprofile"),
+        )
+    except (ImportError, OSError, ValueError) as e:
+        warnings.warn(f"Interactions are not profiled: {e}")
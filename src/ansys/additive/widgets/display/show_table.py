@@ -22,7 +22,10 @@
 """Provides an interactive interface for the parametric study simulation table."""
 from __future__ import annotations
 
+from functools import partial
 import os
+import threading
+from typing import Callable
 
 from ansys.additive.core import SimulationStatus, SimulationType
 from ansys.additive.core.misc import short_uuid
@@ -30,58 +33,93 @@ from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
 import pandas as pd
 import panel as pn
 
-# global variables
-_df = None
-_ps = None
-_iter_select = None
-_pri_select = None
+from ._extension import _extension
+from ._live import _poll, _watch
+from .metrics import metrics
+from .profiling import profiler
+from .snapshot import StudySnapshot
 
-pn.extension("tabulator")
 
-
-def show_table(ps: ParametricStudy, page_size: int = 10):
+def show_table(
+    ps: ParametricStudy | StudySnapshot,
+    page_size: int = 10,
+    pagination: str = "remote",
+    poll_period: float | None = None,
+):
     """Generate an interactive display of the parametric study table.
 
     Parameters
     ----------
-    ps : :class:`ParametricStudy <ansys.additive.core.parametric_study.ParametricStudy>`
+    ps : :class:`ParametricStudy <ansys.additive.core.parametric_study.ParametricStudy>`, StudySnapshot
         Parametric study to display.
     page_size : int, default: 10
         Number of table rows to display per page.
+    pagination : str, default: "remote"
+        Pagination mode of the table. With ``"remote"`` pagination, the
+        filters and sorting are applied on the server and only the rows of
+        the visible page are sent to the browser. With ``"local"`` pagination,
+        the whole study is sent to the browser up front.
+    poll_period : float, default: None
+        Period, in seconds, at which the study is checked for changes, for
+        example while its simulations run. New and changed simulations are
+        merged into the table, keeping its filters, selection, and page. If ``None``, the table
+        shows the study as it was when the table was created.
 
     Returns
     -------
     :class:`panel.Column <panel.Column>`
         Interactive table.
     """
-    global _df, _ps, _iter_select, _pri_select
-
-    _ps = ps
-    _df = _ps.data_frame()
+    _extension("tabulator")
+    snapshot = StudySnapshot.of(ps)
+    # The table edits its own copy of the study in place.
+    df = snapshot.data_frame().copy()
 
     (
-        _iter_select,
-        _pri_select,
+        iter_select,
+        pri_select,
         type_select,
         status_select,
-    ) = __init_controls(_df)
+    ) = __init_controls(df)
 
     table = pn.widgets.Tabulator(
-        _df,
-        pagination="local",
+        df,
+        pagination=pagination,
         page_size=page_size,
         layout="fit_data_stretch",
-        editors=__editors(_df),
+        selectable="checkbox",
+        editors=__editors(df),
     ).servable()
-    table.add_filter(_iter_select, ColumnNames.ITERATION)
-    table.add_filter(_pri_select, ColumnNames.PRIORITY)
+    table.add_filter(iter_select, ColumnNames.ITERATION)
+    table.add_filter(pri_select, ColumnNames.PRIORITY)
     table.add_filter(type_select, ColumnNames.TYPE)
     table.add_filter(status_select, ColumnNames.STATUS)
-    table.on_edit(__on_edit)
+    # Edits of this table are serialized, the study itself is guarded by the snapshot.
+    edit_args = (
+        snapshot,
+        table,
+        {ColumnNames.PRIORITY: pri_select, ColumnNames.ITERATION: iter_select},
+        threading.Lock(),
+    )
+    table.on_edit(partial(__on_edit, partial(__edit_row, *edit_args)))
+    if poll_period is not None:
+        _watch(
+            snapshot,
+            partial(
+                __follow,
+                snapshot,
+                table,
+                {ColumnNames.PRIORITY: pri_select, ColumnNames.ITERATION: iter_select},
+            ),
+            table,
+        )
+        _poll(snapshot, poll_period)
+
+    bulk_bar = __init_bulk_controls(table, partial(__edit_rows, *edit_args))
 
     control_bar = pn.Row(
-        _iter_select,
-        _pri_select,
+        iter_select,
+        pri_select,
         type_select,
         status_select,
         sizing_mode="stretch_width",
@@ -90,6 +128,7 @@ def show_table(ps: ParametricStudy, page_size: int = 10):
         pn.widgets.StaticText(value="<b>Parametric Study</b>"),
         control_bar,
         pn.widgets.StaticText(value="<i>Use CTRL + click to select multiple values.</i>"),
+        bulk_bar,
         table,
         sizing_mode="stretch_both",
     ).servable()
@@ -130,6 +169,46 @@ def __init_controls(df: pd.DataFrame) -> tuple[pn.widgets.MultiSelect, ...]:
     return iter_select, pri_select, type_select, status_select
 
 
+def __init_bulk_controls(table: pn.widgets.Tabulator, editor: Callable) -> pn.Row:
+    column_select = pn.widgets.Select(
+        name="Edit column",
+        options=[ColumnNames.STATUS, ColumnNames.PRIORITY, ColumnNames.ITERATION],
+    )
+    status_input = pn.widgets.Select(
+        name="New value",
+        options=[
+            SimulationStatus.PENDING,
+            SimulationStatus.COMPLETED,
+            SimulationStatus.ERROR,
+            SimulationStatus.SKIP,
+        ],
+    )
+    number_input = pn.widgets.IntInput(name="New value", value=1, visible=False)
+    selected_button = pn.widgets.Button(name="Apply to selected rows", align="end")
+    filtered_button = pn.widgets.Button(name="Apply to filtered rows", align="end")
+
+    def toggle_inputs(column: str):
+        status_input.visible = column == ColumnNames.STATUS
+        number_input.visible = column != ColumnNames.STATUS
+
+    def apply(event: any, selected: bool):
+        column = column_select.value
+        value = status_input.value if column == ColumnNames.STATUS else number_input.value
+        if selected:
+            rows = table.value.iloc[table.selection]
+        else:
+            rows = table.current_view
+        editor(rows[ColumnNames.ID].tolist(), column, value)
+
+    pn.bind(toggle_inputs, column_select, watch=True)
+    selected_button.on_click(partial(apply, selected=True))
+    filtered_button.on_click(partial(apply, selected=False))
+
+    return pn.Row(
+        column_select, status_input, number_input, selected_button, filtered_button
+    ).servable()
+
+
 def __editors(df: pd.DataFrame):
     editors = {}
     for col in df.columns:
@@ -154,24 +233,164 @@ def __editors(df: pd.DataFrame):
     return editors
 
 
-def __on_edit(event: any):
-    global _df, _iter_select, _pri_select
+@profiler.profiled(show_table.__name__)
+@metrics.timed("edit", plot=show_table.__name__)
+def __on_edit(editor: Callable, event: any):
     if event.column in [ColumnNames.STATUS, ColumnNames.PRIORITY, ColumnNames.ITERATION]:
-        id = _df.loc[event.row, ColumnNames.ID]
-        if event.column == ColumnNames.STATUS:
-            _ps.set_status(id, event.value)
-        elif event.column == ColumnNames.PRIORITY:
-            _ps.set_priority(id, event.value)
-            _pri_select.options = sorted(_ps.data_frame()[ColumnNames.PRIORITY].unique().tolist())
-            # _pri_select.value is not type(list), so we need to create a list
-            selections = [x for x in _pri_select.value]
-            selections.append(event.value)
-            _pri_select.value = selections
-        elif event.column == ColumnNames.ITERATION:
-            _ps.set_iteration(id, event.value)
-            _iter_select.options = sorted(_ps.data_frame()[ColumnNames.ITERATION].unique().tolist())
-            # _iter_select.value is not type(list), so we need to create a list
-            selections = [x for x in _iter_select.value]
-            selections.append(event.value)
-            _iter_select.value = selections
-        _df = _ps.data_frame()
+        # The table has already applied the edit to its own data frame.
+        editor(event.row, event.column, event.value)
+
+
+def __edit_row(
+    snapshot: StudySnapshot,
+    table: pn.widgets.Tabulator,
+    filters: dict[str, pn.widgets.MultiSelect],
+    lock: threading.Lock,
+    row: int,
+    column: str,
+    value: any,
+):
+    """Set a column of a simulation already edited in the table.
+
+    The row is given by its position in the table. The table is only
+    refreshed if the edit changed other columns of the row.
+    """
+    df = table.value
+    with lock:
+        ids = [df[ColumnNames.ID].iloc[row]]
+        refresh = __edit(snapshot, df, ids, column, value)
+    __refresh(table, filters, column, value, refresh)
+
+
+def __edit_rows(
+    snapshot: StudySnapshot,
+    table: pn.widgets.Tabulator,
+    filters: dict[str, pn.widgets.MultiSelect],
+    lock: threading.Lock,
+    ids: list[str],
+    column: str,
+    value: any,
+):
+    """Set a column of several simulations of the table.
+
+    The simulations are written to the study at once, then the table is
+    updated with one refresh.
+    """
+    if len(ids) == 0:
+        return
+    with lock:
+        __edit(snapshot, table.value, ids, column, value)
+    __refresh(table, filters, column, value, True)
+
+
+def __edit(
+    snapshot: StudySnapshot, df: pd.DataFrame, ids: list[str], column: str, value: any
+) -> bool:
+    """Write a column of simulations to the study and to the table data frame.
+
+    Returns ``True`` if other columns of the simulations changed as well.
+    """
+    if column == ColumnNames.STATUS:
+        snapshot.set_simulation_status(ids, value)
+    elif column == ColumnNames.PRIORITY:
+        snapshot.set_priority(ids, value)
+    elif column == ColumnNames.ITERATION:
+        snapshot.set_iteration(ids, value)
+    else:
+        raise ValueError(f"Column {column} cannot be edited.")
+    mask = df[ColumnNames.ID].isin(ids)
+    df.loc[mask, column] = value
+    if column == ColumnNames.STATUS and value == SimulationStatus.ERROR:
+        df.loc[mask, ColumnNames.ERROR_MESSAGE] = ""
+        return True
+    return False
+
+
+def __refresh(
+    table: pn.widgets.Tabulator,
+    filters: dict[str, pn.widgets.MultiSelect],
+    column: str,
+    value: any,
+    refresh: bool,
+):
+    """Show an edited value in the filters and refresh the table if needed."""
+    # Changing a filter refreshes the table, otherwise refresh it explicitly.
+    if column in filters and __show_value(filters[column], value):
+        refresh = False
+    if refresh:
+        table.param.trigger("value")
+
+
+def __follow(
+    snapshot: StudySnapshot,
+    table: pn.widgets.Tabulator,
+    filters: dict[str, pn.widgets.MultiSelect],
+    event: any,
+):
+    """Apply the changes of a new snapshot version to the table.
+
+    The table is reloaded if the changed rows are not known or rows were
+    removed. Changes are applied in the session of the table, possibly after
+    the snapshot moved on to a later version. The table is then reloaded,
+    as the changes of the versions in between are not known.
+    """
+    changes = snapshot.changes
+    # The version is incremented before the changes are replaced, so the
+    # changes are those of the event if the version did not move on since.
+    if snapshot.version != event.new:
+        changes = None
+    if changes is None or changes.removed:
+        table.value = rows = snapshot.data_frame().copy()
+    else:
+        rows = pd.concat([changes.added, changes.changed])
+        __merge(table, rows)
+    for column, select in filters.items():
+        __add_options(select, rows[column].unique().tolist())
+
+
+def __merge(table: pn.widgets.Tabulator, rows: pd.DataFrame):
+    """Write rows to the table by simulation ID, appending the new ones.
+
+    Rows that do not differ from the table are ignored, and the table is
+    refreshed once. The filters, selection, and page of the table are kept,
+    and with remote pagination only the visible page is sent to the browser.
+    """
+    df = table.value
+    positions = pd.Index(df[ColumnNames.ID]).get_indexer(rows[ColumnNames.ID])
+    known = positions >= 0
+    old = df.iloc[positions[known]]
+    new = rows[known][df.columns].set_axis(old.index)
+    changed = ~((old == new) | (old.isna() & new.isna())).all(axis=1)
+    if changed.any():
+        df.loc[changed.index[changed]] = new[changed]
+    added = rows[~known]
+    if len(added.index):
+        start = df.index.max() + 1 if len(df.index) else 0
+        index = pd.RangeIndex(start, start + len(added.index))
+        table.value = pd.concat([df, added.set_axis(index)])
+    elif changed.any():
+        table.param.trigger("value")
+
+
+def __add_options(select: pn.widgets.MultiSelect, values: list):
+    """Add new values to the options and selection of a filter."""
+    values = [v for v in values if v not in select.options]
+    if values:
+        select.param.update(
+            options=sorted([*select.options, *values]), value=[*select.value, *values]
+        )
+
+
+def __show_value(select: pn.widgets.MultiSelect, value: int) -> bool:
+    """Add a value to the options and selection of a filter.
+
+    Returns ``True`` if the filter changed.
+    """
+    if value in select.value:
+        return False
+    options = select.options
+    if value not in options:
+        options = sorted([*options, value])
+    # select.value is not type(list), so we need to create a list
+    select.param.update(options=options, value=[*select.value, value])
+    return True
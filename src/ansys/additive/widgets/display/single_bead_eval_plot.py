@@ -22,69 +22,132 @@
 """Provides an interactive heatmap to evaluate single bead results."""
 from __future__ import annotations
 
+from functools import partial
 import math
 import os
+from typing import Iterator
 
-from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core import SimulationType
 from ansys.additive.core.misc import short_uuid
 from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
 import numpy as np
 import pandas as pd
 import panel as pn
+import param
 import plotly.graph_objects as go
 
-from ._common_controls import _common_controls
+from ._codes import _values
+from ._common_controls import _common_controls, _default_selection, _range_slider
+from ._extension import _extension
+from ._facets import _facet_controls, _facet_figure, _facet_grids, _FacetGrids, _shared_range
+from ._figure_patch import _plotly_pane
+from ._grid import _grid, _grids, _range_scores
+from ._live import _poll, _version
+from ._scatter import _MAX_LABELS, _scatter
+from ._slice_index import _PARAMETER_COLUMNS, _QuerySliceIndex, _SliceIndex
+from .cache import figure_cache
+from .metrics import metrics
+from .profiling import profiler
+from .snapshot import StudySnapshot
 
-# global variables
-_range_slider = None
-_poi_select = None
-_last_poi = None
+# Columns used by the plot.
+_COLUMNS = _PARAMETER_COLUMNS + [
+    ColumnNames.LASER_POWER,
+    ColumnNames.SCAN_SPEED,
+    ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH,
+    ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH,
+]
+# Melt pool parameters of interest, with their labels and export file names.
+_PARAMETERS_OF_INTEREST = {
+    ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH: ("Ref Depth/Ref Width", "depth_over_width"),
+    ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH: ("Length/Width", "length_over_width"),
+}
 
-pn.extension("plotly")
 
-
-def single_bead_eval_plot(ps: ParametricStudy):
+def single_bead_eval_plot(
+    ps: ParametricStudy | StudySnapshot,
+    poll_period: float | None = None,
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
+    background: bool = False,
+):
     """Generate a heatmap to identify optimal melt pool statistics.
 
     Parameters
     ----------
-    ps : ParametricStudy
+    ps : ParametricStudy, StudySnapshot
         Parametric study to plot.
+    poll_period : float, default: None
+        Period, in seconds, at which the study is checked for changes, for
+        example while its simulations run. The plot is updated when the study
+        changes. If ``None``, only changes made through the snapshot of the
+        study, such as edits in the table, update the plot.
+    webgl : bool, default: None
+        Whether to draw the simulation points with WebGL, which is faster for
+        thousands of points. If ``None``, WebGL is used for large slices.
+    max_labels : int, default: 500
+        Maximum number of simulation points labeled with their value. Points
+        of larger slices are not labeled.
+    background : bool, default: False
+        Whether to compute the figure in a background thread when a control
+        changes, so that the other widgets of the session stay responsive
+        while slow slices are computed. The plot shows a loading indicator
+        meanwhile, and the figures of selections changed again before they
+        are shown are dropped. Background computation requires a running
+        event loop, as in a served application or a notebook. Otherwise,
+        the figure is computed before the control change returns.
 
     Returns
     -------
     panel.Row
         Interactive plot.
     """
-    df = __data_frame(ps)
+    _extension("plotly")
+    snapshot = StudySnapshot.of(ps)
+    _poll(snapshot, poll_period)
     (
         ht_select,
         lt_select,
         bd_select,
-        _poi_select,
-        _range_slider,
-    ) = __init_controls(df)
+        selection,
+        poi_select,
+        range_slider,
+        rows_select,
+        columns_select,
+    ) = __init_controls(snapshot)
     side_bar = pn.Column(
         pn.Spacer(height=50),
-        _poi_select,
-        _range_slider,
+        poi_select,
+        range_slider,
         lt_select,
         ht_select,
         bd_select,
+        rows_select,
+        columns_select,
         width=200,
     )
-    plot_view = pn.bind(
+    # Reset the range before the plot is updated for a new parameter of interest.
+    pn.bind(partial(__reset_range, range_slider), snapshot, poi_select, watch=True)
+    # Moving the range only changes the heat map values, so only they are sent.
+    plot_view = _plotly_pane(
         __update_plot,
-        df,
-        ht_select,
-        lt_select,
-        bd_select,
-        _poi_select,
-        _range_slider,
+        snapshot,
+        _version(snapshot, selection),
+        selection.param.value,
+        poi_select,
+        range_slider.param.value_throttled,
+        rows_select,
+        columns_select,
+        webgl,
+        max_labels,
+        background=background,
+        name=single_bead_eval_plot.__name__,
+        sizing_mode="stretch_both",
+        min_height=600,
     )
     plot = pn.Row(
         side_bar,
-        pn.pane.Plotly(plot_view, sizing_mode="stretch_both", min_height=600),
+        plot_view,
         sizing_mode="stretch_both",
     ).servable()
     if os.getenv("GENERATING_DOCS"):
@@ -94,12 +157,23 @@ def single_bead_eval_plot(ps: ParametricStudy):
     return plot
 
 
-def __data_frame(ps: ParametricStudy) -> pd.DataFrame:
-    df = ps.data_frame()
-    df = df[
-        (df[ColumnNames.TYPE] == SimulationType.SINGLE_BEAD)
-        & (df[ColumnNames.STATUS] == SimulationStatus.COMPLETED)
-    ]
+def __slice_index(snapshot: StudySnapshot) -> _SliceIndex:
+    @metrics.timed("index", plot=single_bead_eval_plot.__name__)
+    def create():
+        query = snapshot.query(SimulationType.SINGLE_BEAD, _COLUMNS)
+        if query is None:
+            return _SliceIndex(__data_frame(snapshot), _PARAMETER_COLUMNS[:3])
+        return _QuerySliceIndex(query, _PARAMETER_COLUMNS[:3], prepare=__prepare)
+
+    return snapshot.cached((single_bead_eval_plot.__name__, _SliceIndex), create)
+
+
+def __data_frame(snapshot: StudySnapshot) -> pd.DataFrame:
+    return __prepare(snapshot.simulations(SimulationType.SINGLE_BEAD, _COLUMNS))
+
+
+def __prepare(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
     df.update(
         df[
             [
@@ -111,9 +185,7 @@ def __data_frame(ps: ParametricStudy) -> pd.DataFrame:
     return df
 
 
-def __init_controls(df: pd.DataFrame):
-    global _range_slider, _poi_select, _last_poi
-
+def __init_controls(snapshot: StudySnapshot):
     (
         ht_select,
         lt_select,
@@ -122,30 +194,32 @@ def __init_controls(df: pd.DataFrame):
         _,  # ra_select
         _,  # hs_select
         _,  # sw_select
-    ) = _common_controls(df)
-    _poi_select = pn.widgets.Select(
+        selection,
+    ) = _common_controls(snapshot, __slice_index)
+    poi_select = pn.widgets.Select(
         name="Melt Pool Parameter of Interest",
         sizing_mode="stretch_width",
-        options={
-            "Ref Depth/Ref Width": ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH,
-            "Length/Width": ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH,
-        },
+        options={label: poi for poi, (label, _) in _PARAMETERS_OF_INTEREST.items()},
     ).servable()
-    range_end = 0.1 + df[_poi_select.value].max()
-    _range_slider = pn.widgets.RangeSlider(
+    range_end, range_value = __range(snapshot, poi_select.value)
+    range_slider = _range_slider(
         name="Range",
         start=0,
         end=range_end,
-        value=(0.375 * range_end, 0.75 * range_end),
+        value=range_value,
         step=0.01,
         bar_color="green",
     ).servable()
+    rows_select, columns_select = _facet_controls(__slice_index(snapshot).columns)
     return (
         ht_select,
         lt_select,
         bd_select,
-        _poi_select,
-        _range_slider,
+        selection,
+        poi_select,
+        range_slider,
+        rows_select,
+        columns_select,
     )
 
 
@@ -159,25 +233,98 @@ def __contour_colorscale() -> list:
     ]
 
 
-# @pn.cache
+def __range(snapshot: StudySnapshot, poi: str) -> tuple[float, tuple[float, float]]:
+    """Get the end and the initial value of the range of a parameter of interest."""
+    # Missing values are plotted as zero.
+    _, end = __slice_index(snapshot).range([poi])
+    range_end = 0.1 + (end or 0.0)
+    return range_end, (0.375 * range_end, 0.75 * range_end)
+
+
+def __reset_range(range_slider: pn.widgets.RangeSlider, snapshot: StudySnapshot, poi: str):
+    range_end, range_value = __range(snapshot, poi)
+    with param.edit_constant(range_slider):
+        range_slider.param.update(end=range_end, value=range_value, value_throttled=range_value)
+
+
+@profiler.profiled(single_bead_eval_plot.__name__)
 def __update_plot(
-    df: pd.DataFrame,
+    snapshot: StudySnapshot,
+    version: int,
+    values: tuple,
+    poi: str,
+    range: tuple[float, float],
+    rows: str | None,
+    columns: str | None,
+    webgl: bool | None,
+    max_labels: int,
+) -> go.Figure:
+    return __cached_figure(snapshot, values, poi, range, rows, columns, webgl, max_labels)
+
+
+def __cached_figure(
+    snapshot: StudySnapshot,
+    values: tuple,
+    poi: str,
+    range: tuple[float, float],
+    rows: str | None,
+    columns: str | None,
+    webgl: bool | None,
+    max_labels: int,
+) -> go.Figure:
+    key = (*values, poi, range, rows, columns, webgl, max_labels)
+    if rows is None and columns is None:
+        create = partial(__figure, __slice_index(snapshot), *values, poi, range, webgl, max_labels)
+    else:
+        create = partial(
+            __facet_figure, __slice_index(snapshot), values, rows, columns, poi, range, webgl
+        )
+    return figure_cache.get_or_create((snapshot.key, single_bead_eval_plot.__name__, *key), create)
+
+
+def _warm(snapshot: StudySnapshot):
+    """Compute the figure of the default slice, as displayed by a new plot."""
+    values = _default_selection(__slice_index(snapshot))
+    poi = next(iter(_PARAMETERS_OF_INTEREST))
+    _, range = __range(snapshot, poi)
+    __cached_figure(snapshot, values, poi, range, None, None, None, _MAX_LABELS)
+
+
+def _export_slices(snapshot: StudySnapshot) -> Iterator[tuple[dict, tuple, pd.DataFrame]]:
+    """Get the slices written by :func:`.export.export_slices`.
+
+    Each slice is described by its parameter values, the arguments of
+    :func:`_export_figure`, and the rows the figure is computed from. Each
+    slice is exported once per parameter of interest.
+    """
+    index = __slice_index(snapshot)
+    for values in index.slices():
+        rows = index.take(*values, columns=_COLUMNS)
+        for poi, (_, name) in _PARAMETERS_OF_INTEREST.items():
+            _, range = __range(snapshot, poi)
+            fields = {**dict(zip(index.columns, values)), "parameter": name}
+            yield fields, (*values, poi, range), rows
+
+
+def _export_figure(snapshot: StudySnapshot, args: tuple) -> go.Figure:
+    """Create the figure of a slice returned by :func:`_export_slices`."""
+    return __figure(__slice_index(snapshot), *args)
+
+
+@metrics.timed("figure", plot=single_bead_eval_plot.__name__)
+def __figure(
+    index: _SliceIndex,
     ht: float,
     lt: float,
     bd: float,
     poi: str,
     range: tuple[float, float],
+    webgl: bool | None = None,
+    max_labels: int = _MAX_LABELS,
 ) -> go.Figure:
-    global _range_slider, _last_poi
-    if poi != _last_poi:
-        _range_slider.end = 0.1 + df[poi].max()
-        _range_slider.value = (0.375 * _range_slider.end, 0.75 * _range_slider.end)
-        _last_poi = poi
-        range = _range_slider.value
-
     fig = go.Figure()
 
-    x, y, z = __contour_data(df, ht, lt, bd, poi, range)
+    x, y, z = __contour_data(index, (ht, lt, bd), poi, range)
     contour = go.Heatmap(
         x=x,
         y=y,
@@ -190,22 +337,20 @@ def __update_plot(
     )
     fig.add_trace(contour)
 
-    scatter_x, scatter_y, z_scatter = __scatter_data(df, ht, lt, bd, poi)
-    scatter = go.Scatter(
-        x=scatter_x,
-        y=scatter_y,
-        mode="markers+text",
-        text=[f"<b>{z:.2f}</b>" for z in z_scatter],  # noqa: E231
+    scatter_x, scatter_y, z_scatter = __scatter_data(index, ht, lt, bd, poi)
+    scatter = _scatter(
+        scatter_x,
+        scatter_y,
+        z_scatter,
+        "<b>%{customdata:.2f}</b>",
+        webgl,
+        max_labels,
         textposition="top center",
         marker=dict(color="black", size=5),
         cliponaxis=False,
     )
     fig.add_trace(scatter)
-    title = "Melt Pool "
-    if poi == ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH:
-        title += "Ref Depth/Ref Width"
-    else:
-        title += "Length/Width"
+    title = "Melt Pool " + _PARAMETERS_OF_INTEREST[poi][0]
     fig.update_layout(title_text=title, plot_bgcolor="white")
     fig.update_xaxes(
         title_text="Scan Speed (m/s)",
@@ -227,77 +372,130 @@ def __update_plot(
     return fig
 
 
+@metrics.timed("figure", plot=single_bead_eval_plot.__name__)
+def __facet_figure(
+    index: _SliceIndex,
+    values: tuple,
+    rows: str | None,
+    columns: str | None,
+    poi: str,
+    range: tuple[float, float],
+    webgl: bool | None = None,
+) -> go.Figure:
+    facets, z_max = __facet_data(index, values, rows, columns, poi)
+    scores = _range_scores(facets.grids[0], range, z_max)
+    # Color all heat maps with the same scale.
+    zmin, zmax = _shared_range(scores)
+    traces = []
+    for z, points in zip(scores, facets.points):
+        points = points[~points[poi].isna()]
+        heatmap = go.Heatmap(
+            x=facets.speeds,
+            y=facets.powers,
+            z=z,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=__contour_colorscale(),
+            showscale=False,
+            connectgaps=True,
+            hoverinfo="skip",
+            zsmooth="best",
+        )
+        # Labels of many small subplots would overlap, so only hovered points show their value.
+        scatter = _scatter(
+            _values(points, ColumnNames.SCAN_SPEED),
+            _values(points, ColumnNames.LASER_POWER),
+            _values(points, poi),
+            "<b>%{customdata:.2f}</b>",
+            webgl,
+            0,
+            hovertemplate="<b>%{customdata:.2f}</b><extra></extra>",
+            marker=dict(color="black", size=4),
+        )
+        traces.append([heatmap, scatter])
+    x, y = facets.speeds, facets.powers
+    grid = dict(showgrid=True, gridwidth=1, gridcolor="lightgray")
+    return _facet_figure(
+        facets,
+        traces,
+        xaxis=dict(
+            title=dict(text="Scan Speed (m/s)", font=dict(size=12)),
+            range=[min(x) - 0.1, max(x) + 0.1] if len(x) else None,
+            **grid,
+        ),
+        yaxis=dict(
+            title=dict(text="Laser Power (W)", font=dict(size=12)),
+            range=[min(y) - 20, max(y) + 70] if len(y) else None,
+            **grid,
+        ),
+        title_text="Melt Pool " + _PARAMETERS_OF_INTEREST[poi][0],
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+
+
+@metrics.timed("grid", plot=single_bead_eval_plot.__name__)
+def __facet_data(
+    index: _SliceIndex, values: tuple, rows: str | None, columns: str | None, poi: str
+) -> tuple[_FacetGrids, float]:
+    """Get the grids of the parameter of interest of the subplots of a
+    faceted view, and the maximum parameter of interest value."""
+
+    def create() -> tuple[_FacetGrids, float]:
+        facets = _facet_grids(index, values, rows, columns, [poi], [poi])
+        _, z_max = _shared_range(
+            np.concatenate([np.empty(0), *(_values(p, poi) for p in facets.points)])
+        )
+        if z_max is None or math.isclose(z_max, 0, abs_tol=1e-5):
+            z_max = 1
+        return facets, z_max
+
+    return index.cached((_grids, *values, rows, columns, poi), create)
+
+
+@metrics.timed("grid", plot=single_bead_eval_plot.__name__)
 def __contour_data(
-    df: pd.DataFrame, ht: float, lt: float, bd: float, poi: str, range: tuple[float, float]
-) -> tuple[list, list, list]:
-    """Get lists of scan speed, laser power, and parameter of interest
-    values."""
-
-    idx = df[
-        (df[ColumnNames.LAYER_THICKNESS] == lt)
-        & (df[ColumnNames.BEAM_DIAMETER] == bd)
-        & (df[ColumnNames.HEATER_TEMPERATURE] == ht)
-    ].index
-
-    df = df.loc[
-        idx,
-        [
+    index: _SliceIndex, values: tuple, poi: str, range: tuple[float, float]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get arrays of scan speed, laser power, and parameter of interest
+    scores."""
+    speeds, powers, z_vals, z_max = index.cached(
+        (_grid, *values, poi), lambda: __grid_data(index, *values, poi)
+    )
+    return (speeds, powers, _range_scores(z_vals, range, z_max))
+
+
+def __grid_data(
+    index: _SliceIndex, ht: float, lt: float, bd: float, poi: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Get arrays of scan speed, laser power, and parameter of interest
+    values, and the maximum parameter of interest value."""
+
+    df = index.take(
+        ht,
+        lt,
+        bd,
+        columns=[
             ColumnNames.LASER_POWER,
             ColumnNames.SCAN_SPEED,
             poi,
         ],
-    ]
-    df.sort_values(
-        by=[ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED],
-        inplace=True,
     )
-    speeds = df[ColumnNames.SCAN_SPEED].unique()
-    powers = df[ColumnNames.LASER_POWER].unique()
-    z_vals = []
+    speeds, powers, (z_vals,) = _grid(df, [poi])
     z_max = df[poi].max()
     if math.isclose(z_max, 0, abs_tol=1e-5):
         z_max = 1
-    min_range = range[0]
-    max_range = range[1]
-    for p in powers:
-        row = []
-        for v in speeds:
-            if (
-                len(
-                    df.loc[
-                        (df[ColumnNames.LASER_POWER] == p) & (df[ColumnNames.SCAN_SPEED] == v),
-                        poi,
-                    ].values
-                )
-                > 0
-            ):
-                z = df.loc[
-                    (df[ColumnNames.LASER_POWER] == p) & (df[ColumnNames.SCAN_SPEED] == v),
-                    poi,
-                ].values[0]
-                z = round(z, 2)
-                if z >= min_range and z <= max_range:
-                    row.append(0.01)
-                else:
-                    row.append(0.1 + min(abs(max_range - z) / z_max, abs(min_range - z) / z_max))
-            else:
-                row.append(np.nan)
-        z_vals.append(row)
-    return (speeds, powers, z_vals)
+    return (speeds, powers, z_vals, z_max)
 
 
 def __scatter_data(
-    df: pd.DataFrame, ht: float, lt: float, bd: float, poi: str
-) -> tuple[list, list, list]:
-    idx = df[
-        (df[ColumnNames.LAYER_THICKNESS] == lt)
-        & (df[ColumnNames.HEATER_TEMPERATURE] == ht)
-        & (df[ColumnNames.BEAM_DIAMETER] == bd)
-        & (~df[poi].isna())
-    ].index
-    scatter_x = df.loc[idx, ColumnNames.SCAN_SPEED].tolist()
-    scatter_y = df.loc[idx, ColumnNames.LASER_POWER].tolist()
-    scatter_z = df.loc[idx, poi].tolist()
+    index: _SliceIndex, ht: float, lt: float, bd: float, poi: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    df = index.take(ht, lt, bd, columns=[ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED, poi])
+    df = df[~df[poi].isna()]
+    scatter_x = _values(df, ColumnNames.SCAN_SPEED)
+    scatter_y = _values(df, ColumnNames.LASER_POWER)
+    scatter_z = _values(df, poi)
     return (
         scatter_x,
         scatter_y,
@@ -0,0 +1,510 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a versioned snapshot of a parametric study shared by the display widgets."""
+from __future__ import annotations
+
+import importlib.util
+import itertools
+import os
+import threading
+from typing import Any, Callable, Hashable, NamedTuple
+import weakref
+
+from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
+import pandas as pd
+import param
+
+from . import _query, _sidecar
+from .cache import figure_cache
+from .metrics import metrics
+
+# Snapshots shared by all widgets displaying the same study.
+_snapshots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_snapshots_lock = threading.Lock()
+# Identifiers of the snapshots, used in the keys of cached figures.
+_ids = itertools.count()
+
+
+class StudyChanges(NamedTuple):
+    """Rows of a parametric study that changed between two snapshot versions."""
+
+    added: pd.DataFrame
+    """Rows that were added."""
+    changed: pd.DataFrame
+    """New values of the rows that were changed."""
+    removed: list[str]
+    """IDs of the rows that were removed."""
+
+
+class StudySnapshot(param.Parameterized):
+    """Versioned snapshot of the simulations of a parametric study.
+
+    The snapshot copies the study data frame once per version and caches the
+    filtered and projected frames, slice indexes, and other values derived
+    from it, so that all widgets displaying the study share them. Use
+    :meth:`of` to get the snapshot shared by all widgets of a study.
+
+    Edits made through the snapshot are written to the study and applied to
+    the snapshot without copying the study again. Edits made directly to the
+    study are picked up by :meth:`refresh`, or by :meth:`poll` when the study
+    file has been saved since. Every change increments :attr:`version`, which
+    consumers can watch to be notified of changes, and :attr:`changes` tells
+    which rows changed. The snapshot can be shared by sessions running in
+    different threads.
+
+    A snapshot can also be taken of a study file without loading the study.
+    The simulations are then read from a columnar sidecar file of the study
+    file when the optional ``pyarrow`` package is installed, which is much
+    faster than loading the study. Plots only read the columns they use.
+    The sidecar file is written on first use, and again when the study
+    file changes. The study is only loaded to edit it, see :attr:`study`.
+
+    Plots of a study file can also query the sidecar file with an embedded
+    query engine instead of reading the simulations into memory, see
+    :meth:`query`. Only the distinct process parameter values and the
+    simulations of the displayed slices are then read, which bounds memory
+    by the size of the slices rather than the size of the study.
+
+    Parameters
+    ----------
+    study : ParametricStudy, str, os.PathLike
+        Parametric study to take a snapshot of, or name of a study file.
+    backend : str, default: "pandas"
+        Query backend of a snapshot of a study file: ``"pandas"`` to read
+        simulations into data frames, or ``"duckdb"`` or ``"polars"`` to
+        query the sidecar file with DuckDB or Polars. The ``duckdb`` and
+        ``polars`` backends require the ``duckdb`` and ``polars`` extras.
+    """
+
+    version = param.Integer(
+        default=0,
+        constant=True,
+        doc="Version of the snapshot. It is incremented whenever the study changes.",
+    )
+
+    def __init__(
+        self, study: ParametricStudy | str | os.PathLike, backend: str = "pandas", **params
+    ):
+        if backend not in _query.BACKENDS:
+            raise ValueError(
+                f"Unknown backend {backend!r}, expected one of {list(_query.BACKENDS)}."
+            )
+        for package in (backend, "pyarrow") if backend != "pandas" else ():
+            if importlib.util.find_spec(package) is None:
+                raise ImportError(
+                    f"The {backend} backend requires the {package} package. "
+                    f"Install it with 'pip install ansys-additive-widgets[{backend}]'."
+                )
+        super().__init__(**params)
+        self._backend = backend
+        if isinstance(study, ParametricStudy):
+            self._study, self._file_name = study, None
+        else:
+            self._study, self._file_name = None, study
+        self._id = next(_ids)
+        self._lock = threading.RLock()
+        self._frame = None
+        self._stamp = None
+        self._changes = None
+        self._cache = {}
+
+    @classmethod
+    def of(cls, study: ParametricStudy | StudySnapshot) -> StudySnapshot:
+        """Get the snapshot shared by all widgets of a study.
+
+        Parameters
+        ----------
+        study : ParametricStudy, StudySnapshot
+            Parametric study or snapshot. A snapshot is returned as is.
+
+        Returns
+        -------
+        StudySnapshot
+            Snapshot of the study.
+        """
+        if isinstance(study, StudySnapshot):
+            return study
+        with _snapshots_lock:
+            snapshot = _snapshots.get(study)
+            if snapshot is None:
+                snapshot = _snapshots[study] = cls(study)
+            return snapshot
+
+    @property
+    def study(self) -> ParametricStudy:
+        """Parametric study.
+
+        If the snapshot was taken of a study file, the study is loaded on
+        first use, which may update the study file. See
+        :meth:`ParametricStudy.load`.
+        """
+        with self._lock:
+            if self._study is None:
+                self._study = ParametricStudy.load(self._file_name)
+            return self._study
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the study is loaded.
+
+        This is ``False`` for a snapshot of a study file until :attr:`study`
+        is used, for example to edit the study.
+        """
+        return self._study is not None
+
+    @property
+    def file_name(self) -> str | os.PathLike | None:
+        """Name of the study file."""
+        return self._file_name if self._study is None else self._study.file_name
+
+    @property
+    def backend(self) -> str:
+        """Query backend, see :meth:`query`."""
+        return self._backend
+
+    @property
+    def changes(self) -> StudyChanges | None:
+        """Rows changed by the last change of :attr:`version`.
+
+        ``None`` if the rows that changed are not known, for example after
+        :meth:`invalidate`. Consumers must then read the whole data frame again.
+        """
+        return self._changes
+
+    @property
+    def key(self) -> tuple:
+        """Hashable key identifying the snapshot and its version.
+
+        The key is used as the study version of :class:`FigureCache` entries.
+        It only holds plain integers so that cached figures do not keep the
+        snapshot and its data frame alive.
+        """
+        return (self._id, self.version)
+
+    def data_frame(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Get the simulations of the study.
+
+        Parameters
+        ----------
+        columns : list[str], default: None
+            Columns to return. If ``None``, the shared data frame of all
+            columns is returned. It must not be modified.
+
+        Returns
+        -------
+        pd.DataFrame
+            Simulations of the study.
+        """
+        with self._lock:
+            if self._frame is None:
+                self._stamp = self.__file_stamp()
+                self._frame = self.__read(self._stamp)
+            return self._frame if columns is None else self._frame[columns]
+
+    def simulations(
+        self,
+        simulation_type: SimulationType,
+        columns: list[str] | None = None,
+        status: SimulationStatus = SimulationStatus.COMPLETED,
+    ) -> pd.DataFrame:
+        """Get the simulations of a type and status.
+
+        The returned data frame is cached until the study changes and is
+        shared by all callers. It must not be modified.
+
+        Parameters
+        ----------
+        simulation_type : SimulationType
+            Type of the simulations.
+        columns : list[str], default: None
+            Columns to return. If ``None``, all columns are returned.
+        status : SimulationStatus, default: SimulationStatus.COMPLETED
+            Status of the simulations.
+
+        Returns
+        -------
+        pd.DataFrame
+            Matching simulations.
+        """
+
+        @metrics.timed("select")
+        def select():
+            if self._frame is None and not self.loaded and columns is not None:
+                # Only read the columns used from the study file.
+                if self._stamp is None:
+                    self._stamp = self.__file_stamp()
+                read = list(dict.fromkeys([ColumnNames.TYPE, ColumnNames.STATUS, *columns]))
+                df = self.__read(self._stamp, read)
+            else:
+                df = self.data_frame()
+            mask = (df[ColumnNames.TYPE] == simulation_type) & (df[ColumnNames.STATUS] == status)
+            return df.loc[mask, list(df.columns) if columns is None else columns]
+
+        key = ("simulations", simulation_type, status, None if columns is None else tuple(columns))
+        return self.cached(key, select)
+
+    def query(
+        self,
+        simulation_type: SimulationType,
+        columns: list[str],
+        status: SimulationStatus = SimulationStatus.COMPLETED,
+    ) -> _query._Query | None:
+        """Get a query of the simulations of a type and status run by the query backend.
+
+        The query is cached until the study changes and is shared by all callers.
+
+        Parameters
+        ----------
+        simulation_type : SimulationType
+            Type of the simulations.
+        columns : list[str]
+            Columns selected by the query.
+        status : SimulationStatus, default: SimulationStatus.COMPLETED
+            Status of the simulations.
+
+        Returns
+        -------
+        _Query, None
+            Query of the sidecar file of the study file, or ``None`` if the
+            backend is ``"pandas"``, the study is loaded, or the sidecar file
+            cannot be written. Use :meth:`simulations` then.
+        """
+        if self._backend == "pandas" or self.loaded:
+            return None
+
+        def create():
+            if self._stamp is None:
+                self._stamp = self.__file_stamp()
+            if not _sidecar._is_current(self._file_name, self._stamp):
+                df = _sidecar._read_study(self._file_name).data_frame()
+                _sidecar._write(self._file_name, self._stamp, df)
+                if not _sidecar._is_current(self._file_name, self._stamp):
+                    return None
+            path = _sidecar._sidecar_path(self._file_name)
+            return _query._query(self._backend, path, simulation_type, status, columns)
+
+        return self.cached(("query", simulation_type, status, tuple(columns)), create)
+
+    def cached(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """Get a value derived from the current version of the study.
+
+        The value is created on first use and dropped when the study changes.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the value.
+        create : Callable[[], Any]
+            Function that creates the value.
+
+        Returns
+        -------
+        Any
+            Cached or created value.
+        """
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = create()
+            return self._cache[key]
+
+    def refresh(self) -> bool:
+        """Pick up changes made directly to the study.
+
+        Returns
+        -------
+        bool
+            ``True`` if the study changed since the snapshot was taken.
+        """
+        with self._lock:
+            stamp = self.__file_stamp()
+            if self._frame is None and not self.loaded:
+                # Only values derived from the study file are held, and they
+                # are read again on next use.
+                if stamp == self._stamp:
+                    return False
+                self._stamp = stamp
+                old_key = self._advance()
+            else:
+                self._stamp = stamp
+                df = self.__read(self._stamp)
+                changes = None if self._frame is None else _diff(self._frame, df)
+                if changes is not None and not any(map(len, changes)):
+                    return False
+                self._frame = df
+                old_key = self._advance(changes)
+        self._notify(old_key)
+        return True
+
+    def poll(self) -> bool:
+        """Pick up changes to the study if its file was saved since the last check.
+
+        The study saves its file whenever it changes, so polling only reads
+        the file status until the study changes. Changes made directly to the
+        study without saving it are not picked up.
+
+        Returns
+        -------
+        bool
+            ``True`` if the study changed since the snapshot was taken.
+        """
+        with self._lock:
+            # If nothing was read since the last change, the study is read
+            # on next use anyway.
+            if (self._frame is None and not self._cache) or self.__file_stamp() == self._stamp:
+                return False
+        return self.refresh()
+
+    def invalidate(self):
+        """Drop the snapshot so that it is taken again on next use."""
+        with self._lock:
+            self._frame = None
+            old_key = self._advance()
+        self._notify(old_key)
+
+    def set_simulation_status(self, ids: str | list[str], status: SimulationStatus):
+        """Set the status of simulations in the study.
+
+        Parameters
+        ----------
+        ids : str, list[str]
+            One or more IDs of the simulations to update.
+        status : SimulationStatus
+            Status for the simulations.
+        """
+        changes = {ColumnNames.STATUS: status}
+        if status == SimulationStatus.ERROR:
+            changes[ColumnNames.ERROR_MESSAGE] = ""
+        self._update(ids, changes, lambda: self.study.set_simulation_status(ids, status))
+
+    def set_priority(self, ids: str | list[str], priority: int):
+        """Set the priority of simulations in the study.
+
+        Parameters
+        ----------
+        ids : str, list[str]
+            One or more IDs of the simulations to update.
+        priority : int
+            Priority for the simulations.
+        """
+        changes = {ColumnNames.PRIORITY: priority}
+        self._update(ids, changes, lambda: self.study.set_priority(ids, priority))
+
+    def set_iteration(self, ids: str | list[str], iteration: int):
+        """Set the iteration number of simulations in the study.
+
+        Parameters
+        ----------
+        ids : str, list[str]
+            One or more IDs of the simulations to update.
+        iteration : int
+            Iteration for the simulations.
+        """
+        changes = {ColumnNames.ITERATION: iteration}
+        self._update(ids, changes, lambda: self.study.set_iteration(ids, iteration))
+
+    def _update(self, ids: str | list[str], changes: dict[str, Any], write: Callable[[], None]):
+        """Write changes to the study and apply them to the snapshot.
+
+        The data frame of the snapshot is copied rather than edited in place,
+        so that readers holding the previous data frame are not affected.
+        """
+        if isinstance(ids, str):
+            ids = [ids]
+        with self._lock:
+            write()
+            if self._frame is None:
+                old_key = self._advance()
+            else:
+                df = self._frame.copy()
+                mask = df[ColumnNames.ID].isin(ids)
+                for column, value in changes.items():
+                    df.loc[mask, column] = value
+                self._frame = df
+                old_key = self._advance(StudyChanges(df.iloc[:0], df[mask], []))
+        self._notify(old_key)
+
+    def _advance(self, changes: StudyChanges | None = None) -> tuple:
+        """Move to the next version of the study without notifying watchers.
+
+        Must be called with the lock held. Returns the key of the previous
+        version, to pass to :meth:`_notify` once the lock is released.
+        """
+        old_key = self.key
+        self._cache = {}
+        # Readers not holding the lock check that the version did not change
+        # after reading the changes, so the version is incremented first.
+        with param.discard_events(self), param.edit_constant(self):
+            self.version += 1
+        self._changes = changes
+        return old_key
+
+    def _notify(self, old_key: tuple):
+        """Notify watchers of a new version, without holding the lock."""
+        figure_cache.invalidate(old_key)
+        self.param.trigger("version")
+
+    def __file_stamp(self) -> tuple[int, int] | None:
+        return _sidecar._file_stamp(self.file_name)
+
+    @metrics.timed("read")
+    def __read(self, stamp: tuple[int, int] | None, columns: list[str] | None = None):
+        """Read the simulations of the study, or some of their columns.
+
+        A snapshot of a study file reads the sidecar file of the study file,
+        and writes it first if it is missing or out of date.
+        """
+        if self.loaded:
+            df = self._study.data_frame()
+        else:
+            df = _sidecar._read(self._file_name, stamp, columns)
+            if df is not None:
+                return df
+            df = _sidecar._read_study(self._file_name).data_frame()
+            _sidecar._write(self._file_name, stamp, df)
+            # Read the new sidecar file, so that the columns have the same
+            # types whether the sidecar file existed or not.
+            sidecar_df = _sidecar._read(self._file_name, stamp)
+            if sidecar_df is not None:
+                df = sidecar_df
+        return df if columns is None else df[columns]
+
+
+def _diff(old: pd.DataFrame, new: pd.DataFrame) -> StudyChanges | None:
+    """Compare two versions of a study data frame row by row, matching rows by ID.
+
+    Returns ``None`` if the rows cannot be matched, that is if the columns
+    changed or IDs are not unique.
+    """
+    old_ids, new_ids = old[ColumnNames.ID], new[ColumnNames.ID]
+    if not old.columns.equals(new.columns) or not (old_ids.is_unique and new_ids.is_unique):
+        return None
+    kept = new_ids.isin(old_ids).to_numpy()
+    current = new[kept]
+    previous = old.set_index(ColumnNames.ID).loc[current[ColumnNames.ID]].reset_index()
+    previous = previous[new.columns].set_axis(current.index)
+    same = (previous == current) | (previous.isna() & current.isna())
+    return StudyChanges(
+        new[~kept],
+        current[~same.all(axis=1).to_numpy()],
+        old_ids[~old_ids.isin(new_ids)].tolist(),
+    )
@@ -0,0 +1,297 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a Panel server displaying parametric studies.
+
+Run the server from the command line with the study files to display:
+
+.. code:: console
+
+   python -m ansys.additive.widgets.serve demo-study.ps
+
+Each study is opened once per server process, and all browser sessions
+share its snapshot, so the simulations, slice indexes, and figures are
+computed once and reused by every session. Before the server accepts
+connections, the table and the default slice of each plot are computed,
+so that new sessions display them without computing anything.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import pathlib
+from typing import Callable, Sequence
+import warnings
+
+from ansys.additive.core import SimulationType
+from ansys.additive.core.parametric_study import ColumnNames, ParametricStudy
+import panel as pn
+
+from ansys.additive.widgets import display
+from ansys.additive.widgets.display._query import BACKENDS
+
+# Plots that can be served, and the type of the simulations they plot.
+PLOTS = {
+    "porosity_eval_plot": SimulationType.POROSITY,
+    "porosity_contour_plot": SimulationType.POROSITY,
+    "single_bead_eval_plot": SimulationType.SINGLE_BEAD,
+    "ave_grain_size_plot": SimulationType.MICROSTRUCTURE,
+}
+
+# Titles of the tabs of the plots.
+_TITLES = {
+    "porosity_eval_plot": "Porosity",
+    "porosity_contour_plot": "Porosity Contours",
+    "single_bead_eval_plot": "Single Bead",
+    "ave_grain_size_plot": "Grain Size",
+}
+
+
+def serve(
+    studies: Sequence[ParametricStudy | display.StudySnapshot | str | os.PathLike],
+    port: int = 5006,
+    address: str | None = None,
+    plots: Sequence[str] | None = None,
+    poll_period: float | None = None,
+    backend: str = "pandas",
+    metrics: bool = False,
+    metrics_port: int | None = None,
+    show: bool = False,
+    start: bool = True,
+    **kwargs,
+):
+    """Serve the table and plots of parametric studies.
+
+    Each study is served at its own path, named after its file. The studies
+    are opened and the default view of each plot is computed before the
+    server starts. Plots without simulations to display are not served.
+
+    Parameters
+    ----------
+    studies : Sequence[ParametricStudy, StudySnapshot, str, os.PathLike]
+        Parametric studies, snapshots, or names of study files to serve.
+    port : int, default: 5006
+        Port of the server. If ``0``, a free port is chosen.
+    address : str, default: None
+        Address of the server. If ``None``, all interfaces are used.
+    plots : Sequence[str], default: None
+        Names of the plots to serve, see :data:`PLOTS`. If ``None``, all
+        plots are served.
+    poll_period : float, default: None
+        Period, in seconds, at which the studies are checked for changes,
+        for example while their simulations run. If ``None``, only changes
+        made through the served table are displayed.
+    backend : str, default: "pandas"
+        Query backend of the snapshots of study files, see :class:`.StudySnapshot`.
+    metrics : bool, default: False
+        Whether to record the metrics of the widgets and serve them in the
+        Prometheus text format at the ``/metrics`` path, see :data:`.metrics`.
+    metrics_port : int, default: None
+        Port of a separate server serving the metrics in the Prometheus text
+        format on the local interface, see :meth:`.Metrics.serve`. If ``None``,
+        the metrics are not served on a separate port.
+    show : bool, default: False
+        Whether to open the served studies in a browser.
+    start : bool, default: True
+        Whether to start the server and block until it stops.
+    **kwargs
+        Other arguments of :func:`panel.serve`, for example ``websocket_origin``.
+
+    Returns
+    -------
+    bokeh.server.server.Server
+        Server.
+    """
+    plots = list(PLOTS) if plots is None else list(plots)
+    for name in plots:
+        if name not in PLOTS:
+            raise ValueError(f"Unknown plot {name!r}, expected one of {list(PLOTS)}.")
+    apps = {}
+    for study in studies:
+        snapshot = _snapshot(study, backend)
+        served = _warm(snapshot, plots)
+        apps[_route(snapshot, apps)] = _app(snapshot, served, poll_period)
+    if metrics:
+        display.metrics.enable()
+        kwargs.setdefault("extra_patterns", []).append(("/metrics", _metrics_handler()))
+    if metrics_port is not None:
+        display.metrics.serve(metrics_port)
+    return pn.serve(
+        apps,
+        port=port,
+        address=address,
+        show=show,
+        start=start,
+        title={route: f"{route} - PyAdditive" for route in apps},
+        **kwargs,
+    )
+
+
+def _snapshot(
+    study: ParametricStudy | display.StudySnapshot | str | os.PathLike, backend: str
+) -> display.StudySnapshot:
+    """Get the snapshot of a study shared by all sessions."""
+    if isinstance(study, (ParametricStudy, display.StudySnapshot)):
+        return display.StudySnapshot.of(study)
+    return display.StudySnapshot(study, backend)
+
+
+def _warm(snapshot: display.StudySnapshot, plots: Sequence[str]) -> list[str]:
+    """Compute the simulations and the default view of the plots of a study.
+
+    The values computed are cached by the snapshot and the figure cache,
+    so that sessions reuse them. No widgets are created.
+
+    Returns
+    -------
+    list[str]
+        Names of the plots that have simulations to display.
+    """
+    snapshot.data_frame()
+    served = []
+    for name in plots:
+        if __count(snapshot, PLOTS[name]) == 0:
+            continue
+        try:
+            importlib.import_module(f"{display.__name__}.{name}")._warm(snapshot)
+        except ValueError as e:
+            warnings.warn(f"Not serving {name} of {snapshot.file_name}: {e}")
+            continue
+        served.append(name)
+    return served
+
+
+def _app(
+    snapshot: display.StudySnapshot, plots: Sequence[str], poll_period: float | None
+) -> Callable[[], pn.Tabs]:
+    """Get the function creating the view of a study for each session."""
+
+    def app() -> pn.Tabs:
+        tabs = [("Simulations", display.show_table(snapshot, poll_period=poll_period))]
+        for name in plots:
+            # Compute figures in background threads, so that a slow slice
+            # does not hold up the other sessions of the server.
+            plot = getattr(display, name)(snapshot, poll_period=poll_period, background=True)
+            tabs.append((_TITLES[name], plot))
+        # Only the active tab is sent to the browser.
+        return pn.Tabs(*tabs, dynamic=True, sizing_mode="stretch_both")
+
+    return app
+
+
+def _route(snapshot: display.StudySnapshot, apps: dict) -> str:
+    """Get a path, unique among the served studies, named after the file of a study."""
+    stem = pathlib.Path(snapshot.file_name).stem if snapshot.file_name else "study"
+    route, n = stem, 1
+    while route in apps:
+        n += 1
+        route = f"{stem}-{n}"
+    return route
+
+
+def _metrics_handler():
+    """Get a request handler serving the metrics in the Prometheus text format."""
+    from tornado.web import RequestHandler
+
+    class MetricsHandler(RequestHandler):
+        def get(self):
+            self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.write(display.metrics.to_prometheus())
+
+    return MetricsHandler
+
+
+def __count(snapshot: display.StudySnapshot, simulation_type: SimulationType) -> int:
+    """Count the completed simulations of a type."""
+    query = snapshot.query(simulation_type, [ColumnNames.ID])
+    if query is not None:
+        return query.count()
+    return len(snapshot.simulations(simulation_type, [ColumnNames.ID]))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the server from the command line.
+
+    Parameters
+    ----------
+    argv : Sequence[str], default: None
+        Command line arguments. If ``None``, the arguments of the process are used.
+
+    Returns
+    -------
+    int
+        Exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ansys.additive.widgets.serve",
+        description="Serve the table and plots of parametric studies.",
+    )
+    parser.add_argument("studies", nargs="+", help="parametric study files")
+    parser.add_argument("--port", type=int, default=5006, help="port of the server (default: 5006)")
+    parser.add_argument("--address", help="address of the server (default: all interfaces)")
+    parser.add_argument(
+        "--allow-websocket-origin",
+        nargs="+",
+        dest="websocket_origin",
+        help="hosts the server can be reached at, if not localhost",
+    )
+    parser.add_argument(
+        "--plot", nargs="+", choices=list(PLOTS), dest="plots", help="plots to serve (default: all)"
+    )
+    parser.add_argument(
+        "--poll", type=float, dest="poll_period", help="period of the checks for study changes"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="pandas",
+        help="query backend reading the study files (default: pandas)",
+    )
+    parser.add_argument(
+        "--metrics", action="store_true", help="serve metrics in the Prometheus format at /metrics"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=os.getenv("ANSYS_ADDITIVE_WIDGETS_METRICS_PORT"),
+        help="serve metrics in the Prometheus format on this local port "
+        "(default: ANSYS_ADDITIVE_WIDGETS_METRICS_PORT)",
+    )
+    parser.add_argument("--show", action="store_true", help="open the studies in a browser")
+    args = parser.parse_args(argv)
+    serve(
+        args.studies,
+        port=args.port,
+        address=args.address,
+        plots=args.plots,
+        poll_period=args.poll_period,
+        backend=args.backend,
+        metrics=args.metrics,
+        metrics_port=args.metrics_port,
+        websocket_origin=args.websocket_origin,
+        show=args.show,
+    )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,45 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pathlib
+import shutil
+
+from ansys.additive.core.parametric_study import ParametricStudy
+import pytest
+
+STUDIES_DIR = pathlib.Path(__file__).parents[1]
+
+
+def __load_study(name: str, tmp_path: pathlib.Path) -> ParametricStudy:
+    # Loading a study may save it in a newer format, so load a copy.
+    shutil.copy(STUDIES_DIR / name, tmp_path)
+    return ParametricStudy.load(tmp_path / name)
+
+
+@pytest.fixture
+def porosity_study(tmp_path: pathlib.Path) -> ParametricStudy:
+    return __load_study("porosity-study.ps", tmp_path)
+
+
+@pytest.fixture
+def single_bead_study(tmp_path: pathlib.Path) -> ParametricStudy:
+    return __load_study("single-bead-study.ps", tmp_path)
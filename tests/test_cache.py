@@ -0,0 +1,95 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import plotly.graph_objects as go
+
+from ansys.additive.widgets.display.cache import FigureCache
+
+
+def test_get_or_create_counts_hits_and_misses():
+    cache = FigureCache()
+    calls = []
+
+    def create():
+        calls.append(1)
+        return "figure"
+
+    assert cache.get_or_create(("v1", "plot", 1), create) == "figure"
+    assert cache.get_or_create(("v1", "plot", 1), create) == "figure"
+
+    assert len(calls) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = FigureCache(max_entries=2)
+    cache.put(("v1", 1), 1)
+    cache.put(("v1", 2), 2)
+    cache.get(("v1", 1))
+
+    cache.put(("v1", 3), 3)
+
+    assert ("v1", 1) in cache
+    assert ("v1", 2) not in cache
+    assert ("v1", 3) in cache
+
+
+def test_entries_are_evicted_when_memory_is_exceeded():
+    cache = FigureCache(max_bytes=1000)
+    cache.put(("v1", 1), np.zeros(100))
+    assert cache.nbytes == 800
+
+    cache.put(("v1", 2), np.zeros(100))
+
+    assert len(cache) == 1
+    assert ("v1", 2) in cache
+    assert cache.nbytes == 800
+
+    cache.max_bytes = 100
+
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_figure_memory_is_estimated_from_trace_data():
+    cache = FigureCache()
+
+    cache.put(("v1", 1), go.Figure(go.Heatmap(z=np.zeros((10, 10)))))
+
+    assert cache.nbytes >= 800
+
+
+def test_invalidate_removes_entries_of_a_study_version():
+    cache = FigureCache()
+    cache.put(("v1", 1), 1)
+    cache.put(("v2", 1), 2)
+
+    cache.invalidate("v1")
+
+    assert ("v1", 1) not in cache
+    assert ("v2", 1) in cache
+
+    cache.invalidate()
+
+    assert len(cache) == 0
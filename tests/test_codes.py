@@ -0,0 +1,43 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+
+from ansys.additive.widgets.display._codes import _Codes
+
+
+def test_codes_merge_values_within_tolerance():
+    codes = _Codes(np.array([50e-6, 40e-6, np.nan, 4.0000000001e-05, 3.9999999999999996e-05]))
+
+    assert codes.levels.tolist() == [3.9999999999999996e-05, 50e-6]
+    assert codes.codes.tolist() == [1, 0, -1, 0, 0]
+    assert codes.codes.dtype == np.int8
+    assert codes.encode(40e-6) == 0
+    assert codes.encode(np.nan) == -1
+    assert codes.encode(45e-6) == -2
+    np.testing.assert_array_equal(codes.decode(np.array([1, -1])), [50e-6, np.nan])
+
+
+def test_codes_use_smallest_integer_type():
+    assert _Codes(np.arange(200.0)).codes.dtype == np.int16
+    assert _Codes(np.arange(40000.0)).codes.dtype == np.int32
+    assert _Codes(np.array([])).levels.size == 0
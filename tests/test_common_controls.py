@@ -0,0 +1,88 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import gc
+
+import pandas as pd
+
+from ansys.additive.widgets.display import StudySnapshot
+from ansys.additive.widgets.display._common_controls import _common_controls
+from ansys.additive.widgets.display._slice_index import _PARAMETER_COLUMNS, _SliceIndex
+
+
+def __sparse_index() -> _SliceIndex:
+    # Two slices that differ in every parameter.
+    df = pd.DataFrame(
+        [
+            [80, 40e-6, 80e-6, 0, 45, 100e-6, 0.01],
+            [100, 50e-6, 90e-6, 15, 67.5, 110e-6, 0.02],
+        ],
+        columns=_PARAMETER_COLUMNS,
+    )
+    return _SliceIndex(df)
+
+
+def test_controls_only_offer_existing_combinations(porosity_study):
+    index = __sparse_index()
+    *selects, selection = _common_controls(StudySnapshot(porosity_study), lambda s: index)
+    ht, lt, bd, sa, ra, hs, sw = selects
+    changes = []
+    selection.param.watch(lambda event: changes.append(event.new), "value")
+
+    assert lt.values == [40e-6, 50e-6]
+    assert ht.values == [80]
+    assert selection.value == (80, 40e-6, 80e-6, 0, 45, 100e-6, 0.01)
+
+    lt.value = 50e-6
+
+    assert ht.values == [100]
+    assert sw.values == [0.02]
+    assert changes == [(100, 50e-6, 90e-6, 15, 67.5, 110e-6, 0.02)]
+    assert len(index.rows(*selection.value)) == 1
+
+
+def test_requested_slice_is_selected_at_once(porosity_study):
+    index = __sparse_index()
+    *selects, selection = _common_controls(StudySnapshot(porosity_study), lambda s: index)
+    changes = []
+    selection.param.watch(lambda event: changes.append(event.new), "value")
+    requested = index.slices()[1]
+
+    selection.requested = requested
+
+    assert changes == [requested]
+    assert tuple(select.value for select in selects) == requested
+
+
+def test_controls_follow_study_until_dropped(porosity_study):
+    index = __sparse_index()
+    snapshot = StudySnapshot(porosity_study)
+    *selects, selection = _common_controls(snapshot, lambda s: index)
+    selects[1].value = 50e-6
+    assert len(snapshot.param.watchers["version"]["value"]) == 1
+
+    snapshot.invalidate()
+
+    assert selects[1].value == 50e-6
+    del selects, selection
+    gc.collect()
+    assert snapshot.param.watchers.get("version", {}).get("value", []) == []
@@ -0,0 +1,146 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import base64
+import json
+import pathlib
+
+from ansys.additive.core import SimulationStatus
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from ansys.additive.widgets.display import StudySnapshot
+from ansys.additive.widgets.display import export as export_module
+from ansys.additive.widgets.display import export_slices
+
+
+def __files(directory: pathlib.Path) -> list[str]:
+    return sorted(
+        p.relative_to(directory).as_posix()
+        for p in directory.rglob("*")
+        if p.is_file() and p.name != export_module.MANIFEST
+    )
+
+
+def test_export_writes_every_slice_once(single_bead_study, tmp_path):
+    tmp_path = tmp_path / "out"
+    written = export_slices(
+        single_bead_study, tmp_path, plots=["single_bead_eval_plot"], formats=["json"], processes=1
+    )
+
+    files = __files(tmp_path)
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in written) == files
+    # Two slices, each written once per parameter of interest.
+    assert len(files) == 4
+    assert all(f.startswith("single_bead_eval_plot/ht") for f in files)
+    figure = json.loads((tmp_path / files[0]).read_text())
+    assert figure["layout"]["title"]["text"].startswith("Melt Pool")
+    # Numeric arrays are written as base64 encoded typed arrays.
+    assert all(trace["x"]["dtype"] == "f8" and "bdata" in trace["x"] for trace in figure["data"])
+    manifest = json.loads((tmp_path / export_module.MANIFEST).read_text())
+    assert sorted(manifest) == files
+
+    plots = ["single_bead_eval_plot"]
+    assert export_slices(single_bead_study, tmp_path, plots, formats=["json"], processes=1) == []
+    assert len(export_slices(single_bead_study, tmp_path, plots, formats=["json"], force=True)) == 4
+
+
+def test_export_rewrites_only_changed_slices(single_bead_study, tmp_path):
+    tmp_path = tmp_path / "out"
+    snapshot = StudySnapshot(single_bead_study)
+    export_slices(snapshot, tmp_path, plots=["single_bead_eval_plot"], formats=["json"])
+    df = snapshot.data_frame()
+    row = df[df[ColumnNames.STATUS] == SimulationStatus.COMPLETED].iloc[0]
+
+    snapshot.set_simulation_status(row[ColumnNames.ID], SimulationStatus.SKIP)
+    written = export_slices(snapshot, tmp_path, plots=["single_bead_eval_plot"], formats=["json"])
+
+    assert len(written) == 2
+    assert all(
+        p.name.startswith(f"ht{row[ColumnNames.HEATER_TEMPERATURE]:.10g}_")  # noqa: E231
+        for p in written
+    )
+
+
+def test_export_in_worker_processes(single_bead_study, tmp_path, monkeypatch):
+    monkeypatch.setattr(export_module, "_CHUNK_SIZE", 1)
+    plots = ["single_bead_eval_plot"]
+    inline = export_slices(
+        single_bead_study, tmp_path / "inline", plots, formats=["json", "html"], processes=1
+    )
+    pooled = export_slices(
+        single_bead_study, tmp_path / "pooled", plots, formats=["json", "html"], processes=2
+    )
+
+    assert __files(tmp_path / "pooled") == __files(tmp_path / "inline")
+    assert len(pooled) == len(inline) == 8
+    for path in __files(tmp_path / "pooled"):
+        if path.endswith(".json"):
+            assert (tmp_path / "pooled" / path).read_text() == (
+                tmp_path / "inline" / path
+            ).read_text()
+
+
+def test_export_skips_plots_without_enough_data(single_bead_study, tmp_path):
+    with pytest.warns(UserWarning, match="porosity_contour_plot"):
+        written = export_slices(single_bead_study, tmp_path / "out", formats=["json"], processes=1)
+
+    assert {p.parent.name for p in written} == {"single_bead_eval_plot"}
+
+
+def test_export_rejects_unknown_plots_and_formats(single_bead_study, tmp_path):
+    with pytest.raises(ValueError, match="Unknown plot"):
+        export_slices(single_bead_study, tmp_path, plots=["table"])
+    with pytest.raises(ValueError, match="Unknown format"):
+        export_slices(single_bead_study, tmp_path, formats=["svg"])
+
+
+def test_export_main(single_bead_study, tmp_path, capsys):
+    status = export_module.main(
+        [
+            str(single_bead_study.file_name),
+            str(tmp_path / "out"),
+            "--plot",
+            "single_bead_eval_plot",
+            "--format",
+            "json",
+            "--processes",
+            "1",
+        ]
+    )
+
+    assert status == 0
+    assert "Wrote 4 files" in capsys.readouterr().out
+    assert len(__files(tmp_path / "out")) == 4
+
+
+def test_typed_arrays_are_little_endian_and_row_major():
+    z = np.arange(6, dtype=">i4").reshape(2, 3).T
+    fig = go.Figure(go.Heatmap(z=z))
+
+    spec = getattr(export_module, "__typed_arrays")(fig)["data"][0]["z"]
+
+    assert spec["dtype"] == "i4" and spec["shape"] == "3,2"
+    decoded = np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<i4").reshape(3, 2)
+    np.testing.assert_array_equal(decoded, z)
@@ -0,0 +1,141 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import threading
+
+import numpy as np
+import panel as pn
+import plotly.graph_objects as go
+
+from ansys.additive.widgets.display._figure_patch import _patch_figure, _plotly_pane
+
+
+def __figure(z: list, sizes: list, x_range: list) -> go.Figure:
+    fig = go.Figure(
+        [
+            go.Heatmap(x=[1, 2], y=[1], z=np.array(z)),
+            go.Scatter(x=[1, 2], y=[1, 1], marker=dict(color="black", size=sizes)),
+        ]
+    )
+    fig.update_xaxes(title_text="Scan Speed (m/s)", range=x_range)
+    return fig
+
+
+def __record_messages(fig: go.Figure) -> list:
+    messages = []
+    fig._send_update_msg = lambda *args, **kwargs: messages.append(kwargs)
+    return messages
+
+
+def test_patch_figure_sends_only_changed_properties():
+    target = __figure([[1, np.nan]], [5, 5], [0, 3])
+    messages = __record_messages(target)
+
+    assert _patch_figure(target, __figure([[1, np.nan]], [5, 8], [0, 4]))
+
+    assert messages == [
+        {
+            "restyle_data": {"marker.size": [[5, 8]]},
+            "relayout_data": {"xaxis.range": [0, 4]},
+            "trace_indexes": [1],
+        }
+    ]
+    assert target.data[1].marker.size == (5, 8)
+    assert target.layout.xaxis.range == (0, 4)
+
+
+def test_patch_figure_groups_traces_by_changed_properties():
+    target = __figure([[1, 2]], [5, 5], [0, 3])
+    messages = __record_messages(target)
+
+    assert _patch_figure(target, __figure([[3, 4]], [5, 8], [0, 3]))
+
+    assert [m["trace_indexes"] for m in messages] == [[0], [1]]
+    np.testing.assert_array_equal(target.data[0].z, [[3, 4]])
+
+
+def test_patch_figure_without_changes_sends_nothing():
+    target = __figure([[1, np.nan]], [5, 5], [0, 3])
+    messages = __record_messages(target)
+
+    assert _patch_figure(target, go.Figure(target))
+
+    assert messages == []
+
+
+def test_patch_figure_with_different_traces_fails():
+    target = __figure([[1, 2]], [5, 5], [0, 3])
+
+    assert not _patch_figure(target, go.Figure(go.Scatter(x=[1], y=[1])))
+
+
+def test_plotly_pane_in_background_applies_only_last_figure():
+    release = threading.Event()
+    threads = []
+
+    def update(value: int) -> go.Figure:
+        threads.append(threading.current_thread())
+        if value == 1:
+            # Hold the first update until the second one supersedes it.
+            release.wait(5)
+        return __figure([[value, value]], [5, 5], [0, 3])
+
+    async def run():
+        widget = pn.widgets.IntInput(value=0)
+        pane = _plotly_pane(update, widget, background=True)
+        widget.value = 1
+        await asyncio.sleep(0.05)
+        assert pane.loading
+        widget.value = 2
+        release.set()
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if not pane.loading:
+                break
+        # Let the superseded update finish.
+        await asyncio.sleep(0.1)
+        return pane
+
+    pane = asyncio.run(run())
+
+    assert not pane.loading
+    np.testing.assert_array_equal(pane.object.data[0].z, [[2, 2]])
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads[1:]
+
+
+def test_plotly_pane_computes_each_argument_values_once():
+    first = pn.widgets.IntInput(value=0)
+    second = pn.widgets.IntInput(value=0)
+    calls = []
+
+    def update(a, b):
+        calls.append((a, b))
+        return go.Figure(go.Scatter(x=[a], y=[b]))
+
+    # Changing the first input resets the second one before the pane sees the change.
+    first.param.watch(lambda event: setattr(second, "value", event.new), "value")
+    _plotly_pane(update, first, second)
+    first.value = 1
+
+    assert calls == [(0, 0), (1, 1)]
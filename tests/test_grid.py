@@ -0,0 +1,101 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import pandas as pd
+
+from ansys.additive.widgets.display._grid import _grid, _grids, _range_scores
+
+
+def test_grid_builds_sorted_axes_and_fills_missing_cells_with_nan():
+    df = pd.DataFrame(
+        {
+            ColumnNames.LASER_POWER: [100, 50, 50, 100],
+            ColumnNames.SCAN_SPEED: [0.5, 1.0, 0.5, 1.5],
+            ColumnNames.RELATIVE_DENSITY: [0.9, 0.8, 0.7, 0.6],
+        }
+    )
+
+    speeds, powers, (z,) = _grid(df, [ColumnNames.RELATIVE_DENSITY])
+
+    assert speeds.tolist() == [0.5, 1.0, 1.5]
+    assert powers.tolist() == [50, 100]
+    np.testing.assert_array_equal(z, [[0.7, 0.8, np.nan], [0.9, np.nan, 0.6]])
+
+
+def test_grid_uses_first_simulation_in_a_cell_and_skips_missing_values():
+    df = pd.DataFrame(
+        {
+            ColumnNames.LASER_POWER: [50, 50, None, 100],
+            ColumnNames.SCAN_SPEED: [0.5, 0.5, 1.0, 1.0],
+            ColumnNames.BUILD_RATE: [1.0, 2.0, 3.0, None],
+        },
+        dtype=object,
+    )
+
+    speeds, powers, (z,) = _grid(df, [ColumnNames.BUILD_RATE])
+
+    assert speeds.tolist() == [0.5, 1.0]
+    assert powers.tolist() == [50, 100]
+    np.testing.assert_array_equal(z, [[1.0, np.nan], [np.nan, np.nan]])
+
+
+def test_grid_with_empty_slice():
+    df = pd.DataFrame(columns=[ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED, "z"])
+
+    speeds, powers, (z,) = _grid(df, ["z"])
+
+    assert len(speeds) == 0
+    assert len(powers) == 0
+    assert z.shape == (0, 0)
+
+
+def test_grids_of_several_slices_share_their_axes():
+    df = pd.DataFrame(
+        {
+            ColumnNames.LASER_POWER: [100, 50, 50, 100, 50],
+            ColumnNames.SCAN_SPEED: [0.5, 1.0, 0.5, 1.5, 0.5],
+            ColumnNames.RELATIVE_DENSITY: [0.9, 0.8, 0.7, 0.6, 0.5],
+        }
+    )
+
+    speeds, powers, (z,) = _grids(df, np.array([1, 0, 0, 1, 2]), 3, [ColumnNames.RELATIVE_DENSITY])
+
+    assert speeds.tolist() == [0.5, 1.0, 1.5]
+    assert powers.tolist() == [50, 100]
+    np.testing.assert_array_equal(
+        z,
+        [
+            [[0.7, 0.8, np.nan], [np.nan, np.nan, np.nan]],
+            [[np.nan, np.nan, np.nan], [0.9, np.nan, 0.6]],
+            [[0.5, np.nan, np.nan], [np.nan, np.nan, np.nan]],
+        ],
+    )
+
+
+def test_range_scores():
+    z = np.array([[0.5, 0.85], [0.999, np.nan]])
+
+    scores = _range_scores(z, (0.8, 0.95), 1.0)
+
+    np.testing.assert_allclose(scores, [[0.1 + 0.3, 0.01], [0.1 + 0.05, np.nan]])
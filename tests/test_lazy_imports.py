@@ -0,0 +1,54 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import subprocess
+import sys
+
+
+def __imported(statement: str, *modules: str) -> tuple[bool, ...]:
+    check = ", ".join(f"{m!r} in sys.modules" for m in modules)
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", f"import sys; {statement}; print(({check},))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return eval(out.stdout.strip())
+
+
+def test_package_import_does_not_import_widgets():
+    assert __imported("import ansys.additive.widgets.display", "panel", "plotly") == (False, False)
+
+
+def test_show_table_does_not_import_plotly():
+    assert __imported(
+        "from ansys.additive.widgets.display import show_table", "panel", "plotly"
+    ) == (True, False)
+
+
+def test_widget_module_import_keeps_widget_function():
+    statement = (
+        "import ansys.additive.widgets.display.show_table; "
+        "from ansys.additive.widgets.display import show_table; "
+        "assert callable(show_table)"
+    )
+    __imported(statement, "panel")
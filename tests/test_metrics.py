@@ -0,0 +1,107 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import urllib.request
+
+from ansys.additive.core.parametric_study import ColumnNames
+import panel as pn
+import pytest
+
+from ansys.additive.widgets.display import Metrics, metrics, single_bead_eval_plot
+
+
+@pytest.fixture
+def enabled_metrics():
+    metrics.clear()
+    metrics.enable()
+    yield metrics
+    metrics.enable(False)
+    metrics.clear()
+
+
+def test_metrics_are_not_recorded_when_off():
+    registry = Metrics()
+
+    with registry.timer("figure", plot="plot"):
+        pass
+    registry.observe("payload_bytes", 100)
+    registry.increment("cache_lookups_total", result="hit")
+
+    assert registry.histograms() == {}
+    assert registry.counters() == {}
+
+
+def test_histograms_aggregate_values_by_labels():
+    registry = Metrics()
+    registry.enable()
+
+    for value in [1000, 3000, 5000, 1e9]:
+        registry.observe("payload_bytes", value, plot="a")
+    registry.observe("payload_bytes", 10, plot="b", stage=None)
+
+    histogram = registry.histograms()[("payload_bytes", (("plot", "a"),))]
+    assert histogram.count == 4
+    assert histogram.sum == 1000 + 3000 + 5000 + 1e9
+    assert histogram.counts[:3] == [1, 2, 3]
+    assert histogram.counts[-1] == 4
+    assert 1024 <= histogram.quantile(0.5) <= 4096
+    summary = registry.summary()
+    assert summary[["metric", "plot", "count"]].values.tolist() == [
+        ["payload_bytes", "a", 4],
+        ["payload_bytes", "b", 1],
+    ]
+
+
+def test_plot_updates_record_stages_and_cache_lookups(single_bead_study, enabled_metrics):
+    plot = single_bead_eval_plot(single_bead_study)
+    select = next(
+        w for w in plot.select(pn.widgets.Select) if w.name == "Melt Pool Parameter of Interest"
+    )
+    select.value = ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH
+
+    stages = {
+        dict(labels)["stage"] for name, labels in metrics.histograms() if name != "payload_bytes"
+    }
+    assert {"read", "select", "index", "grid", "figure", "update", "patch"} <= stages
+    assert ("payload_bytes", (("plot", "single_bead_eval_plot"),)) in metrics.histograms()
+    lookups = metrics.counters()
+    assert any(dict(labels).get("plot") == "single_bead_eval_plot" for _, labels in lookups)
+
+
+def test_metrics_are_served_in_prometheus_format():
+    registry = Metrics()
+    registry.enable()
+    with registry.timer("figure", plot='a "b"'):
+        pass
+    server = registry.serve(0)
+    try:
+        assert server.server_address[0] == "127.0.0.1"
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            text = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "# TYPE ansys_additive_widgets_stage_seconds histogram" in text
+    assert 'ansys_additive_widgets_stage_seconds_count{plot="a \\"b\\"",stage="figure"} 1' in text
+    assert 'le="+Inf"' in text
+    assert "ansys_additive_widgets_figure_cache_entries " in text
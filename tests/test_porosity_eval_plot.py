@@ -0,0 +1,95 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import gc
+
+from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import panel as pn
+import param
+
+from ansys.additive.widgets.display import StudySnapshot, porosity_eval_plot
+
+
+def test_overview_counts_values_inside_the_range(porosity_study):
+    plot = porosity_eval_plot(porosity_study, overview=True)
+    table = next(iter(plot.select(pn.widgets.Tabulator)))
+    range_slider = next(iter(plot.select(pn.widgets.RangeSlider)))
+    df = porosity_study.data_frame()
+    df = df[
+        (df[ColumnNames.TYPE] == SimulationType.POROSITY)
+        & (df[ColumnNames.STATUS] == SimulationStatus.COMPLETED)
+    ]
+    densities = np.round(df[ColumnNames.RELATIVE_DENSITY].astype(float), 2)
+
+    with param.edit_constant(range_slider):
+        range_slider.value_throttled = (0.9, 1.0)
+
+    row = table.value.iloc[0]
+    assert len(table.value) == 1
+    assert row["Simulations"] == len(df)
+    assert row["In range"] == ((densities >= 0.9) & (densities <= 1.0)).sum()
+    assert row["Fraction in range"] == row["In range"] / len(df)
+    assert row["Highest Relative density"] == df[ColumnNames.RELATIVE_DENSITY].max()
+
+
+def test_setting_range_in_python_updates_plot(porosity_study):
+    plot = porosity_eval_plot(porosity_study, overview=True)
+    pane = next(iter(plot.select(pn.pane.Plotly)))
+    table = next(iter(plot.select(pn.widgets.Tabulator)))
+    range_slider = next(iter(plot.select(pn.widgets.RangeSlider)))
+    before = np.array(pane.object.data[0].z, dtype=float)
+
+    range_slider.value = (0.9, 1.0)
+
+    assert range_slider.value_throttled == (0.9, 1.0)
+    assert not np.array_equal(pane.object.data[0].z, before, equal_nan=True)
+    df = porosity_study.data_frame()
+    df = df[
+        (df[ColumnNames.TYPE] == SimulationType.POROSITY)
+        & (df[ColumnNames.STATUS] == SimulationStatus.COMPLETED)
+    ]
+    densities = np.round(df[ColumnNames.RELATIVE_DENSITY].astype(float), 2)
+    assert table.value.iloc[0]["In range"] == ((densities >= 0.9) & (densities <= 1.0)).sum()
+
+
+def test_dropped_plots_stop_watching_the_study(porosity_study):
+    snapshot = StudySnapshot(porosity_study)
+    plots = [porosity_eval_plot(snapshot) for _ in range(5)]
+    assert len(snapshot.param.watchers["version"]["value"]) == 10
+
+    del plots
+    gc.collect()
+
+    assert snapshot.param.watchers.get("version", {}).get("value", []) == []
+
+
+def test_dropped_overviews_stop_watching_the_study(porosity_study):
+    snapshot = StudySnapshot(porosity_study)
+    plot = porosity_eval_plot(snapshot, overview=True)
+    assert len(snapshot.param.watchers["version"]["value"]) == 3
+
+    del plot
+    gc.collect()
+
+    assert snapshot.param.watchers.get("version", {}).get("value", []) == []
@@ -0,0 +1,83 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import pstats
+
+from ansys.additive.core.parametric_study import ColumnNames
+import panel as pn
+import pytest
+
+from ansys.additive.widgets.display import profiler, single_bead_eval_plot
+
+
+@pytest.fixture
+def profiles(tmp_path):
+    yield tmp_path / "profiles"
+    profiler.disable()
+
+
+def __select_poi(plot: pn.Row):
+    select = next(
+        w for w in plot.select(pn.widgets.Select) if w.name == "Melt Pool Parameter of Interest"
+    )
+    select.value = ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH
+
+
+def test_plot_updates_are_profiled_with_widget_values(single_bead_study, profiles):
+    plot = single_bead_eval_plot(single_bead_study)
+    profiler.enable(profiles)
+
+    __select_poi(plot)
+
+    (tags_file,) = profiles.glob("*.json")
+    tags = json.loads(tags_file.read_text())
+    assert tags["widget"] == "single_bead_eval_plot"
+    assert tags["function"] == "update_plot"
+    assert ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH in tags["arguments"]
+    # The range drawn is recorded rather than the slider.
+    range_slider = next(iter(plot.select(pn.widgets.RangeSlider)))
+    assert list(range_slider.value_throttled) in tags["arguments"]
+    assert "<RangeSlider>" not in tags["arguments"]
+    assert tags["duration"] > 0
+    stats = pstats.Stats(str(profiles / tags["profile"]))
+    assert stats.total_calls > 0
+
+
+def test_interactions_are_sampled(single_bead_study, profiles):
+    plot = single_bead_eval_plot(single_bead_study)
+    profiler.enable(profiles, rate=0)
+
+    __select_poi(plot)
+
+    assert list(profiles.iterdir()) == []
+
+
+def test_interactions_can_be_profiled_with_pyinstrument(single_bead_study, profiles):
+    pytest.importorskip("pyinstrument")
+    plot = single_bead_eval_plot(single_bead_study)
+    profiler.enable(profiles, engine="pyinstrument")
+
+    __select_poi(plot)
+
+    (tags_file,) = profiles.glob("*.json")
+    assert json.loads(tags_file.read_text())["profile"].endswith(".html")
+    assert len(list(profiles.glob("*.html"))) == 1
@@ -0,0 +1,118 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import pandas as pd
+import pytest
+
+from ansys.additive.widgets.display import StudySnapshot, _query, _sidecar
+from ansys.additive.widgets.display._codes import _values
+from ansys.additive.widgets.display._slice_index import (
+    _PARAMETER_COLUMNS,
+    _QuerySliceIndex,
+    _SliceIndex,
+)
+
+# Columns of the queries. Single bead simulations have no start angle,
+# rotation angle, hatch spacing, or stripe width, so they are missing.
+_COLUMNS = _PARAMETER_COLUMNS + [
+    ColumnNames.LASER_POWER,
+    ColumnNames.SCAN_SPEED,
+    ColumnNames.MELT_POOL_DEPTH,
+]
+
+
+@pytest.mark.parametrize("backend", ["duckdb", "polars"])
+def test_query_slice_index_matches_slice_index(single_bead_study, backend):
+    pytest.importorskip(backend)
+    pytest.importorskip("pyarrow")
+    snapshot = StudySnapshot(single_bead_study.file_name, backend)
+    query = snapshot.query(SimulationType.SINGLE_BEAD, _COLUMNS)
+    df = StudySnapshot(single_bead_study).simulations(SimulationType.SINGLE_BEAD, _COLUMNS)
+
+    index = _QuerySliceIndex(query)
+    expected = _SliceIndex(df)
+
+    assert not snapshot.loaded
+    assert len(index) == len(expected)
+    assert index.slices() == expected.slices()
+    for values in expected.slices():
+        pd.testing.assert_frame_equal(
+            index.take(*values).astype(float),
+            expected.take(*values).reset_index(drop=True).astype(float),
+        )
+    assert len(index.take(*expected.slices()[0][:-1], 1.0)) == 0
+    assert index.range([ColumnNames.LASER_POWER]) == expected.range([ColumnNames.LASER_POWER])
+    assert index.range([ColumnNames.STRIPE_WIDTH]) == (None, None)
+    np.testing.assert_array_equal(
+        np.sort(index.unique(ColumnNames.SCAN_SPEED)),
+        np.sort(expected.unique(ColumnNames.SCAN_SPEED).astype(float)),
+    )
+    for actual, values in zip(
+        index.window(ColumnNames.MELT_POOL_DEPTH, (0, 5e-5)),
+        expected.window(ColumnNames.MELT_POOL_DEPTH, (0, 5e-5)),
+    ):
+        np.testing.assert_array_equal(actual, values)
+    axes, grid = expected.facets(expected.slices()[0], [ColumnNames.LAYER_THICKNESS])
+    rows, labels = index.take_slices(grid[grid >= 0], columns=[ColumnNames.MELT_POOL_DEPTH])
+    expected_rows, expected_labels = expected.take_slices(
+        grid[grid >= 0], columns=[ColumnNames.MELT_POOL_DEPTH]
+    )
+    order = np.lexsort([_values(rows, ColumnNames.MELT_POOL_DEPTH), labels])
+    expected_order = np.lexsort(
+        [_values(expected_rows, ColumnNames.MELT_POOL_DEPTH), expected_labels]
+    )
+    np.testing.assert_array_equal(labels[order], expected_labels[expected_order])
+    np.testing.assert_array_equal(
+        _values(rows, ColumnNames.MELT_POOL_DEPTH)[order],
+        _values(expected_rows, ColumnNames.MELT_POOL_DEPTH)[expected_order],
+    )
+
+
+def test_pandas_backend_does_not_query(single_bead_study):
+    assert StudySnapshot(single_bead_study.file_name).query(SimulationType.SINGLE_BEAD, []) is None
+    with pytest.raises(ValueError, match="Unknown backend"):
+        StudySnapshot(single_bead_study.file_name, "sqlite")
+
+
+@pytest.mark.parametrize("backend", ["duckdb", "polars"])
+def test_query_window_rounds_like_slice_index(single_bead_study, tmp_path, backend):
+    pytest.importorskip(backend)
+    pytest.importorskip("pyarrow")
+    df = single_bead_study.data_frame()
+    # Values half way between two decimals are rounded to the even one.
+    df[ColumnNames.MELT_POOL_DEPTH] = 0.125
+    file_name = tmp_path / "study.ps"
+    _sidecar._write(file_name, (0, 0), df)
+    query = _query._query(
+        backend,
+        _sidecar._sidecar_path(file_name),
+        SimulationType.SINGLE_BEAD,
+        SimulationStatus.COMPLETED,
+        _COLUMNS,
+    )
+
+    window = query.window([ColumnNames.LASER_POWER], ColumnNames.MELT_POOL_DEPTH, (0.13, 1.0))
+
+    assert window["count"].sum() > 0
+    assert window["inside"].sum() == 0 == (np.round(0.125, 2) >= 0.13)
@@ -0,0 +1,56 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import plotly.graph_objects as go
+
+from ansys.additive.widgets.display._scatter import _scatter
+
+
+def test_small_layers_are_svg_with_client_side_labels():
+    trace = _scatter([1, 2], [3, 4], [0.5, 0.25], "%{customdata:.2f}", cliponaxis=False)
+
+    assert isinstance(trace, go.Scatter)
+    assert trace.mode == "markers+text"
+    assert trace.texttemplate == "%{customdata:.2f}"
+    assert list(trace.customdata) == [0.5, 0.25]
+    assert trace.text is None
+    assert trace.cliponaxis is False
+
+
+def test_large_layers_are_webgl_without_labels():
+    x = np.arange(2000.0)
+
+    trace = _scatter(x, x, x, "%{customdata:.2f}", cliponaxis=False)
+
+    assert isinstance(trace, go.Scattergl)
+    assert trace.mode == "markers"
+    assert trace.texttemplate is None
+
+
+def test_webgl_and_labels_can_be_chosen():
+    x = np.arange(10.0)
+
+    assert isinstance(_scatter(x, x, x, "%{customdata}", webgl=True), go.Scattergl)
+    assert _scatter(x, x, x, "%{customdata}", webgl=True).mode == "markers+text"
+    assert isinstance(_scatter(x, x, x, "%{customdata}", webgl=False, max_labels=5), go.Scatter)
+    assert _scatter(x, x, x, "%{customdata}", max_labels=5).mode == "markers"
@@ -0,0 +1,88 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import panel as pn
+
+from ansys.additive.widgets import serve
+from ansys.additive.widgets.display import StudySnapshot, figure_cache
+
+
+def test_server_serves_each_study_file_with_its_plots(single_bead_study, porosity_study):
+    server = serve.serve(
+        [single_bead_study.file_name, porosity_study.file_name], port=0, start=False
+    )
+    try:
+        routes = set(server._tornado.applications)
+    finally:
+        server.stop()
+
+    assert {"/single-bead-study", "/porosity-study"} <= routes
+
+
+def test_sessions_reuse_the_warmed_figures(single_bead_study):
+    snapshot = StudySnapshot(single_bead_study.file_name)
+
+    plots = serve._warm(snapshot, list(serve.PLOTS))
+    misses = figure_cache.misses
+    app = serve._app(snapshot, plots, None)()
+
+    # The study has no porosity or microstructure simulations.
+    assert plots == ["single_bead_eval_plot"]
+    assert isinstance(app, pn.Tabs)
+    assert app._names == ["Simulations", "Single Bead"]
+    assert figure_cache.misses == misses
+    assert not snapshot.loaded
+
+
+def test_warming_creates_no_widgets_and_covers_every_plot(porosity_study):
+    snapshot = StudySnapshot(porosity_study.file_name)
+
+    plots = serve._warm(snapshot, list(serve.PLOTS))
+    assert snapshot.param.watchers == {}
+    misses = figure_cache.misses
+    serve._app(snapshot, plots, None)()
+
+    assert plots == ["porosity_eval_plot", "porosity_contour_plot"]
+    assert figure_cache.misses == misses
+
+
+def test_main_passes_options_to_the_server(monkeypatch):
+    calls = []
+    monkeypatch.setattr(serve, "serve", lambda studies, **kwargs: calls.append((studies, kwargs)))
+
+    assert serve.main(["a.ps", "b.ps", "--port", "8000", "--plot", "porosity_eval_plot"]) == 0
+
+    ((studies, kwargs),) = calls
+    assert studies == ["a.ps", "b.ps"]
+    assert kwargs["port"] == 8000
+    assert kwargs["plots"] == ["porosity_eval_plot"]
+    assert kwargs["backend"] == "pandas"
+    assert kwargs["metrics_port"] is None
+
+
+def test_main_reads_metrics_port_from_environment(monkeypatch):
+    calls = []
+    monkeypatch.setattr(serve, "serve", lambda studies, **kwargs: calls.append(kwargs))
+    monkeypatch.setenv("ANSYS_ADDITIVE_WIDGETS_METRICS_PORT", "9464")
+
+    serve.main(["a.ps"])
+
+    assert calls[0]["metrics_port"] == 9464
@@ -0,0 +1,188 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import gc
+from types import SimpleNamespace
+
+from ansys.additive.core import SimulationStatus
+from ansys.additive.core.parametric_study import ColumnNames
+import panel as pn
+
+from ansys.additive.widgets.display import StudySnapshot, show_table
+
+
+def __table(col: pn.Column) -> pn.widgets.Tabulator:
+    return next(iter(col.select(pn.widgets.Tabulator)))
+
+
+def __status_select(col: pn.Column) -> pn.widgets.MultiSelect:
+    return next(w for w in col.select(pn.widgets.MultiSelect) if w.name == "Status")
+
+
+def test_remote_pagination_sends_only_visible_page(single_bead_study):
+    col = show_table(single_bead_study, page_size=5)
+    table = __table(col)
+    root = col.get_root()
+    model = table._models[root.ref["id"]][0]
+
+    assert len(table.value) == len(single_bead_study.data_frame())
+    assert len(model.source.data[ColumnNames.ID]) == 5
+
+
+def test_remote_pagination_filters_on_server(single_bead_study):
+    col = show_table(single_bead_study, page_size=100)
+    table = __table(col)
+    root = col.get_root()
+    model = table._models[root.ref["id"]][0]
+
+    __status_select(col).value = [SimulationStatus.COMPLETED]
+
+    df = single_bead_study.data_frame()
+    completed = df[df[ColumnNames.STATUS] == SimulationStatus.COMPLETED]
+    assert 0 < len(completed) < len(df)
+    assert model.source.data[ColumnNames.ID].tolist() == completed[ColumnNames.ID].tolist()
+
+
+def test_local_pagination_sends_whole_study(single_bead_study):
+    col = show_table(single_bead_study, page_size=5, pagination="local")
+    table = __table(col)
+    root = col.get_root()
+    model = table._models[root.ref["id"]][0]
+
+    assert len(model.source.data[ColumnNames.ID]) == len(single_bead_study.data_frame())
+
+
+def __button(col: pn.Column, name: str) -> pn.widgets.Button:
+    return next(w for w in col.select(pn.widgets.Button) if w.name == name)
+
+
+def test_bulk_edit_sets_status_of_selected_rows(single_bead_study):
+    before = single_bead_study.data_frame()
+    col = show_table(single_bead_study)
+    table = __table(col)
+    table.selection = [0, 2, 3]
+    ids = table.value[ColumnNames.ID].iloc[[0, 2, 3]].tolist()
+
+    next(
+        w for w in col.select(pn.widgets.Select) if w.name == "New value"
+    ).value = SimulationStatus.SKIP
+    __button(col, "Apply to selected rows").clicks += 1
+
+    df = single_bead_study.data_frame()
+    edited = df[ColumnNames.ID].isin(ids)
+    assert (df.loc[edited, ColumnNames.STATUS] == SimulationStatus.SKIP).all()
+    assert df.loc[~edited, ColumnNames.STATUS].equals(before.loc[~edited, ColumnNames.STATUS])
+    edited = table.value[ColumnNames.ID].isin(ids)
+    assert (table.value.loc[edited, ColumnNames.STATUS] == SimulationStatus.SKIP).all()
+
+
+def test_bulk_edit_sets_priority_of_filtered_rows(single_bead_study):
+    before = single_bead_study.data_frame()
+    col = show_table(single_bead_study)
+    table = __table(col)
+    __status_select(col).value = [SimulationStatus.COMPLETED]
+    ids = table.current_view[ColumnNames.ID].tolist()
+
+    next(
+        w for w in col.select(pn.widgets.Select) if w.name == "Edit column"
+    ).value = ColumnNames.PRIORITY
+    next(iter(col.select(pn.widgets.IntInput))).value = 42
+    __button(col, "Apply to filtered rows").clicks += 1
+
+    df = single_bead_study.data_frame()
+    edited = df[ColumnNames.ID].isin(ids)
+    assert (df.loc[edited, ColumnNames.PRIORITY] == 42).all()
+    assert df.loc[~edited, ColumnNames.PRIORITY].equals(before.loc[~edited, ColumnNames.PRIORITY])
+    assert 42 in next(w for w in col.select(pn.widgets.MultiSelect) if w.name == "Priority").value
+    assert table.current_view[ColumnNames.ID].tolist() == ids
+
+
+def test_cell_edit_to_error_clears_error_message(single_bead_study):
+    col = show_table(single_bead_study)
+    table = __table(col)
+    table.value.loc[table.value.index[1], ColumnNames.ERROR_MESSAGE] = "failed"
+    id = table.value[ColumnNames.ID].iloc[1]
+
+    # The table applies the edit to its data frame before calling back.
+    table.value.loc[table.value.index[1], ColumnNames.STATUS] = SimulationStatus.ERROR
+    event = SimpleNamespace(row=1, column=ColumnNames.STATUS, value=SimulationStatus.ERROR)
+    for callback in table._on_edit_callbacks:
+        callback(event)
+
+    df = single_bead_study.data_frame()
+    assert df.loc[df[ColumnNames.ID] == id, ColumnNames.STATUS].tolist() == [SimulationStatus.ERROR]
+    assert table.value[ColumnNames.ERROR_MESSAGE].iloc[1] == ""
+
+
+def test_tables_of_same_study_keep_their_own_controls(single_bead_study):
+    first = show_table(single_bead_study)
+    second = show_table(single_bead_study)
+    assert __table(first).value is not __table(second).value
+
+    __table(first).selection = [0]
+    next(
+        w for w in first.select(pn.widgets.Select) if w.name == "Edit column"
+    ).value = ColumnNames.PRIORITY
+    next(iter(first.select(pn.widgets.IntInput))).value = 42
+    __button(first, "Apply to selected rows").clicks += 1
+
+    def priorities(col):
+        return next(w for w in col.select(pn.widgets.MultiSelect) if w.name == "Priority").options
+
+    assert 42 in priorities(first)
+    assert 42 not in priorities(second)
+    assert single_bead_study.data_frame()[ColumnNames.PRIORITY].iloc[0] == 42
+
+
+def test_live_table_merges_changes_and_keeps_filters(single_bead_study):
+    snapshot = StudySnapshot(single_bead_study)
+    col = show_table(snapshot, page_size=100, poll_period=60)
+    table = __table(col)
+    root = col.get_root()
+    model = table._models[root.ref["id"]][0]
+    __status_select(col).value = [SimulationStatus.PENDING]
+    ids = single_bead_study.data_frame()[ColumnNames.ID].tolist()
+
+    single_bead_study.set_simulation_status(ids[0], SimulationStatus.PENDING)
+    single_bead_study.generate_single_bead_permutations(
+        [100], [1.0], layer_thicknesses=[30e-6], heater_temperatures=[95], iteration=4
+    )
+    new_id = next(i for i in single_bead_study.data_frame()[ColumnNames.ID] if i not in ids)
+    single_bead_study.set_simulation_status(new_id, SimulationStatus.PENDING)
+    snapshot.poll()
+
+    assert len(table.value) == len(ids) + 1
+    assert __status_select(col).value == [SimulationStatus.PENDING]
+    assert model.source.data[ColumnNames.ID].tolist() == [ids[0], new_id]
+    iterations = next(w for w in col.select(pn.widgets.MultiSelect) if w.name == "Iteration")
+    assert 4 in iterations.options and 4 in iterations.value
+
+
+def test_live_table_stops_following_when_dropped(single_bead_study):
+    snapshot = StudySnapshot(single_bead_study)
+    col = show_table(snapshot, poll_period=60)
+    assert len(snapshot.param.watchers["version"]["value"]) == 1
+
+    del col
+    gc.collect()
+
+    assert snapshot.param.watchers.get("version", {}).get("value", []) == []
@@ -0,0 +1,122 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import panel as pn
+import param
+
+from ansys.additive.widgets.display import single_bead_eval_plot
+
+
+def __widget(plot: pn.Row, type: type, name: str):
+    return next(w for w in plot.select(type) if w.name == name)
+
+
+def test_plots_of_same_study_keep_their_own_controls(single_bead_study):
+    first = single_bead_eval_plot(single_bead_study)
+    second = single_bead_eval_plot(single_bead_study)
+    first_range = __widget(first, pn.widgets.RangeSlider, "Range")
+    second_range = __widget(second, pn.widgets.RangeSlider, "Range")
+    initial = second_range.value
+
+    __widget(
+        first, pn.widgets.Select, "Melt Pool Parameter of Interest"
+    ).value = ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH
+
+    df = single_bead_study.data_frame()
+    range_end = 0.1 + df[ColumnNames.MELT_POOL_LENGTH_OVER_WIDTH].max()
+    assert first_range.end == range_end
+    assert first_range.value == (0.375 * range_end, 0.75 * range_end)
+    assert second_range.value == initial
+    assert "Length/Width" in first[1].object.layout.title.text
+    assert "Ref Depth" in second[1].object.layout.title.text
+
+
+def test_plot_can_draw_points_with_webgl(single_bead_study):
+    plot = single_bead_eval_plot(single_bead_study, webgl=True, max_labels=0)
+
+    scatter = plot[1].object.data[1]
+    assert scatter.type == "scattergl"
+    assert scatter.mode == "markers"
+
+
+def test_plot_keeps_point_data_as_arrays(single_bead_study):
+    plot = single_bead_eval_plot(single_bead_study)
+
+    # NumPy arrays are sent to the browser as binary buffers instead of JSON lists.
+    scatter = plot[1].object.data[1]
+    assert isinstance(scatter.x, np.ndarray) and scatter.x.dtype == np.float64
+    assert isinstance(scatter.y, np.ndarray) and isinstance(scatter.customdata, np.ndarray)
+
+
+def test_moving_the_range_only_updates_the_heatmap(single_bead_study):
+    plot = single_bead_eval_plot(single_bead_study)
+    range_slider = __widget(plot, pn.widgets.RangeSlider, "Range")
+    fig = plot[1].object
+    scatter, z = fig.data[1], fig.data[0].z
+    messages = []
+    fig._send_update_msg = lambda restyle_data, relayout_data, trace_indexes=None, **_: (
+        messages.append((list(restyle_data), relayout_data, trace_indexes))
+    )
+
+    range_slider.value = (0, 0.01)
+
+    assert plot[1].object is fig and fig.data[1] is scatter
+    assert messages == [(["z"], {}, [0])]
+    assert not np.array_equal(fig.data[0].z, z, equal_nan=True)
+
+
+def test_facets_share_axes_and_color_scale(single_bead_study):
+    plot = single_bead_eval_plot(single_bead_study)
+    range_slider = __widget(plot, pn.widgets.RangeSlider, "Range")
+    lt_select = __widget(plot, pn.widgets.Select, "Layer Thickness")
+
+    __widget(plot, pn.widgets.Select, "Facet Rows").value = ColumnNames.LAYER_THICKNESS
+    fig = plot[1].object
+    heatmaps = fig.data[::2]
+
+    assert len(heatmaps) == len(lt_select.options)
+    assert [a.text for a in fig.layout.annotations] == [
+        f"Layer Thickness: {label}" for label in lt_select.options
+    ]
+    assert len({trace.yaxis for trace in heatmaps}) == len(heatmaps)
+    assert fig.layout.yaxis2.matches == "y"
+    assert all(np.array_equal(trace.x, heatmaps[0].x) for trace in heatmaps)
+    assert len({(trace.zmin, trace.zmax) for trace in heatmaps}) == 1
+
+    with param.edit_constant(range_slider):
+        range_slider.value_throttled = (0, 0.01)
+
+    assert plot[1].object is fig
+    assert len({(trace.zmin, trace.zmax) for trace in fig.data[::2]}) == 1
+
+
+def test_setting_range_in_python_updates_plot(single_bead_study):
+    plot = single_bead_eval_plot(single_bead_study)
+    range_slider = __widget(plot, pn.widgets.RangeSlider, "Range")
+    before = np.array(plot[1].object.data[0].z, dtype=float)
+
+    range_slider.value = (0.0, 0.01)
+
+    assert range_slider.value_throttled == (0.0, 0.01)
+    assert not np.array_equal(plot[1].object.data[0].z, before, equal_nan=True)
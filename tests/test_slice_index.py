@@ -0,0 +1,173 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import pandas as pd
+
+from ansys.additive.widgets.display._slice_index import _SliceIndex
+
+
+def test_slice_index_returns_matching_rows():
+    df = pd.DataFrame(
+        {
+            ColumnNames.HEATER_TEMPERATURE: [80, 80, 100, 80],
+            ColumnNames.LAYER_THICKNESS: [40e-6, 50e-6, 40e-6, 40e-6],
+            ColumnNames.LASER_POWER: [50, 100, 150, 200],
+        },
+        index=[10, 11, 12, 13],
+    )
+    columns = [ColumnNames.HEATER_TEMPERATURE, ColumnNames.LAYER_THICKNESS]
+
+    index = _SliceIndex(df, columns)
+
+    assert index.rows(80, 40e-6).tolist() == [0, 3]
+    assert index.take(80.0, 40e-6).index.tolist() == [10, 13]
+    assert index.take(100, 40e-6, columns=[ColumnNames.LASER_POWER]).to_dict("list") == {
+        ColumnNames.LASER_POWER: [150]
+    }
+    assert len(index.take(100, 50e-6)) == 0
+
+
+def test_slice_index_matches_missing_values():
+    df = pd.DataFrame(
+        {
+            ColumnNames.HEATER_TEMPERATURE: [80, 80],
+            ColumnNames.START_ANGLE: [None, 45],
+        },
+        dtype=object,
+    )
+    columns = [ColumnNames.HEATER_TEMPERATURE, ColumnNames.START_ANGLE]
+
+    index = _SliceIndex(df, columns)
+
+    assert index.rows(80, np.nan).tolist() == [0]
+    assert index.rows(80, None).tolist() == [0]
+    assert index.rows(80, 45).tolist() == [1]
+
+
+def test_slice_index_of_empty_data_frame():
+    df = pd.DataFrame(columns=[ColumnNames.HEATER_TEMPERATURE])
+
+    index = _SliceIndex(df, [ColumnNames.HEATER_TEMPERATURE])
+
+    assert len(index.take(80)) == 0
+
+
+def test_slice_index_options_cascade_in_order():
+    ht, lt, bd = (
+        ColumnNames.HEATER_TEMPERATURE,
+        ColumnNames.LAYER_THICKNESS,
+        ColumnNames.BEAM_DIAMETER,
+    )
+    df = pd.DataFrame(
+        {
+            ht: [80, 80, 100, 100, 120],
+            lt: [40e-6, 50e-6, 40e-6, 40e-6, 60e-6],
+            bd: [80e-6, 90e-6, 80e-6, 100e-6, 80e-6],
+        }
+    )
+    index = _SliceIndex(df, [ht, lt, bd])
+
+    options, values = index.options({ht: 100, lt: 50e-6, bd: 90e-6}, [ht, lt, bd])
+
+    assert options[ht].tolist() == [80, 100, 120]
+    assert options[lt].tolist() == [40e-6]
+    assert options[bd].tolist() == [80e-6, 100e-6]
+    assert values == {ht: 100, lt: 40e-6, bd: 80e-6}
+    assert len(index.rows(*values.values())) == 1
+
+    options, values = index.options({lt: 60e-6}, [lt, ht, bd])
+
+    assert options[lt].tolist() == [40e-6, 50e-6, 60e-6]
+    assert options[ht].tolist() == [120]
+    assert values == {lt: 60e-6, ht: 120, bd: 80e-6}
+
+
+def test_slice_index_options_of_empty_data_frame():
+    df = pd.DataFrame(columns=[ColumnNames.HEATER_TEMPERATURE])
+    index = _SliceIndex(df, [ColumnNames.HEATER_TEMPERATURE])
+
+    options, values = index.options({})
+
+    assert len(options[ColumnNames.HEATER_TEMPERATURE]) == 0
+    assert values == {ColumnNames.HEATER_TEMPERATURE: None}
+
+
+def test_slice_index_matches_values_within_tolerance():
+    df = pd.DataFrame(
+        {
+            ColumnNames.HEATER_TEMPERATURE: [80, 80.0000000001, 100],
+            ColumnNames.LAYER_THICKNESS: [40e-6, 4e-05 * (1 + 1e-12), 40e-6],
+        }
+    )
+    index = _SliceIndex(df, [ColumnNames.HEATER_TEMPERATURE, ColumnNames.LAYER_THICKNESS])
+
+    assert index.rows(80, 40e-6).tolist() == [0, 1]
+    assert index.rows(80.00000000005, 4e-05).tolist() == [0, 1]
+    assert index.levels(ColumnNames.HEATER_TEMPERATURE).tolist() == [80, 100]
+    assert len(index.combinations) == 2
+
+
+def test_slice_index_window_counts_values_of_every_slice():
+    df = pd.DataFrame(
+        {
+            ColumnNames.HEATER_TEMPERATURE: [80, 100, 80, 80.0000000001, 100, 120],
+            ColumnNames.RELATIVE_DENSITY: [0.9, 0.5, 0.996, np.nan, 0.95, np.nan],
+        }
+    )
+    index = _SliceIndex(df, [ColumnNames.HEATER_TEMPERATURE])
+
+    counts, inside, best = index.window(ColumnNames.RELATIVE_DENSITY, (0.9, 0.99))
+
+    assert counts.tolist() == [3, 2, 1]
+    # 0.996 rounds to 1.0, outside the range.
+    assert inside.tolist() == [1, 1, 0]
+    np.testing.assert_array_equal(best, [0.996, 0.95, np.nan])
+    assert index.positions(df.iloc[[5, 3, 1]]).tolist() == [2, 0, 1]
+    assert index.positions(pd.DataFrame({ColumnNames.HEATER_TEMPERATURE: [90]})).tolist() == [-1]
+
+
+def test_slice_index_facets_vary_some_columns():
+    ht, lt, bd = (
+        ColumnNames.HEATER_TEMPERATURE,
+        ColumnNames.LAYER_THICKNESS,
+        ColumnNames.BEAM_DIAMETER,
+    )
+    df = pd.DataFrame(
+        {
+            ht: [80, 80, 100, 100, 120, 80],
+            lt: [40e-6, 50e-6, 40e-6, 50e-6, 40e-6, 40e-6],
+            bd: [80e-6, 80e-6, 80e-6, 80e-6, 80e-6, 90e-6],
+            ColumnNames.LASER_POWER: [50, 100, 150, 200, 250, 300],
+        }
+    )
+    index = _SliceIndex(df, [ht, lt, bd])
+
+    (hts, lts), grid = index.facets((80, 40e-6, 80e-6), [ht, lt])
+    rows, labels = index.take_slices(grid[grid >= 0], columns=[ColumnNames.LASER_POWER])
+
+    assert hts.tolist() == [80, 100, 120]
+    assert lts.tolist() == [40e-6, 50e-6]
+    assert (grid >= 0).tolist() == [[True, True], [True, True], [True, False]]
+    assert rows[ColumnNames.LASER_POWER].tolist() == [50, 100, 150, 200, 250]
+    assert labels.tolist() == [0, 1, 2, 3, 4]
@@ -0,0 +1,208 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+import pathlib
+import threading
+
+from ansys.additive.core import SimulationStatus, SimulationType
+from ansys.additive.core.parametric_study import ColumnNames
+import numpy as np
+import pandas as pd
+import pytest
+
+from ansys.additive.widgets.display import StudySnapshot, _sidecar, figure_cache
+
+
+def __assert_same_simulations(df: pd.DataFrame, study_df: pd.DataFrame):
+    # Sidecar files read columns of numbers as numeric columns, and missing values as NaN.
+    pd.testing.assert_frame_equal(df, study_df.mask(study_df.isna(), np.nan), check_dtype=False)
+
+
+def test_of_returns_shared_snapshot(porosity_study):
+    snapshot = StudySnapshot.of(porosity_study)
+
+    assert StudySnapshot.of(porosity_study) is snapshot
+    assert StudySnapshot.of(snapshot) is snapshot
+    assert snapshot.study is porosity_study
+
+
+def test_simulations_are_filtered_projected_and_cached(single_bead_study):
+    snapshot = StudySnapshot(single_bead_study)
+    columns = [ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED]
+
+    df = snapshot.simulations(SimulationType.SINGLE_BEAD, columns)
+
+    study_df = single_bead_study.data_frame()
+    expected = study_df[
+        (study_df[ColumnNames.TYPE] == SimulationType.SINGLE_BEAD)
+        & (study_df[ColumnNames.STATUS] == SimulationStatus.COMPLETED)
+    ]
+    assert list(df.columns) == columns
+    assert df.index.tolist() == expected.index.tolist()
+    assert snapshot.simulations(SimulationType.SINGLE_BEAD, columns) is df
+    assert snapshot.data_frame() is snapshot.data_frame()
+
+
+def test_edit_updates_study_and_snapshot_and_notifies(porosity_study):
+    snapshot = StudySnapshot(porosity_study)
+    df = snapshot.data_frame()
+    cached = snapshot.cached("value", object)
+    figure_cache.put((snapshot.key, "plot"), "figure")
+    old_key = snapshot.key
+    versions = []
+    snapshot.param.watch(lambda event: versions.append(event.new), "version")
+    id = df[ColumnNames.ID].iloc[0]
+
+    snapshot.set_priority(id, 5)
+
+    assert versions == [1]
+    assert snapshot.data_frame()[ColumnNames.PRIORITY].iloc[0] == 5
+    assert df[ColumnNames.PRIORITY].iloc[0] != 5
+    study_df = porosity_study.data_frame()
+    assert study_df.loc[study_df[ColumnNames.ID] == id, ColumnNames.PRIORITY].tolist() == [5]
+    assert snapshot.cached("value", object) is not cached
+    assert (old_key, "plot") not in figure_cache
+
+
+def test_refresh_picks_up_changes_to_study(porosity_study):
+    snapshot = StudySnapshot(porosity_study)
+    df = snapshot.data_frame()
+
+    assert not snapshot.refresh()
+    assert snapshot.version == 0
+
+    porosity_study.set_iteration(df[ColumnNames.ID].iloc[0], 7)
+
+    assert snapshot.refresh()
+    assert snapshot.version == 1
+    assert snapshot.data_frame()[ColumnNames.ITERATION].iloc[0] == 7
+
+
+def test_poll_reports_rows_changed_in_study_file(single_bead_study):
+    snapshot = StudySnapshot(single_bead_study)
+    ids = snapshot.data_frame()[ColumnNames.ID].tolist()
+
+    assert not snapshot.poll()
+
+    single_bead_study.set_priority(ids[:2], 9)
+    single_bead_study.remove(ids[2])
+    single_bead_study.generate_single_bead_permutations(
+        [100], [1.0], layer_thicknesses=[30e-6], heater_temperatures=[95], beam_diameters=[8e-5]
+    )
+
+    assert snapshot.poll()
+    assert snapshot.version == 1
+    changes = snapshot.changes
+    assert len(changes.added) == 1
+    assert sorted(changes.changed[ColumnNames.ID]) == sorted(ids[:2])
+    assert changes.changed[ColumnNames.PRIORITY].tolist() == [9, 9]
+    assert changes.removed == [ids[2]]
+    assert not snapshot.poll()
+
+
+def test_edit_reports_changed_rows(porosity_study):
+    snapshot = StudySnapshot(porosity_study)
+    id = snapshot.data_frame()[ColumnNames.ID].iloc[0]
+
+    snapshot.set_iteration(id, 3)
+
+    assert snapshot.changes.added.empty
+    assert snapshot.changes.changed[ColumnNames.ID].tolist() == [id]
+    assert snapshot.changes.removed == []
+
+
+def test_snapshot_of_study_file_reads_sidecar(single_bead_study, monkeypatch):
+    pytest.importorskip("pyarrow")
+    file_name = single_bead_study.file_name
+    columns = [ColumnNames.LASER_POWER, ColumnNames.SCAN_SPEED]
+
+    snapshot = StudySnapshot(file_name)
+    __assert_same_simulations(snapshot.data_frame(), single_bead_study.data_frame())
+    assert _sidecar._sidecar_path(file_name).is_file()
+    assert not snapshot.loaded
+
+    # Reopening the study file only reads the sidecar file.
+    monkeypatch.setattr(_sidecar, "_read_study", None)
+    df = StudySnapshot(file_name).simulations(SimulationType.SINGLE_BEAD, columns)
+    expected = StudySnapshot(single_bead_study).simulations(SimulationType.SINGLE_BEAD, columns)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+
+def test_snapshot_of_study_file_follows_study_file(single_bead_study):
+    pytest.importorskip("pyarrow")
+    snapshot = StudySnapshot(single_bead_study.file_name)
+    ids = snapshot.simulations(SimulationType.SINGLE_BEAD, [ColumnNames.ID])[ColumnNames.ID]
+
+    single_bead_study.set_simulation_status(ids.iloc[0], SimulationStatus.SKIP)
+
+    assert snapshot.poll()
+    df = StudySnapshot(single_bead_study.file_name).data_frame()
+    __assert_same_simulations(df, single_bead_study.data_frame())
+    assert df.loc[df[ColumnNames.ID] == ids.iloc[0], ColumnNames.STATUS].item() == "Skip"
+
+
+def test_edit_loads_study_of_study_file(single_bead_study):
+    snapshot = StudySnapshot(single_bead_study.file_name)
+    id = snapshot.data_frame()[ColumnNames.ID].iloc[0]
+
+    snapshot.set_priority(id, 7)
+
+    assert snapshot.loaded
+    study_df = snapshot.study.data_frame()
+    assert study_df.loc[study_df[ColumnNames.ID] == id, ColumnNames.PRIORITY].item() == 7
+    assert snapshot.changes.changed[ColumnNames.ID].tolist() == [id]
+
+
+def test_key_holds_plain_values(porosity_study):
+    first, second = StudySnapshot(porosity_study), StudySnapshot(porosity_study)
+
+    assert all(isinstance(value, int) for value in first.key)
+    assert first.key != second.key
+
+
+def test_watchers_run_without_the_lock(porosity_study):
+    snapshot = StudySnapshot(porosity_study)
+    id = snapshot.data_frame()[ColumnNames.ID].iloc[0]
+    finished = []
+
+    def read(event):
+        # Another thread must be able to read the snapshot while watchers run.
+        thread = threading.Thread(target=lambda: finished.append(snapshot.data_frame()))
+        thread.start()
+        thread.join(timeout=5)
+
+    snapshot.param.watch(read, "version")
+    snapshot.set_priority(id, 5)
+
+    assert len(finished) == 1
+    assert finished[0][ColumnNames.PRIORITY].iloc[0] == 5
+
+
+def test_studies_read_in_threads_keep_pathlib_intact(single_bead_study):
+    classes = (pathlib.PosixPath, pathlib.WindowsPath)
+
+    with ThreadPoolExecutor(4) as executor:
+        studies = list(executor.map(_sidecar._read_study, [single_bead_study.file_name] * 8))
+
+    assert all(len(s.data_frame()) == len(single_bead_study.data_frame()) for s in studies)
+    assert (pathlib.PosixPath, pathlib.WindowsPath) == classes